@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+"""
+Bash completion check for Task Manager
+
+Sources the script printed by `task-cli completion bash` in a real bash
+against a throwaway store, runs the completion function for a few
+command lines and checks COMPREPLY:
+
+- command names:  task-cli co<TAB>, task-cli l<TAB>
+- task IDs:       task-cli complete <TAB> (active tasks only)
+- categories:     task-cli add x -c <TAB> (including one with a space)
+
+The time each completion takes is reported too, since every TAB runs
+`task-cli __complete`. Exits with status 1 if any completion is wrong.
+
+Usage: python benchmarks/completion_check.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+PACKAGE_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# (command line words, expected COMPREPLY)
+CASES = [
+    (["task-cli", "co"], ["complete", "completion", "count"]),
+    (["task-cli", "l"], ["list"]),
+    (["task-cli", "complete", ""], ["1", "3"]),
+    (["task-cli", "add", "x", "-c", ""], ["Home chores", "Work"]),
+    (["task-cli", "add", "x", "-c", "W"], ["Work"]),
+]
+
+def task_cli(args, env):
+    subprocess.run([sys.executable, "-m", "task_manager.main"] + args, cwd=PACKAGE_ROOT,
+                   env=env, stdout=subprocess.DEVNULL, check=True)
+
+def make_store(home, env):
+    """Create a few tasks and a task-cli wrapper on PATH for the script to call"""
+    task_cli(["add", "Write report", "-c", "Work"], env)
+    task_cli(["add", "Water plants", "-c", "Home chores"], env)
+    task_cli(["add", "Book flights"], env)
+    task_cli(["complete", "2"], env)
+
+    bin_dir = os.path.join(home, "bin")
+    os.makedirs(bin_dir)
+    wrapper = os.path.join(bin_dir, "task-cli")
+    with open(wrapper, "w") as f:
+        f.write(f'#!/bin/sh\ncd "{PACKAGE_ROOT}" && exec "{sys.executable}" -m task_manager.main "$@"\n')
+    os.chmod(wrapper, 0o755)
+    return bin_dir
+
+def complete(words, script, env):
+    """Run the bash completion function for words; returns (COMPREPLY, seconds)"""
+    quoted = " ".join("'" + word.replace("'", "'\\''") + "'" for word in words)
+    program = (script + "\n"
+               f"COMP_WORDS=({quoted}); COMP_CWORD={len(words) - 1}\n"
+               "_task_cli_complete\n"
+               "printf '%s\\n' \"${COMPREPLY[@]}\"\n")
+    started = time.perf_counter()
+    result = subprocess.run(["bash", "--norc", "--noprofile", "-c", program], env=env,
+                            stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    elapsed = time.perf_counter() - started
+    return [line for line in result.stdout.split("\n") if line], elapsed
+
+def main():
+    if shutil.which("bash") is None:
+        print("bash not found; nothing to check")
+        return
+
+    # Keep the run away from the user's tasks and settings
+    home = tempfile.mkdtemp(prefix="task-completion-check-")
+    try:
+        env = dict(os.environ, HOME=home, APPDATA=home, TASK_CLI_NO_DAEMON="1")
+        env["PATH"] = make_store(home, env) + os.pathsep + env.get("PATH", "")
+        script = subprocess.run([sys.executable, "-m", "task_manager.main", "completion", "bash"],
+                                cwd=PACKAGE_ROOT, env=env, stdout=subprocess.PIPE,
+                                universal_newlines=True, check=True).stdout
+
+        failed = False
+        for words, expected in CASES:
+            got, elapsed = complete(words, script, env)
+            ok = sorted(got) == sorted(expected)
+            failed = failed or not ok
+            line = " ".join(words) + "<TAB>"
+            print(f"{'ok  ' if ok else 'FAIL'} {line:32} {elapsed * 1000:7.1f} ms  {got}")
+            if not ok:
+                print(f"     expected {expected}")
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
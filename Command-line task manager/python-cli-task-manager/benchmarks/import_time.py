@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+"""
+Import time regression check for Task Manager
+
+Runs `task-cli list` (python -X importtime -m task_manager.main list) in a
+subprocess against a throwaway store and parses the import timings it
+writes to stderr. The CLI paths must not load the GUI, so the run fails
+if tkinter or a GUI module is imported, and, with --max-ms, if the
+task_manager imports take longer than the budget.
+
+Reported per run (the fastest of COUNT runs is used, to reduce noise):
+
+- cumulative import time of task_manager modules
+- cumulative import time of everything imported after start-up
+- the slowest top-level imports
+
+Usage: python benchmarks/import_time.py [-n COUNT] [--max-ms MS] [-- ARGS...]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+PACKAGE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Modules the CLI paths must never import
+FORBIDDEN_MODULES = ("tkinter", "_tkinter", "task_manager.gui", "task_manager.gui_parts",
+                     "task_manager.ai_interface")
+
+def parse_importtime(stderr):
+    """Return [(module, self us, cumulative us, depth)] from -X importtime output"""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # The header line
+        name = fields[2]
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), self_us, cumulative_us, depth))
+    return imports
+
+def run_once(command_args, home):
+    """Run task-cli once with -X importtime; returns the parsed imports"""
+    env = dict(os.environ, HOME=home, APPDATA=home, TASK_CLI_NO_DAEMON="1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "task_manager.main"] + command_args,
+        cwd=PACKAGE_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"task-cli {' '.join(command_args)} exited with {result.returncode}:\n"
+                           + result.stderr[-2000:])
+    return parse_importtime(result.stderr)
+
+def summarize(imports):
+    top_level = [entry for entry in imports if entry[3] == 0]
+    return {
+        "task_manager_ms": sum(cumulative for name, _, cumulative, _ in top_level
+                               if name == "task_manager" or name.startswith("task_manager.")) / 1000,
+        "total_ms": sum(cumulative for _, _, cumulative, _ in top_level) / 1000,
+        "slowest": sorted(top_level, key=lambda entry: entry[2], reverse=True)[:8],
+        "forbidden": sorted({name for name, _, _, _ in imports
+                             if name in FORBIDDEN_MODULES
+                             or name.startswith(tuple(module + "." for module in FORBIDDEN_MODULES))}),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of a task-cli command")
+    parser.add_argument("-n", "--count", type=int, default=5, help="Runs; the fastest is reported")
+    parser.add_argument("--max-ms", type=float, metavar="MS",
+                        help="Exit with status 1 if task_manager imports take longer than this")
+    parser.add_argument("command", nargs="*", default=["list"],
+                        help="task-cli arguments to run (default: list)")
+    args = parser.parse_args()
+
+    # Keep the run away from the user's tasks and settings
+    home = tempfile.mkdtemp(prefix="task-import-bench-")
+    try:
+        # The first run creates the store and settings; don't count it
+        run_once(args.command, home)
+        results = [summarize(run_once(args.command, home)) for _ in range(max(args.count, 1))]
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    best = min(results, key=lambda result: result["task_manager_ms"])
+    print(f"Command:               task-cli {' '.join(args.command)}")
+    print(f"task_manager imports:  {best['task_manager_ms']:.1f} ms (fastest of {len(results)})")
+    print(f"All imports:           {best['total_ms']:.1f} ms")
+    print("Slowest top-level imports:")
+    for name, _, cumulative, _ in best["slowest"]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    forbidden = sorted({name for result in results for name in result["forbidden"]})
+    if forbidden:
+        print(f"GUI modules imported: {', '.join(forbidden)}")
+        failed = True
+    if args.max_ms is not None and best["task_manager_ms"] > args.max_ms:
+        print(f"task_manager imports above {args.max_ms} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
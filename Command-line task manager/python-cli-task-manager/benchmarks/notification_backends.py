@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+"""
+Notification backend benchmark for Task Manager
+
+Measures notifications per second for each Linux notification backend
+against local stand-ins, so no real desktop notifications are shown:
+
+- notify-send and zenity are replaced by no-op executables placed first
+  on PATH, which measures the process start-up cost of each call.
+- D-Bus runs against a private dbus-daemon with a minimal
+  org.freedesktop.Notifications service (needs dbus-python and PyGObject;
+  skipped otherwise).
+
+It also compares the cached backend and persistent D-Bus connection with
+the previous behaviour of probing and reconnecting for every notification.
+
+Usage: python benchmarks/notification_backends.py [-n COUNT]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from task_manager.utils.notifications import NotificationManager, LINUX_BACKENDS
+
+STAND_IN_SERVICE = r'''
+import dbus, dbus.service, dbus.mainloop.glib
+from gi.repository import GLib
+
+class Notifications(dbus.service.Object):
+    count = 0
+
+    @dbus.service.method("org.freedesktop.Notifications", in_signature="susssasa{sv}i", out_signature="u")
+    def Notify(self, app_name, replaces_id, app_icon, summary, body, actions, hints, timeout):
+        Notifications.count += 1
+        return Notifications.count
+
+dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+bus = dbus.SessionBus()
+name = dbus.service.BusName("org.freedesktop.Notifications", bus)
+Notifications(bus, "/org/freedesktop/Notifications")
+GLib.MainLoop().run()
+'''
+
+def make_stand_in_commands(directory, names):
+    """Create no-op executables standing in for notification commands"""
+    for name in names:
+        path = os.path.join(directory, name)
+        with open(path, "w") as f:
+            f.write("#!/bin/sh\nexit 0\n")
+        os.chmod(path, 0o755)
+
+def start_stand_in_dbus():
+    """Start a private session bus with a stand-in notification service
+
+    Returns a list of processes to stop, or None if D-Bus can't be used.
+    """
+    try:
+        import dbus  # noqa: F401
+        import gi  # noqa: F401
+    except ImportError:
+        return None
+    if not shutil.which("dbus-daemon"):
+        return None
+
+    bus = subprocess.Popen(["dbus-daemon", "--session", "--nofork", "--print-address=1"],
+                           stdout=subprocess.PIPE, universal_newlines=True)
+    os.environ["DBUS_SESSION_BUS_ADDRESS"] = bus.stdout.readline().strip()
+    service = subprocess.Popen([sys.executable, "-c", STAND_IN_SERVICE])
+
+    import dbus
+    session = dbus.SessionBus(private=True)
+    for _ in range(100):
+        if session.name_has_owner("org.freedesktop.Notifications"):
+            break
+        time.sleep(0.05)
+    session.close()
+    return [service, bus]
+
+def measure(send, count):
+    """Return notifications per second for count calls of send()"""
+    started = time.perf_counter()
+    for index in range(count):
+        send(index)
+    return count / (time.perf_counter() - started)
+
+def run_benchmarks(count, stand_in_bin):
+    results = []
+
+    for name in LINUX_BACKENDS:
+        manager = NotificationManager()
+        sender = manager._linux_senders()[name]
+        try:
+            sender("Benchmark", "warm-up", 5)
+        except Exception as e:
+            results.append((f"{name}", None, f"unavailable: {e}"))
+            continue
+
+        results.append((f"{name} (cached backend)",
+                        measure(lambda i: manager._send_with_probe(
+                            (name,), {name: sender}, "Benchmark", f"Notification {i}", 5), count),
+                        ""))
+
+        if name == "dbus":
+            def reconnect_each_time(i):
+                # Previous behaviour: a new bus connection and proxy per notification
+                manager._dbus_bus = manager._dbus_interface = None
+                sender("Benchmark", f"Notification {i}", 5)
+            results.append(("dbus (reconnect per call)", measure(reconnect_each_time, count), ""))
+
+    # Probing cost when the preferred backends are missing and zenity is the one that works
+    manager = NotificationManager()
+    senders = manager._linux_senders()
+
+    def no_session_bus(*args):
+        raise RuntimeError("no session bus")
+
+    senders["dbus"] = no_session_bus
+    os.remove(os.path.join(stand_in_bin, "notify-send"))
+
+    def probe_each_time(i):
+        # Previous behaviour: try every backend in order for each notification
+        manager.backend = None
+        manager._send_with_probe(LINUX_BACKENDS, senders, "Benchmark", f"Notification {i}", 5)
+    results.append(("fallback to zenity (probe per call)", measure(probe_each_time, count), ""))
+
+    manager.backend = None
+    results.append(("fallback to zenity (cached backend)",
+                    measure(lambda i: manager._send_with_probe(
+                        LINUX_BACKENDS, senders, "Benchmark", f"Notification {i}", 5), count),
+                    ""))
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark notification backends against local stand-ins")
+    parser.add_argument("-n", "--count", type=int, default=200, help="Notifications per scenario")
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        print("This benchmark covers the Linux backends only")
+        return
+
+    stand_in_bin = tempfile.mkdtemp(prefix="task-notify-bench-")
+    make_stand_in_commands(stand_in_bin, ("notify-send", "zenity"))
+    os.environ["PATH"] = stand_in_bin + os.pathsep + os.environ.get("PATH", "")
+
+    processes = start_stand_in_dbus()
+    try:
+        results = run_benchmarks(args.count, stand_in_bin)
+    finally:
+        for process in processes or []:
+            process.terminate()
+            process.wait()
+        shutil.rmtree(stand_in_bin, ignore_errors=True)
+
+    print(f"{'Scenario':<40} {'notifications/s':>16}")
+    print("-" * 57)
+    for name, rate, note in results:
+        print(f"{name:<40} {rate:>16.1f}" if rate is not None else f"{name:<40} {note:>16}")
+    if processes is None:
+        print("\nD-Bus stand-in skipped (needs dbus-python, PyGObject and dbus-daemon)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+"""
+Reminder lateness benchmark for Task Manager
+
+Schedules COUNT reminders in a throwaway store and runs the real
+ReminderService over them with a fast-forwarding clock: time the service
+spends idle (waiting for the next reminder) is skipped, while time it
+spends working still passes. A day of reminders therefore runs in
+seconds, and any overhead in the reminder engine shows up as lateness.
+
+Reported per run:
+
+- firing lateness percentiles (time between a reminder's due time and the
+  moment it is handed to the notifier)
+- CPU time per reminder
+- store I/O per reminder: file opens by name, and bytes read and written
+  (Linux only, from /proc/self/io)
+
+Usage: python benchmarks/reminder_lateness.py [-n COUNT] [--span HOURS] [--max-p99 MS]
+"""
+
+import argparse
+import collections
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from task_manager.models.task import Task
+from task_manager.utils.paths import get_storage_directory
+from task_manager.utils.storage import save_tasks
+from task_manager.utils.notifications import ReminderService
+
+# Seconds between the start of the run and the first reminder
+LEAD_TIME = 60.0
+
+# Real seconds to wait for all reminders before giving up
+RUN_TIMEOUT = 600.0
+
+class FastForwardClock:
+    """Real elapsed time plus the idle time the service skipped"""
+
+    def __init__(self, start):
+        self.start = start
+        self.skipped = 0.0
+        self.real_start = time.perf_counter()
+
+    def time(self):
+        return self.start + self.skipped + (time.perf_counter() - self.real_start)
+
+    def sleep(self, seconds):
+        self.skipped += seconds
+
+    def wait(self, cond, timeout):
+        if timeout is None:
+            # Nothing left to schedule: wait for a real wake-up (stop())
+            return cond.wait()
+        self.skipped += timeout
+        return False
+
+class RecordingNotifier:
+    """Notifier that records when each reminder was handed over"""
+
+    def __init__(self, clock, expected):
+        self.clock = clock
+        self.expected = expected
+        self.fired = []
+        self.done = threading.Event()
+
+    def submit(self, title, message):
+        self.fired.append((self.clock.time(), message))
+        if len(self.fired) >= self.expected:
+            self.done.set()
+        return True
+
+class OpenCounter:
+    """Count files opened under the storage directory, by file name"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.counts = collections.Counter()
+        self.active = False
+
+    def __call__(self, event, args):
+        if event == "open" and self.active and isinstance(args[0], str) \
+                and args[0].startswith(self.directory):
+            self.counts[os.path.basename(args[0])] += 1
+
+def read_proc_io():
+    """Return (bytes read, bytes written) by this process, or None off Linux"""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(": ") for line in f.read().splitlines())
+        return int(fields["rchar"]), int(fields["wchar"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def make_store(count, start, span, seed):
+    """Save COUNT tasks with reminders spread over SPAN seconds; returns id -> due time
+
+    Reminder times are rounded to the minute, as people tend to pick them,
+    so many reminders share a due time.
+    """
+    rng = random.Random(seed)
+    tasks = []
+    due_times = {}
+    for task_id in range(1, count + 1):
+        task = Task(task_id, f"Reminder benchmark task {task_id}")
+        due = start + LEAD_TIME + rng.random() * span
+        task.set_reminder(due - due % 60)
+        due_times[task_id] = task.reminder_time
+        tasks.append(task)
+    save_tasks(tasks)
+    return due_times
+
+def percentile(values, fraction):
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+def run_benchmark(count, span, seed=1):
+    start = time.time()
+    due_times = make_store(count, start, span, seed)
+
+    counter = OpenCounter(get_storage_directory())
+    if hasattr(sys, "addaudithook"):
+        sys.addaudithook(counter)
+
+    clock = FastForwardClock(start)
+    notifier = RecordingNotifier(clock, count)
+    service = ReminderService(clock=clock, notifier=notifier)
+
+    io_before = read_proc_io()
+    cpu_before = time.process_time()
+    real_before = time.perf_counter()
+    counter.active = True
+
+    service.start()
+    finished = notifier.done.wait(RUN_TIMEOUT)
+    service.stop()
+
+    counter.active = False
+    real_elapsed = time.perf_counter() - real_before
+    cpu_elapsed = time.process_time() - cpu_before
+    io_after = read_proc_io()
+
+    lateness = []
+    for fired_at, message in notifier.fired:
+        task_id = int(message.split(":", 1)[0].rsplit("#", 1)[1])
+        lateness.append(fired_at - due_times[task_id])
+    lateness.sort()
+
+    fired = len(notifier.fired) or 1
+    result = {
+        "count": count,
+        "fired": len(notifier.fired),
+        "finished": finished,
+        "virtual_hours": (clock.time() - start) / 3600,
+        "real_seconds": real_elapsed,
+        "cpu_per_reminder_us": cpu_elapsed / fired * 1e6,
+        "opens_per_reminder": {name: n / fired for name, n in sorted(counter.counts.items())},
+        "lateness_ms": {label: percentile(lateness, fraction) * 1000
+                        for label, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99),
+                                                ("p99.9", 0.999), ("max", 1.0))} if lateness else {},
+    }
+    if io_before and io_after:
+        result["read_bytes_per_reminder"] = (io_after[0] - io_before[0]) / fired
+        result["written_bytes_per_reminder"] = (io_after[1] - io_before[1]) / fired
+    return result
+
+def print_report(result):
+    print(f"Reminders fired:      {result['fired']} of {result['count']}"
+          + ("" if result["finished"] else " (timed out)"))
+    print(f"Simulated time:       {result['virtual_hours']:.1f} h in {result['real_seconds']:.2f} s")
+    print(f"CPU per reminder:     {result['cpu_per_reminder_us']:.1f} us")
+    print("Lateness (ms):        " + "  ".join(f"{label} {value:.3f}"
+                                             for label, value in result["lateness_ms"].items()))
+    if "read_bytes_per_reminder" in result:
+        print(f"Bytes per reminder:   read {result['read_bytes_per_reminder']:.1f}, "
+              f"written {result['written_bytes_per_reminder']:.1f}")
+    if result["opens_per_reminder"]:
+        print("Opens per reminder:   " + ", ".join(f"{name} {n:.4f}"
+                                                  for name, n in result["opens_per_reminder"].items()))
+    elif not hasattr(sys, "addaudithook"):
+        print("Opens per reminder:   not measured (needs Python 3.8+)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure reminder firing lateness under a simulated clock")
+    parser.add_argument("-n", "--count", type=int, default=100000, help="Reminders to schedule")
+    parser.add_argument("--span", type=float, default=24.0, help="Hours the reminders are spread over")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for reminder times")
+    parser.add_argument("--max-p99", type=float, metavar="MS",
+                        help="Exit with status 1 if p99 lateness exceeds this many milliseconds")
+    args = parser.parse_args()
+
+    # Keep the benchmark store away from the user's tasks
+    home = tempfile.mkdtemp(prefix="task-reminder-bench-")
+    os.environ["HOME"] = home
+    os.environ["APPDATA"] = home
+    try:
+        result = run_benchmark(args.count, args.span * 3600, args.seed)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    print_report(result)
+    if not result["finished"]:
+        sys.exit(1)
+    if args.max_p99 is not None and result["lateness_ms"].get("p99", 0) > args.max_p99:
+        print(f"p99 lateness above {args.max_p99} ms")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
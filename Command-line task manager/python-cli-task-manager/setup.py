@@ -15,6 +15,7 @@ setup(
             "task-gui=main:main",
             "taskmanager=main:main",  # Alternative name
             "task-shell=task_manager.task_shell:main",  # New interactive shell
+            "task-daemon=task_manager.daemon:main",  # Optional warm background server
         ],
     },
     author="Task Manager Team",
@@ -7,10 +7,18 @@ command line and graphical user interfaces. It supports task reminders
 and is compatible with Windows, macOS, and Linux.
 """
 
-from task_manager.gui import launch_simple_gui as launch_gui
-
 __version__ = '1.0.0'  # Update this when making new releases
 __author__ = 'Your Name'  # Replace with your actual name
 
 # Define public API
-__all__ = ['launch_gui']
\ No newline at end of file
+__all__ = ['launch_gui']
+
+def __getattr__(name):
+    """Import the GUI only when launch_gui is actually used (PEP 562)
+
+    Keeps tkinter and the GUI modules out of CLI start-up.
+    """
+    if name == 'launch_gui':
+        from task_manager.gui import launch_simple_gui
+        return launch_simple_gui
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,55 @@
 """
 Interactive CLI for Task Manager
+
+The session loads the store once into a repository and edits it in
+memory. Changes are saved write-behind, a short delay after the last
+edit (the cli.write_behind_delay setting), and flushed when the session
+ends, including on Ctrl+C. Changes other processes save meanwhile are
+merged in rather than overwritten.
 """
 import os
 import sys
 import time
 import datetime
 from task_manager.models.task import Task
-from task_manager.utils.storage import load_tasks, save_tasks
-from task_manager.commands.add import add_task
-from task_manager.commands.list import list_tasks
-from task_manager.commands.complete import complete_task
-from task_manager.commands.delete import delete_task
+
+# Default seconds between the last edit and the write-behind save
+DEFAULT_WRITE_BEHIND_DELAY = 2.0
+
+# Repository shared by every screen of the current session
+_session_repo = None
+
+def session_repository():
+    """Return the session's repository, merged with any externally saved changes"""
+    global _session_repo
+    if _session_repo is None:
+        from task_manager.utils.repository import TaskRepository
+        from task_manager.utils.settings import get_settings
+        delay = get_settings().get('cli', {}).get('write_behind_delay', DEFAULT_WRITE_BEHIND_DELAY)
+        _session_repo = TaskRepository(flush_delay=delay, merge_external=True)
+    else:
+        _session_repo.refresh_if_changed()
+    return _session_repo
+
+def session_task(repo, task_id):
+    """Return the repository's current object for a task ID, or None if it was deleted"""
+    return next((t for t in repo.tasks if t.id == task_id), None)
+
+def end_session():
+    """Save pending changes and drop the session repository"""
+    global _session_repo
+    if _session_repo is not None:
+        _session_repo.flush()
+        _session_repo = None
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # An escape sequence instead of spawning a shell and 'clear' on every redraw
+        sys.stdout.write("\033[H\033[2J")
+        sys.stdout.flush()
 
 def print_header(title):
     """Print a formatted header"""
@@ -160,24 +195,105 @@ def format_task(task, index=None):
 
     return line
 
-def show_tasks(tasks, title="All Tasks"):
-    """Display a list of tasks"""
-    clear_screen()
-    print_header(title)
+class LazyResults:
+    """Results pulled from an iterator only as far as the pager has looked
 
-    filtered_tasks = tasks
+    Tasks keep their position once seen, so the numbers shown for them
+    stay the same on every page.
+    """
 
-    if not filtered_tasks:
-        print("No tasks found.")
-        print()
-        return filtered_tasks
+    def __init__(self, tasks):
+        self.seen = []
+        self.source = iter(tasks)
+        self.exhausted = False
+        # Lists know their length up front; filtered iterators don't
+        self.total = len(tasks) if hasattr(tasks, '__len__') else None
 
-    # Display tasks
-    for i, task in enumerate(filtered_tasks, 1):
-        print(format_task(task, i))
+    def fill(self, count):
+        """Pull from the source until count tasks are seen or it runs out"""
+        while len(self.seen) < count and not self.exhausted:
+            try:
+                self.seen.append(next(self.source))
+            except StopIteration:
+                self.exhausted = True
+                self.total = len(self.seen)
+        return len(self.seen) >= count
+
+    def page(self, number, size):
+        """Return the tasks on a page (numbered from 1)"""
+        start = (number - 1) * size
+        self.fill(start + size + 1)  # One extra tells whether a next page exists
+        return self.seen[start:start + size]
+
+    def get(self, index):
+        """Return the task with a global number (from 1), or None"""
+        return self.seen[index - 1] if index >= 1 and self.fill(index) else None
+
+def page_size():
+    """Number of tasks that fit on one screen below the header and prompt"""
+    import shutil
+    return max(shutil.get_terminal_size().lines - 10, 5)
 
-    print()
-    return filtered_tasks
+def show_tasks(tasks, title="All Tasks"):
+    """Page through tasks and return the one the user selects, or None
+
+    Only the tasks on the current page are formatted. Tasks are numbered
+    across pages, so a number can be entered from any page; n/p move
+    between pages and 'g N' jumps to page N.
+    """
+    results = LazyResults(tasks)
+    size = page_size()
+    number = 1
+
+    while True:
+        clear_screen()
+        print_header(title)
+
+        page = results.page(number, size)
+        if not page:
+            if number > 1:
+                # Jumped past the end: go to the last page
+                number = max(-(-len(results.seen) // size), 1)
+                continue
+            print("No tasks found.")
+            print()
+            input("Press Enter to continue...")
+            return None
+
+        first = (number - 1) * size + 1
+        for offset, task in enumerate(page):
+            print(format_task(task, first + offset))
+
+        has_next = len(results.seen) > first - 1 + len(page)
+        pages = f" of {-(-results.total // size)}" if results.total is not None else ""
+        print(f"\nPage {number}{pages} | Tasks {first}-{first + len(page) - 1}"
+              f"{'' if results.total is None else f' of {results.total}'}")
+        print("n=Next | p=Previous | g N=Go to page | number=Select | 0=Back")
+
+        choice = input("\033[1;36m➤\033[0m Select a task: ").strip().lower()
+        if choice in ("n", ""):
+            if has_next:
+                number += 1
+        elif choice == "p":
+            number = max(number - 1, 1)
+        elif choice.startswith("g"):
+            try:
+                number = max(int(choice[1:].strip()), 1)
+            except ValueError:
+                pass
+        elif choice == "q":
+            # Same shortcut as get_input(): quit from anywhere
+            clear_screen()
+            print("Exiting Task Manager...\nYour tasks have been saved.")
+            sys.exit(0)
+        elif choice == "?":
+            show_help()
+        elif choice.isdigit():
+            if int(choice) == 0:
+                return None
+            task = results.get(int(choice))
+            if task is not None:
+                return task
 
 def task_details(task):
     """Show detailed view of a task"""
@@ -191,6 +307,10 @@ def task_details(task):
     if hasattr(task, 'due_date') and task.due_date:
         print(f"Due Date: {task.due_date}")
 
+    if getattr(task, 'recurrence', None):
+        from task_manager.utils.recurrence import describe_rule
+        print(f"Repeats: {describe_rule(task.recurrence)}")
+
     if hasattr(task, 'category') and task.category:
         print(f"Category: {task.category}")
 
@@ -247,38 +367,38 @@ def add_task_interactive():
     if not notes.strip():
         notes = None
 
-    # Create and save the task
-    tasks = load_tasks()
-
-    # Generate new task ID
-    if tasks:
-        task_id = max(task.id for task in tasks) + 1
-    else:
-        task_id = 1
+    # Create the task; the session saves it write-behind
+    repo = session_repository()
 
-    new_task = Task(task_id=task_id, description=description)
+    new_task = Task(task_id=repo.next_id(), description=description)
     new_task.priority = priority
     new_task.due_date = due_date
     new_task.category = category
     new_task.notes = notes
     new_task.progress = 0
 
-    tasks.append(new_task)
-    save_tasks(tasks)
+    repo.add(new_task)
 
     print("\nTask added successfully!")
     time.sleep(1.5)
 
 def edit_task_interactive(task):
-    """Interactive dialog to edit a task"""
+    """Interactive dialog to edit a task
+
+    Returns the session's current copy of the task, or None if it was deleted elsewhere.
+    """
     clear_screen()
     print_header(f"Edit Task #{task.id}")
 
+    # Collected first and applied at the end, to the session's current copy
+    # of the task (another process may save while the user is typing)
+    changes = {}
+
     # Edit description
     print(f"Current description: {task.description}")
     new_description = input("New description (leave empty to keep current): ")
     if new_description.strip():
-        task.description = new_description
+        changes['description'] = new_description
 
     # Edit priority
     priority_options = ["High", "Medium", "Low"]
@@ -289,18 +409,18 @@ def edit_task_interactive(task):
         print(f"{i}. {option}")
     priority_choice = get_input("Select priority (1-3) [leave empty to keep current]: ", range(1, 4))
     if priority_choice != 0:
-        task.priority = priority_options[priority_choice - 1]
+        changes['priority'] = priority_options[priority_choice - 1]
 
     # Edit due date
     current_due_date = getattr(task, 'due_date', None)
     print(f"\nCurrent due date: {current_due_date or 'None'}")
     new_due_date = input("New due date (YYYY-MM-DD) [leave empty to keep current, 'none' to remove]: ")
     if new_due_date.lower() == 'none':
-        task.due_date = None
+        changes['due_date'] = None
     elif new_due_date.strip():
         try:
             datetime.datetime.strptime(new_due_date, "%Y-%m-%d")
-            task.due_date = new_due_date
+            changes['due_date'] = new_due_date
         except ValueError:
             print("Invalid date format. Keeping current due date.")
 
@@ -309,9 +429,9 @@ def edit_task_interactive(task):
     print(f"\nCurrent category: {current_category or 'None'}")
     new_category = input("New category [leave empty to keep current, 'none' to remove]: ")
     if new_category.lower() == 'none':
-        task.category = None
+        changes['category'] = None
     elif new_category.strip():
-        task.category = new_category
+        changes['category'] = new_category
 
     # Edit notes
     current_notes = getattr(task, 'notes', None)
@@ -319,9 +439,9 @@ def edit_task_interactive(task):
     print("New notes [leave empty to keep current, 'none' to remove]:")
     new_notes = input("> ")
     if new_notes.lower() == 'none':
-        task.notes = None
+        changes['notes'] = None
     elif new_notes.strip():
-        task.notes = new_notes
+        changes['notes'] = new_notes
 
     # Edit progress
     current_progress = getattr(task, 'progress', 0)
@@ -331,22 +451,23 @@ def edit_task_interactive(task):
         try:
             progress_value = int(new_progress)
             if 0 <= progress_value <= 100:
-                task.progress = progress_value
+                changes['progress'] = progress_value
             else:
                 print("Progress must be between 0 and 100. Keeping current progress.")
         except ValueError:
             print("Invalid progress value. Keeping current progress.")
 
-    # Save changes
-    tasks = load_tasks()
-    for i, t in enumerate(tasks):
-        if t.id == task.id:
-            tasks[i] = task
-            break
-
-    save_tasks(tasks)
-    print("\nTask updated successfully!")
+    repo = session_repository()
+    current = session_task(repo, task.id)
+    if current is None:
+        print("\nThis task was deleted elsewhere; nothing was changed.")
+    else:
+        for name, value in changes.items():
+            setattr(current, name, value)
+        repo.mark_dirty(current)
+        print("\nTask updated successfully!")
     time.sleep(1.5)
+    return current
 
 def filter_menu():
     """Show task filtering options"""
@@ -369,69 +490,55 @@ def filter_menu():
     print_menu(options)
     choice = get_input("Select filter option: ", range(0, len(options) + 1))
 
-    tasks = load_tasks()
+    tasks = session_repository().tasks
     today = datetime.date.today()
     end_of_week = today + datetime.timedelta(days=7)
 
+    def active_due_date(task):
+        """Due date of an active task, or None"""
+        if getattr(task, 'due_date', None) and not task.completed:
+            try:
+                return datetime.datetime.strptime(task.due_date, "%Y-%m-%d").date()
+            except ValueError:
+                return None
+        return None
+
+    # Filters are generators: the pager only evaluates as many tasks as it shows
     if choice == 1:  # All Tasks
         return show_tasks(tasks, "All Tasks")
     elif choice == 2:  # Active Tasks
-        filtered = [t for t in tasks if not t.completed]
+        filtered = (t for t in tasks if not t.completed)
         return show_tasks(filtered, "Active Tasks")
     elif choice == 3:  # Completed Tasks
-        filtered = [t for t in tasks if t.completed]
+        filtered = (t for t in tasks if t.completed)
         return show_tasks(filtered, "Completed Tasks")
     elif choice == 4:  # High Priority
-        filtered = [t for t in tasks if getattr(t, 'priority', 'Medium') == 'High']
+        filtered = (t for t in tasks if getattr(t, 'priority', 'Medium') == 'High')
         return show_tasks(filtered, "High Priority Tasks")
     elif choice == 5:  # Medium Priority
-        filtered = [t for t in tasks if getattr(t, 'priority', 'Medium') == 'Medium']
+        filtered = (t for t in tasks if getattr(t, 'priority', 'Medium') == 'Medium')
         return show_tasks(filtered, "Medium Priority Tasks")
     elif choice == 6:  # Low Priority
-        filtered = [t for t in tasks if getattr(t, 'priority', 'Medium') == 'Low']
+        filtered = (t for t in tasks if getattr(t, 'priority', 'Medium') == 'Low')
         return show_tasks(filtered, "Low Priority Tasks")
     elif choice == 7:  # Overdue Tasks
-        filtered = []
-        for task in tasks:
-            if hasattr(task, 'due_date') and task.due_date and not task.completed:
-                try:
-                    due_date = datetime.datetime.strptime(task.due_date, "%Y-%m-%d").date()
-                    if due_date < today:
-                        filtered.append(task)
-                except ValueError:
-                    continue
+        filtered = (t for t in tasks if (active_due_date(t) or today) < today)
         return show_tasks(filtered, "Overdue Tasks")
     elif choice == 8:  # Due Today
-        filtered = []
-        for task in tasks:
-            if hasattr(task, 'due_date') and task.due_date and not task.completed:
-                try:
-                    due_date = datetime.datetime.strptime(task.due_date, "%Y-%m-%d").date()
-                    if due_date == today:
-                        filtered.append(task)
-                except ValueError:
-                    continue
+        filtered = (t for t in tasks if active_due_date(t) == today)
         return show_tasks(filtered, "Tasks Due Today")
     elif choice == 9:  # Due This Week
-        filtered = []
-        for task in tasks:
-            if hasattr(task, 'due_date') and task.due_date and not task.completed:
-                try:
-                    due_date = datetime.datetime.strptime(task.due_date, "%Y-%m-%d").date()
-                    if today <= due_date <= end_of_week:
-                        filtered.append(task)
-                except ValueError:
-                    continue
+        filtered = (t for t in tasks if today <= (active_due_date(t) or datetime.date.min) <= end_of_week)
         return show_tasks(filtered, "Tasks Due This Week")
     elif choice == 10:  # Search by Keyword
         keyword = input("Enter search term: ").lower()
         if keyword:
-            filtered = [t for t in tasks if keyword in t.description.lower() or
-                         (hasattr(t, 'notes') and t.notes and keyword in t.notes.lower()) or
-                         (hasattr(t, 'category') and t.category and keyword in t.category.lower())]
+            filtered = (t for t in tasks if keyword in t.description.lower() or
+                        (hasattr(t, 'notes') and t.notes and keyword in t.notes.lower()) or
+                        (hasattr(t, 'category') and t.category and keyword in t.category.lower()))
             return show_tasks(filtered, f"Search Results for '{keyword}'")
 
-    return tasks
+    return None
 
 def main_menu():
     """Display main menu and process user choices"""
@@ -455,21 +562,15 @@ def main_menu():
         if choice == 0:
             break
         elif choice == 1:  # View All Tasks
-            tasks = show_tasks(load_tasks())
-            if tasks:
-                task_choice = get_input("Select a task number to view details (0 to go back): ",
-                                      range(0, len(tasks) + 1))
-                if task_choice > 0:
-                    task_menu(tasks[task_choice - 1])
+            task = show_tasks(session_repository().tasks)
+            if task is not None:
+                task_menu(task)
         elif choice == 2:  # Add New Task
             add_task_interactive()
         elif choice == 3:  # Filter Tasks
-            filtered_tasks = filter_menu()
-            if filtered_tasks:
-                task_choice = get_input("Select a task number to view details (0 to go back): ",
-                                      range(0, len(filtered_tasks) + 1))
-                if task_choice > 0:
-                    task_menu(filtered_tasks[task_choice - 1])
+            task = filter_menu()
+            if task is not None:
+                task_menu(task)
         elif choice == 4:  # Sort Tasks
             sort_menu()
         elif choice == 5:  # Use Template
@@ -536,18 +637,13 @@ def use_template():
     # Create task from template
     try:
         from task_manager.utils.templates import create_task_from_template
-        from task_manager.models.task import Task
-        from task_manager.utils.storage import load_tasks, save_tasks
 
         # Get task data from template
         task_data = create_task_from_template(template_name, variable_values)
 
-        # Create a task ID
-        tasks = load_tasks()
-        task_id = 1 if not tasks else max(t.id for t in tasks) + 1
-
         # Create a new task
-        new_task = Task(task_id=task_id)
+        repo = session_repository()
+        new_task = Task(task_id=repo.next_id(), description="")
 
         # Copy template data to task
         for key, value in task_data.items():
@@ -557,11 +653,8 @@ def use_template():
         if 'due_date' in variable_values:
             new_task.due_date = variable_values['due_date']
 
-        # Add to task list
-        tasks.append(new_task)
-
-        # Save tasks
-        save_tasks(tasks)
+        # Add to the session's task list
+        repo.add(new_task)
 
         print(f"\nTask created successfully from template '{template_name}'.")
     except Exception as e:
@@ -578,33 +671,34 @@ def task_menu(task):
         if choice == 0:
             break
         elif choice == 1:  # Edit Task
-            edit_task_interactive(task)
-            # Reload the task in case it was modified
-            tasks = load_tasks()
-            for t in tasks:
-                if t.id == task.id:
-                    task = t
-                    break
+            task = edit_task_interactive(task)
+            if task is None:
+                return
         elif choice == 2:  # Toggle Completion
-            task.completed = not task.completed
-            if task.completed:
-                task.progress = 100
+            # Fetch the repository (picking up external saves) before changing
+            # anything, and act on its current copy of the task
+            repo = session_repository()
+            task = session_task(repo, task.id)
+            if task is None:
+                print("This task was deleted elsewhere.")
+                time.sleep(1)
+                return
 
-            tasks = load_tasks()
-            for i, t in enumerate(tasks):
-                if t.id == task.id:
-                    tasks[i] = task
-                    break
+            next_due = None
+            if task.completed:
+                task.completed = False
+            else:
+                next_due = task.mark_complete()
 
-            save_tasks(tasks)
-            print("Task status updated.")
+            repo.mark_dirty(task)
+            print(f"Done; next occurrence due {next_due}." if next_due else "Task status updated.")
             time.sleep(1)
         elif choice == 3:  # Delete Task
             confirm = input("Are you sure you want to delete this task? (y/n): ")
             if confirm.lower() == 'y':
-                tasks = load_tasks()
-                tasks = [t for t in tasks if t.id != task.id]
-                save_tasks(tasks)
+                repo = session_repository()
+                repo.tasks[:] = [t for t in repo.tasks if t.id != task.id]
+                repo.mark_dirty()
                 print("Task deleted.")
                 time.sleep(1)
                 return  # Exit task menu after deletion
@@ -628,18 +722,20 @@ def sort_menu():
     if choice == 0:
         return
 
-    tasks = load_tasks()
+    # Sort a copy so the session's stored order is left alone
+    tasks = list(session_repository().tasks)
+    task = None
 
     if choice == 1:  # By ID
         tasks.sort(key=lambda t: t.id)
-        show_tasks(tasks, "Tasks Sorted by ID")
+        task = show_tasks(tasks, "Tasks Sorted by ID")
     elif choice == 2:  # By Description
         tasks.sort(key=lambda t: t.description.lower())
-        show_tasks(tasks, "Tasks Sorted by Description")
+        task = show_tasks(tasks, "Tasks Sorted by Description")
     elif choice == 3:  # By Priority
         priority_order = {'High': 0, 'Medium': 1, 'Low': 2}
         tasks.sort(key=lambda t: priority_order.get(getattr(t, 'priority', 'Medium'), 1))
-        show_tasks(tasks, "Tasks Sorted by Priority")
+        task = show_tasks(tasks, "Tasks Sorted by Priority")
     elif choice == 4:  # By Due Date
         # Define a key function that handles tasks without due dates
         def due_date_key(task):
@@ -651,28 +747,47 @@ def sort_menu():
                 return datetime.datetime.max
 
         tasks.sort(key=due_date_key)
-        show_tasks(tasks, "Tasks Sorted by Due Date")
+        task = show_tasks(tasks, "Tasks Sorted by Due Date")
     elif choice == 5:  # By Progress
         tasks.sort(key=lambda t: getattr(t, 'progress', 0))
-        show_tasks(tasks, "Tasks Sorted by Progress")
+        task = show_tasks(tasks, "Tasks Sorted by Progress")
+
+    if task is not None:
+        task_menu(task)
+
+def tui_available():
+    """Check whether the full-screen curses interface can run here"""
+    if not (sys.stdin.isatty() and sys.stdout.isatty()):
+        return False
+    try:
+        import curses  # noqa: F401 - not shipped with Python on Windows
+    except ImportError:
+        return False
+    return True
 
-    if tasks:
-        task_choice = get_input("Select a task number to view details (0 to go back): ", range(0, len(tasks) + 1))
-        if task_choice > 0:
-            task_menu(tasks[task_choice - 1])
+def run_interactive_cli(classic=False):
+    """Entry point for the interactive CLI
 
-def run_interactive_cli():
-    """Entry point for the interactive CLI"""
+    Uses the full-screen interface when the terminal supports it, unless
+    classic is set, and the numbered menus otherwise.
+    """
     try:
-        # Show welcome screen on first run
-        show_welcome_screen()
+        if not classic and tui_available():
+            from task_manager.tui import run_tui
+            run_tui(session_repository())
+        else:
+            # Show welcome screen on first run
+            show_welcome_screen()
 
-        # Start the main menu loop
-        main_menu()
+            # Start the main menu loop
+            main_menu()
 
     except KeyboardInterrupt:
         clear_screen()
         print("\nExiting Task Manager...\nYour tasks have been saved.")
+    finally:
+        # Also runs for the 'q' shortcut, which exits through sys.exit()
+        end_session()
 
     print("Goodbye!")
 
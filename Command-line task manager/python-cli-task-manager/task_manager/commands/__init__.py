@@ -2,9 +2,29 @@
 
 """
 Command modules for Task Manager CLI
+
+Command functions are exported lazily (PEP 562) so that importing one
+command doesn't import the others.
 """
 
-from .add import add_task
-from .list import list_tasks
-from .complete import complete_task
-from .delete import delete_task
\ No newline at end of file
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'add_task': 'add',
+    'list_tasks': 'list',
+    'complete_task': 'complete',
+    'complete_tasks': 'complete',
+    'delete_task': 'delete',
+    'delete_tasks': 'delete',
+    'update_tasks': 'update',
+    'count_tasks': 'count',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module = importlib.import_module(f'.{_EXPORTS[name]}', __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,34 +2,51 @@
 Add task command for Task Manager
 """
 
-from task_manager.utils.storage import load_tasks, save_tasks
+from task_manager.utils.repository import using_repository
 from task_manager.models.task import Task
 
-def add_task(description, priority=None, due_date=None, category=None):
-    """Add a new task to the task list"""
-    # Load existing tasks
-    tasks = load_tasks()
-
-    # Create task ID (max ID + 1 or 1 if no tasks)
-    task_id = 1 if not tasks else max(task.id for task in tasks) + 1
-
-    # Create new task
-    task = Task(task_id=task_id, description=description)
-
-    # Set optional properties
-    if priority:
-        task.priority = priority
-
-    if due_date:
-        task.due_date = due_date
-
-    if category:
-        task.category = category
-
-    # Add to task list
-    tasks.append(task)
-
-    # Save tasks
-    save_tasks(tasks)
-
-    return task
\ No newline at end of file
+def add_task(description, priority=None, due_date=None, category=None, repo=None,
+             template=None, template_values=None, recurrence=None):
+    """Add a new task to the task list
+
+    With template, the task starts from the named template (filled in with
+    template_values) and any explicitly given fields override it. With
+    recurrence (a rule such as "weekly"), the due date is the first
+    occurrence; it defaults to today.
+    """
+    if recurrence:
+        from task_manager.utils.recurrence import normalize_rule
+        # Reject a bad rule before touching the store
+        recurrence = normalize_rule(recurrence)
+
+    with using_repository(repo) as repo:
+        # Create new task with the next free ID
+        task = Task(task_id=repo.next_id(), description=description)
+
+        if template:
+            from task_manager.utils.templates import create_task_from_template
+            # Accept the on-disk name offered by shell completion as well as the display name
+            task_data = create_task_from_template(template.replace('_', ' '), template_values or {})
+            for key, value in task_data.items():
+                if key != 'id':
+                    setattr(task, key, value)
+            if description:
+                task.description = description
+
+        # Set optional properties
+        if priority:
+            task.priority = priority
+
+        if due_date:
+            task.due_date = due_date
+
+        if category:
+            task.category = category
+
+        if recurrence:
+            task.set_recurrence(recurrence)
+
+        # Add to task list
+        repo.add(task)
+
+    return task
@@ -0,0 +1,92 @@
+"""
+Batch command for Task Manager
+
+Runs newline-delimited task-cli commands against a single in-memory
+repository, so a script of many commands pays for one process start-up,
+one load and one save (or one save every N commands).
+"""
+
+import shlex
+import sys
+import time
+from task_manager.utils.repository import TaskRepository
+
+def iter_batch_lines(source):
+    """Yield (line number, line) for each command in a batch source
+
+    Blank lines and lines starting with '#' are skipped. Lines are split
+    by split_batch_line() in run_batch(), so a line that can't be split
+    counts as one failed command.
+    """
+    for line_number, line in enumerate(source, 1):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line_number, line
+
+def split_batch_line(line):
+    """Split a batch line into task-cli arguments (raises ValueError on bad quoting)"""
+    argv = shlex.split(line)
+    # Allow scripts written as "task-cli add ..." as well as "add ..."
+    if argv and argv[0] in ("task-cli", "task"):
+        argv = argv[1:]
+    return argv
+
+def run_batch(path, parser, commit_every=0, keep_going=False, repo=None):
+    """Execute a batch file ('-' for stdin) and return the number of failures
+
+    Args:
+        path: Path to the batch file, or '-' to read from stdin
+        parser: The task-cli argument parser used to parse each line
+        commit_every: Save after this many commands; 0 saves once at the end
+        keep_going: Continue after a failing command instead of stopping
+        repo: Optional TaskRepository; loaded from storage when omitted
+    """
+    from task_manager.main import run_command
+
+    repo = repo if repo is not None else TaskRepository()
+    source = sys.stdin if path == "-" else open(path, "r")
+
+    started = time.perf_counter()
+    executed = failures = saves = 0
+
+    try:
+        for line_number, line in iter_batch_lines(source):
+            try:
+                argv = split_batch_line(line)
+                if not argv:
+                    continue
+                args = parser.parse_args(argv)
+                if args.command == "batch":
+                    raise ValueError("batch cannot be nested")
+                run_command(args, parser, repo=repo)
+                executed += 1
+            except SystemExit as e:
+                # argparse reports its own usage errors; --help exits with 0
+                if e.code:
+                    failures += 1
+                    print(f"Error on line {line_number}: invalid command", file=sys.stderr)
+                    if not keep_going:
+                        break
+                else:
+                    executed += 1
+            except Exception as e:
+                failures += 1
+                print(f"Error on line {line_number}: {e}", file=sys.stderr)
+                if not keep_going:
+                    break
+
+            if commit_every and executed and executed % commit_every == 0:
+                if repo.commit():
+                    saves += 1
+    finally:
+        # Commands that succeeded before a failure are still saved
+        if repo.commit():
+            saves += 1
+        if source is not sys.stdin:
+            source.close()
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"Batch: {executed} command(s) run, {failures} failed, "
+          f"{saves} save(s) in {elapsed_ms:.1f} ms", file=sys.stderr)
+
+    return failures
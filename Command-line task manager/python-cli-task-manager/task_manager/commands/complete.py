@@ -3,6 +3,8 @@ Complete task command for Task Manager
 """
 
 from task_manager.utils.storage import load_tasks, save_tasks
+from task_manager.utils.repository import using_repository
+from task_manager.utils.query import build_selector
 
 def complete_task(task_id):
     """Mark a task as complete"""
@@ -11,14 +13,45 @@ def complete_task(task_id):
     # Find the task with matching ID
     for task in tasks:
         if task.id == task_id:
-            # Mark as complete and set progress to 100%
-            task.completed = True
-            if hasattr(task, 'progress'):
-                task.progress = 100
+            # Mark as complete (a recurring task moves on to its next occurrence)
+            task.mark_complete()
 
             # Save the updated tasks
             save_tasks(tasks)
             return True
 
     # Task not found
-    raise ValueError(f"Task with ID {task_id} not found")
\ No newline at end of file
+    raise ValueError(f"Task with ID {task_id} not found")
+
+def complete_tasks(task_ids=None, where=None, repo=None):
+    """Mark every selected task as complete with one load and one save
+
+    Args:
+        task_ids: ID tokens such as ["1", "2", "5-40"]
+        where: Filter expression such as "status:active cat:work"
+        repo: Optional TaskRepository to work on instead of the saved store
+
+    Returns:
+        tuple: (number of tasks completed, descriptions of requested IDs not found,
+                sorted listed IDs whose task did not match --where)
+    """
+    selector, ids = build_selector(task_ids, where)
+
+    count = 0
+    found = set()
+    present = set()
+    with using_repository(repo) as repo:
+        for task in repo.tasks:
+            if task.id in ids:
+                present.add(task.id)
+            if selector(task):
+                found.add(task.id)
+                if not task.completed:
+                    # A recurring task moves on to its next occurrence instead
+                    task.mark_complete()
+                    count += 1
+
+        if count:
+            repo.mark_dirty()
+
+    return count, ids.missing(present), ids.unmatched(present, found)
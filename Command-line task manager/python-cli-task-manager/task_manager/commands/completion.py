@@ -0,0 +1,117 @@
+"""
+Shell completion command for Task Manager
+
+'task-cli completion bash|zsh' prints a completion script to source from
+the shell's rc file. The scripts call 'task-cli __complete KIND', which
+main() answers on a fast path from the completion cache.
+"""
+
+import sys
+from task_manager.utils.completion import COMPLETION_KINDS, get_candidates
+
+COMMANDS = ("add", "list", "complete", "delete", "update", "batch", "count",
+            "completion", "interactive", "toggle-interactive")
+
+BASH_SCRIPT = r'''# task-cli bash completion
+# Add to ~/.bashrc:  eval "$(task-cli completion bash)"
+_task_cli_complete() {
+    local cur prev cmd IFS=$'\n'
+    cur="${COMP_WORDS[COMP_CWORD]}"
+    prev="${COMP_WORDS[COMP_CWORD-1]}"
+    cmd="${COMP_WORDS[1]}"
+
+    if [ "$COMP_CWORD" -eq 1 ]; then
+        COMPREPLY=( $(compgen -W "%(commands)s" -- "$cur") )
+        return
+    fi
+
+    case "$prev" in
+        -c|--category)
+            COMPREPLY=( $(compgen -W "$(task-cli __complete categories 2>/dev/null)" -- "$cur") )
+            return ;;
+        -t|--template)
+            COMPREPLY=( $(compgen -W "$(task-cli __complete templates 2>/dev/null)" -- "$cur") )
+            return ;;
+    esac
+
+    case "$cmd" in
+        complete|delete|update)
+            if [[ "$cur" != -* ]]; then
+                COMPREPLY=( $(compgen -W "$(task-cli __complete ids 2>/dev/null)" -- "$cur") )
+            fi ;;
+    esac
+}
+complete -F _task_cli_complete task-cli task
+'''
+
+ZSH_SCRIPT = r'''#compdef task-cli task
+# task-cli zsh completion
+# Add to ~/.zshrc:  eval "$(task-cli completion zsh)"
+_task_cli() {
+    local -a commands candidates
+
+    if (( CURRENT == 2 )); then
+        commands=(%(commands)s)
+        compadd -a commands
+        return
+    fi
+
+    case "${words[CURRENT-1]}" in
+        -c|--category)
+            candidates=(${(f)"$(task-cli __complete categories 2>/dev/null)"})
+            compadd -a candidates
+            return ;;
+        -t|--template)
+            candidates=(${(f)"$(task-cli __complete templates 2>/dev/null)"})
+            compadd -a candidates
+            return ;;
+    esac
+
+    case "${words[2]}" in
+        complete|delete|update)
+            if [[ "${words[CURRENT]}" != -* ]]; then
+                candidates=(${(f)"$(task-cli __complete ids --describe 2>/dev/null)"})
+                _describe -t tasks 'task' candidates
+            fi ;;
+    esac
+}
+compdef _task_cli task-cli task
+'''
+
+def completion_script(shell):
+    """Return the completion script for bash or zsh"""
+    scripts = {"bash": BASH_SCRIPT, "zsh": ZSH_SCRIPT}
+    if shell not in scripts:
+        raise ValueError(f"Unsupported shell '{shell}' (choose from bash, zsh)")
+    # The bash script splits word lists on newlines only (IFS=$'\n'), so
+    # descriptions with spaces stay whole; zsh takes an array literal
+    separator = "\n" if shell == "bash" else " "
+    return scripts[shell] % {"commands": separator.join(COMMANDS)}
+
+def complete_main(argv):
+    """Answer 'task-cli __complete KIND [--describe]', returning the exit status
+
+    Prints one candidate per line. With --describe, IDs are printed as
+    "id:description" for shells that can show descriptions.
+    """
+    if not argv or argv[0] not in COMPLETION_KINDS:
+        return 2
+
+    describe = "--describe" in argv[1:]
+    candidates = get_candidates(argv[0])
+
+    lines = []
+    for candidate in candidates:
+        if argv[0] == "ids":
+            task_id, description = candidate
+            if describe:
+                # zsh's _describe treats ':' as the value/description separator
+                lines.append(f"{task_id}:" + description.replace(":", "\\:"))
+            else:
+                lines.append(str(task_id))
+        else:
+            lines.append(candidate)
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+    return 0
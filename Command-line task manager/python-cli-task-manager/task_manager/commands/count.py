@@ -0,0 +1,60 @@
+"""
+Count command for Task Manager
+
+'task-cli count' is meant for shell prompts and status bars, so it reads
+only the summary sidecar maintained by the storage layer and parses its
+own arguments instead of importing argparse.
+
+    task-cli count                   Active: 12 | Overdue: 2 | Today: 1 | Week: 4
+    task-cli count --bucket overdue  2
+"""
+
+import sys
+from task_manager.utils.summary import BUCKETS, bucket_counts, load_summary
+
+USAGE = (
+    "usage: task-cli count [--bucket BUCKET]\n\n"
+    "Print task counts from the summary file without loading the task store.\n\n"
+    f"buckets: {', '.join(BUCKETS)}"
+)
+
+def count_tasks(bucket=None):
+    """Return the count for one bucket, or a dict of all bucket counts"""
+    counts = bucket_counts(load_summary())
+    if bucket is None:
+        return counts
+    if bucket not in counts:
+        raise ValueError(f"Unknown bucket '{bucket}' (choose from {', '.join(BUCKETS)})")
+    return counts[bucket]
+
+def format_counts(result, bucket=None):
+    """Format count_tasks() output as printed by 'task-cli count'"""
+    if bucket is not None:
+        return str(result)
+    return (f"Active: {result['active']} | Overdue: {result['overdue']} | "
+            f"Today: {result['today']} | Week: {result['week']}")
+
+def main(argv=None):
+    """Entry point for the count fast path, returning the exit status"""
+    argv = sys.argv[2:] if argv is None else argv
+
+    bucket = None
+    if argv and argv[0] in ("-h", "--help"):
+        print(USAGE)
+        return 0
+    if len(argv) == 2 and argv[0] in ("-b", "--bucket"):
+        bucket = argv[1]
+    elif len(argv) == 1 and argv[0].startswith("--bucket="):
+        bucket = argv[0].split("=", 1)[1]
+    elif argv:
+        print(USAGE, file=sys.stderr)
+        return 2
+
+    try:
+        result = count_tasks(bucket)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    print(format_counts(result, bucket))
+    return 0
@@ -3,6 +3,8 @@ Delete task command for Task Manager
 """
 
 from task_manager.utils.storage import load_tasks, save_tasks
+from task_manager.utils.repository import using_repository
+from task_manager.utils.query import build_selector
 
 def delete_task(task_id):
     """Delete a task"""
@@ -19,4 +21,37 @@ def delete_task(task_id):
             return True
 
     # Task not found
-    raise ValueError(f"Task with ID {task_id} not found")
\ No newline at end of file
+    raise ValueError(f"Task with ID {task_id} not found")
+
+def delete_tasks(task_ids=None, where=None, repo=None):
+    """Delete every selected task with one load and one save
+
+    Args:
+        task_ids: ID tokens such as ["1", "2", "5-40"]
+        where: Filter expression such as "status:completed cat:old"
+        repo: Optional TaskRepository to work on instead of the saved store
+
+    Returns:
+        tuple: (number of tasks deleted, descriptions of requested IDs not found,
+                sorted listed IDs whose task did not match --where)
+    """
+    selector, ids = build_selector(task_ids, where)
+
+    kept = []
+    found = set()
+    present = set()
+    with using_repository(repo) as repo:
+        for task in repo.tasks:
+            if task.id in ids:
+                present.add(task.id)
+            if selector(task):
+                found.add(task.id)
+            else:
+                kept.append(task)
+
+        if found:
+            # Replace in place so other holders of the list see the deletion
+            repo.tasks[:] = kept
+            repo.mark_dirty()
+
+    return len(found), ids.missing(present), ids.unmatched(present, found)
@@ -3,148 +3,375 @@ List tasks command for Task Manager
 """
 
 from task_manager.utils.storage import load_tasks
+from task_manager.utils.recurrence import occurs_between, describe_rule, parse_date
 import datetime
+import heapq
+import itertools
 import os
 import sys
 
-def list_tasks(status="all", priority="all", due=None, category=None, sort_by=None):
-    """List tasks with optional filtering and sorting"""
-    tasks = load_tasks()
-
-    # Filter by status
-    if status == "active":
-        tasks = [t for t in tasks if not t.completed]
-    elif status == "completed":
-        tasks = [t for t in tasks if t.completed]
-
-    # Filter by priority
-    if priority != "all":
-        tasks = [t for t in tasks if getattr(t, 'priority', 'Medium') == priority]
-
-    # Filter by due date
-    if due == "today":
-        today = datetime.date.today()
-        tasks = [t for t in tasks if t.due_date and
-                datetime.datetime.strptime(t.due_date, "%Y-%m-%d").date() == today]
-    elif due == "week":
-        today = datetime.date.today()
-        end_date = today + datetime.timedelta(days=7)
-        tasks = [t for t in tasks if t.due_date and
-                today <= datetime.datetime.strptime(t.due_date, "%Y-%m-%d").date() <= end_date]
-    elif due == "overdue":
-        today = datetime.date.today()
-        tasks = [t for t in tasks if t.due_date and
-                datetime.datetime.strptime(t.due_date, "%Y-%m-%d").date() < today]
-
-    # Filter by category
-    if category:
-        tasks = [t for t in tasks if hasattr(t, 'category') and t.category == category]
-
-    # Sort tasks
+# Default page size used with --page when no --limit is given
+DEFAULT_PAGE_SIZE = 50
+
+# Number of rows sampled to size the variable-width columns
+WIDTH_SAMPLE_ROWS = 50
+
+HEADERS = ["ID", "Description", "Priority", "Due Date", "Status", "Progress", "Category"]
+
+# Fixed widths for columns whose content is bounded; None means "sampled"
+FIXED_WIDTHS = [7, None, 8, 20, 6, 8, None]
+
+# Upper bounds for the sampled columns so one long value can't blow up the table
+MAX_WIDTHS = [7, 60, 8, 20, 6, 8, 20]
+
+# Seconds between settings checks while watching
+SETTINGS_RECHECK_INTERVAL = 2.0
+
+RESET = "\033[0m"
+
+# ANSI colour prefixes per row style, built once instead of per cell
+STYLE_COLORS = {
+    "completed": "\033[90m",  # Gray for completed tasks
+    "High": "\033[91m",       # Red for high priority
+    "Medium": "\033[94m",     # Blue for medium priority
+    "Low": "\033[92m",        # Green for low priority
+    "overdue": "\033[91m",
+}
+
+def _due_between(task, due_date, start, end):
+    """Check the due date, or for a recurring task any later occurrence, against a window"""
+    if start <= due_date <= end:
+        return True
+    rule = getattr(task, 'recurrence', None)
+    # Occurrences are generated lazily from the current one, only as far as the window
+    return bool(rule) and due_date < start and occurs_between(rule, due_date, start, end)
+
+def iter_tasks(tasks, status="all", priority="all", due=None, category=None):
+    """Lazily yield the tasks that match the given filters"""
+    today = datetime.date.today()
+    end_date = today + datetime.timedelta(days=7)
+
+    for task in tasks:
+        if status == "active" and task.completed:
+            continue
+        if status == "completed" and not task.completed:
+            continue
+
+        if priority != "all" and getattr(task, 'priority', 'Medium') != priority:
+            continue
+
+        if due:
+            due_date = parse_date(getattr(task, 'due_date', None))
+            if due_date is None:
+                continue
+            if due == "today" and not _due_between(task, due_date, today, today):
+                continue
+            if due == "week" and not _due_between(task, due_date, today, end_date):
+                continue
+            if due == "overdue" and due_date >= today:
+                continue
+
+        if category and getattr(task, 'category', None) != category:
+            continue
+
+        yield task
+
+def _sort_key(sort_by):
+    """Return the key function for a sort order"""
     if sort_by == "priority":
         priority_order = {"High": 0, "Medium": 1, "Low": 2}
-        tasks.sort(key=lambda t: priority_order.get(getattr(t, 'priority', 'Medium'), 1))
-    elif sort_by == "due":
+        return lambda t: (priority_order.get(getattr(t, 'priority', 'Medium'), 1), t.id)
+    if sort_by == "due":
         # Sort by due date, with None values at the end
-        tasks.sort(key=lambda t: datetime.datetime.strptime(t.due_date, "%Y-%m-%d").date() if t.due_date else datetime.date.max)
+        return lambda t: (parse_date(getattr(t, 'due_date', None)) or datetime.date.max, t.id)
+    return lambda t: t.id
+
+def _is_sorted_by_id(tasks):
+    """Check whether the stored list is already in ID order (the usual case)"""
+    return all(a.id < b.id for a, b in zip(tasks, itertools.islice(tasks, 1, None)))
+
+def page_window(limit=None, offset=0, page=None):
+    """Translate --limit/--offset/--page into an (offset, limit) pair
+
+    Raises ValueError for a negative limit or offset, or a page below 1.
+    """
+    offset = offset or 0
+    if limit is not None and limit < 0:
+        raise ValueError(f"limit must be 0 or more, not {limit}")
+    if offset < 0:
+        raise ValueError(f"offset must be 0 or more, not {offset}")
+    if page is not None:
+        if page < 1:
+            raise ValueError(f"page must be 1 or more, not {page}")
+        limit = limit or DEFAULT_PAGE_SIZE
+        offset += (page - 1) * limit
+    return offset, limit
+
+def count_tasks(tasks, status="all", priority="all", due=None, category=None):
+    """Count matching tasks, returning (total, completed)"""
+    total = completed = 0
+    for task in iter_tasks(tasks, status, priority, due, category):
+        total += 1
+        if task.completed:
+            completed += 1
+    return total, completed
+
+def select_tasks(tasks, status="all", priority="all", due=None, category=None,
+                 sort_by=None, limit=None, offset=0, id_sorted=None):
+    """Return an iterator over the requested window of matching tasks
+
+    When the store is already in ID order the matches are streamed without
+    sorting; otherwise only the first offset + limit tasks are kept in a heap.
+    Pass id_sorted when the caller already knows whether tasks are in ID order.
+    """
+    matches = iter_tasks(tasks, status, priority, due, category)
+
+    if id_sorted is None:
+        id_sorted = sort_by in (None, "id") and _is_sorted_by_id(tasks)
+
+    if sort_by in (None, "id") and id_sorted:
+        ordered = matches
+    elif limit is not None:
+        ordered = iter(heapq.nsmallest(offset + limit, matches, key=_sort_key(sort_by)))
     else:
-        # Default sort by ID
-        tasks.sort(key=lambda t: t.id)
+        ordered = iter(sorted(matches, key=_sort_key(sort_by)))
 
-    if not tasks:
-        print("No tasks found.")
-        return
+    stop = offset + limit if limit is not None else None
+    return itertools.islice(ordered, offset, stop)
 
-    # Try to import tabulate for nicer output
-    try:
-        from tabulate import tabulate
-        use_tabulate = True
-    except ImportError:
-        use_tabulate = False
+def colors_enabled(stream=None):
+    """Colour output needs a terminal (not Windows) and the cli.show_colors setting"""
+    stream = stream or sys.stdout
+    if not stream.isatty() or os.name == 'nt':
+        return False
+    from task_manager.utils.settings import get_settings
+    return get_settings()['cli'].get('show_colors', True)
 
-    # Check if color output is possible
-    use_colors = sys.stdout.isatty() and os.name != 'nt'
+class StreamingTable:
+    """Render task rows one at a time with precomputed column widths"""
 
-    # Prepare data for display
-    headers = ["ID", "Description", "Priority", "Due Date", "Status", "Progress", "Category"]
-    rows = []
+    def __init__(self, use_colors=False, stream=None):
+        self.use_colors = use_colors
+        self.stream = stream or sys.stdout
+        self.today = datetime.date.today()
+        self.measure([])
 
-    for task in tasks:
-        status_text = "✓" if task.completed else " "
+    def measure(self, sample_rows):
+        """Size the variable columns from a small sample of rows"""
+        widths = []
+        for index, header in enumerate(HEADERS):
+            width = FIXED_WIDTHS[index]
+            if width is None:
+                width = max([len(header)] + [len(str(row[index])) for row in sample_rows])
+            widths.append(min(max(width, len(header)), MAX_WIDTHS[index]))
+        self.widths = widths
+        self.separator = "-+-".join("-" * w for w in widths)
+
+    def row_for(self, task):
+        """Build the plain (uncoloured) cell values for a task"""
         due_date = getattr(task, 'due_date', '') or ''
-        priority_text = getattr(task, 'priority', 'Medium')
-        category = getattr(task, 'category', '') or ''
-        progress = f"{getattr(task, 'progress', 0)}%"
-
-        if use_colors:
-            # ANSI color codes
-            reset = "\033[0m"
-
-            if task.completed:
-                color = "\033[90m"  # Gray for completed tasks
-            elif priority_text == "High":
-                color = "\033[91m"  # Red for high priority
-            elif priority_text == "Medium":
-                color = "\033[94m"  # Blue for medium priority
-            elif priority_text == "Low":
-                color = "\033[92m"  # Green for low priority
-            else:
-                color = ""
-
-            description = f"{color}{task.description}{reset}"
-            status_text = f"{color}{status_text}{reset}"
-            priority_text = f"{color}{priority_text}{reset}"
-        else:
-            description = task.description
-
-        # Check if task is overdue
         if due_date and not task.completed:
-            try:
-                due_date_obj = datetime.datetime.strptime(due_date, "%Y-%m-%d").date()
-                if due_date_obj < datetime.date.today():
-                    if use_colors:
-                        due_date = f"\033[91m{due_date} (OVERDUE)\033[0m"
-                    else:
-                        due_date = f"{due_date} (OVERDUE)"
-            except ValueError:
-                pass
-
-        row = [
+            due_date_obj = parse_date(due_date)
+            if due_date_obj and due_date_obj < self.today:
+                due_date = f"{due_date} (OVERDUE)"
+
+        description = task.description
+        if getattr(task, 'recurrence', None):
+            description = f"{description} (repeats {describe_rule(task.recurrence)})"
+
+        return [
             task.id,
             description,
-            priority_text,
+            getattr(task, 'priority', 'Medium'),
             due_date,
-            status_text,
-            progress,
-            category
+            "✓" if task.completed else " ",
+            f"{getattr(task, 'progress', 0)}%",
+            getattr(task, 'category', '') or ''
         ]
-        rows.append(row)
 
-    # Display table
-    if use_tabulate:
-        print(tabulate(rows, headers=headers, tablefmt="pretty"))
+    def _fit(self, value, width):
+        """Pad or truncate a cell to the column width"""
+        text = str(value)
+        if len(text) > width:
+            return text[:width - 1] + "…"
+        return text.ljust(width)
+
+    def print_header(self):
+        self.stream.write(" | ".join(self._fit(h, w) for h, w in zip(HEADERS, self.widths)) + "\n")
+        self.stream.write(self.separator + "\n")
+
+    def print_row(self, task, row=None):
+        row = row or self.row_for(task)
+        cells = [self._fit(value, width) for value, width in zip(row, self.widths)]
+
+        if self.use_colors:
+            priority = getattr(task, 'priority', 'Medium')
+            color = STYLE_COLORS["completed"] if task.completed else STYLE_COLORS.get(priority, "")
+            if color:
+                for index in (1, 2, 4):  # Description, priority and status
+                    cells[index] = f"{color}{cells[index]}{RESET}"
+            if row[3].endswith("(OVERDUE)"):
+                cells[3] = f"{STYLE_COLORS['overdue']}{cells[3]}{RESET}"
+
+        self.stream.write(" | ".join(cells) + "\n")
+
+def list_tasks(status="all", priority="all", due=None, category=None, sort_by=None,
+               limit=None, offset=0, page=None, output_format="table", repo=None):
+    """List tasks with optional filtering, sorting and pagination
+
+    Rows are written as they are produced, so the first screen appears
+    without formatting (or even sorting, in the common ID order case) the
+    whole result set. Returns the tasks that were displayed, or the number
+    of records written for the jsonl/csv/tsv formats.
+    """
+    offset, limit = page_window(limit, offset, page)
+    filters = (status, priority, due, category)
+
+    if repo is not None:
+        # A warm repository caches the ID-order check and summary counts
+        tasks = repo.tasks
+        id_sorted = repo.cached("id_sorted", lambda: _is_sorted_by_id(tasks))
+        get_counts = lambda: repo.cached(("counts", datetime.date.today()) + filters,
+                                         lambda: count_tasks(tasks, *filters))
     else:
-        # Simple table format for systems without tabulate
-        # Print headers
-        header_str = " | ".join(headers)
-        print(header_str)
-        print("-" * len(header_str))
-
-        # Print rows
-        for row in rows:
-            print(" | ".join(str(cell) for cell in row))
-
-    # Print summary
-    total = len(tasks)
-    completed = sum(1 for t in tasks if t.completed)
+        tasks = load_tasks()
+        id_sorted = None
+        get_counts = lambda: count_tasks(tasks, *filters)
+
+    selected = select_tasks(tasks, status, priority, due, category, sort_by,
+                            limit, offset, id_sorted=id_sorted)
+
+    if output_format != "table":
+        from task_manager.utils.import_export import stream_records
+        return stream_records(selected, output_format)
+
+    use_colors = colors_enabled()
+
+    # Pull a small sample to size the columns, then stream the rest
+    sample_tasks = list(itertools.islice(selected, WIDTH_SAMPLE_ROWS))
+    if not sample_tasks:
+        print("No tasks found.")
+        return []
+
+    table = StreamingTable(use_colors=use_colors)
+    sample_rows = [table.row_for(t) for t in sample_tasks]
+    table.measure(sample_rows)
+
+    table.print_header()
+    shown = []
+    for task, row in zip(sample_tasks, sample_rows):
+        table.print_row(task, row)
+        shown.append(task)
+    for task in selected:
+        table.print_row(task)
+        shown.append(task)
+    sys.stdout.flush()
+
+    # Print summary over every match, not just the displayed page
+    total, completed = get_counts()
     active = total - completed
 
-    print(f"\nTotal: {total} tasks | Active: {active} | Completed: {completed}")
+    summary = f"\nTotal: {total} tasks | Active: {active} | Completed: {completed}"
+    if limit is not None or offset:
+        summary += f" | Showing: {offset + 1}-{offset + len(shown)}"
+    print(summary)
+
+    return shown
+
+def render_lines(tasks, status="all", priority="all", due=None, sort_by=None, limit=None,
+                 offset=0, use_colors=False):
+    """Render the table for a window of tasks as a list of lines (no trailing newlines)"""
+    import io
+
+    selected = list(select_tasks(tasks, status, priority, due, sort_by=sort_by,
+                                 limit=limit, offset=offset))
+    if not selected:
+        return ["No tasks found."]
+
+    buffer = io.StringIO()
+    table = StreamingTable(use_colors=use_colors, stream=buffer)
+    rows = [table.row_for(t) for t in selected[:WIDTH_SAMPLE_ROWS]]
+    table.measure(rows)
+    table.print_header()
+    for task in selected:
+        table.print_row(task)
+
+    total, completed = count_tasks(tasks, status, priority, due)
+    summary = f"Total: {total} tasks | Active: {total - completed} | Completed: {completed}"
+    if limit is not None or offset:
+        summary += f" | Showing: {offset + 1}-{offset + len(selected)}"
+    return buffer.getvalue().splitlines() + ["", summary]
+
+def _redraw(previous, lines, stream):
+    """Rewrite only the screen lines that differ from the previous frame"""
+    output = []
+    for index, line in enumerate(lines):
+        if index >= len(previous) or previous[index] != line:
+            output.append(f"\033[{index + 1};1H{line}\033[K")
+    for index in range(len(lines), len(previous)):
+        output.append(f"\033[{index + 1};1H\033[K")
+    # Park the cursor below the table
+    output.append(f"\033[{len(lines) + 1};1H")
+    stream.write("".join(output))
+    stream.flush()
+
+def watch_tasks(status="all", priority="all", due=None, sort_by=None, limit=None, offset=0,
+                page=None, watcher=None, stream=None):
+    """Keep a live list on screen, re-rendering only when the store changes
+
+    The store is re-read after each change notification, and on a terminal
+    only the lines that differ from what is on screen are redrawn. When
+    output is not a terminal, each changed view is printed in full.
+    """
+    from task_manager.utils.watch import StoreWatcher
+    from task_manager.utils.settings import settings_service
+
+    stream = stream or sys.stdout
+    interactive = stream.isatty()
+
+    offset, limit = page_window(limit, offset, page)
+    if limit is None and interactive:
+        # Fit the window to the terminal: title, header, separator, blank, summary, prompt
+        import shutil
+        limit = max(shutil.get_terminal_size().lines - 6, 1)
+
+    watcher = watcher or StoreWatcher()
+    title = f"Watching tasks ({watcher.mode}) - press Ctrl+C to stop"
+    previous = None
+
+    if interactive:
+        # Disable line wrapping so each table row stays on one screen line
+        stream.write("\033[?7l\033[H\033[2J")
+
+    try:
+        while True:
+            lines = [title] + render_lines(load_tasks(), status, priority, due, sort_by,
+                                           limit, offset, colors_enabled(stream))
+            if lines != previous:
+                if not interactive:
+                    stream.write("\n".join(lines) + "\n\n")
+                    stream.flush()
+                else:
+                    _redraw(previous or [], lines, stream)
+                previous = lines
 
-    return tasks
+            if not interactive:
+                watcher.wait()
+                continue
+            # Wake now and then so a changed cli.show_colors setting is applied
+            while not watcher.wait(timeout=SETTINGS_RECHECK_INTERVAL):
+                if settings_service.refresh():
+                    break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+        if interactive:
+            stream.write("\033[?7h\n")
+            stream.flush()
 
 def main():
     list_tasks()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,49 @@
+"""
+Update task command for Task Manager
+"""
+
+from task_manager.utils.repository import using_repository
+from task_manager.utils.query import build_selector, parse_assignments
+
+def update_tasks(assignments, task_ids=None, where=None, repo=None):
+    """Apply field=value changes to every selected task with one load and one save
+
+    Args:
+        assignments: Changes such as ["priority=High", "cat=work"]
+        task_ids: ID tokens such as ["1", "2", "5-40"]
+        where: Filter expression such as "status:active due:overdue"
+        repo: Optional TaskRepository to work on instead of the saved store
+
+    Returns:
+        tuple: (number of tasks updated, descriptions of requested IDs not found,
+                sorted listed IDs whose task did not match --where)
+    """
+    changes = parse_assignments(assignments)
+    if not changes:
+        raise ValueError("Nothing to update (use --set field=value)")
+
+    selector, ids = build_selector(task_ids, where)
+
+    count = 0
+    found = set()
+    present = set()
+    with using_repository(repo) as repo:
+        for task in repo.tasks:
+            if task.id in ids:
+                present.add(task.id)
+            if selector(task):
+                found.add(task.id)
+                for field, value in changes.items():
+                    if field == 'recurrence':
+                        task.set_recurrence(value)
+                    elif field == 'completed' and value and not task.completed:
+                        # A recurring task moves on to its next occurrence instead
+                        task.mark_complete()
+                    else:
+                        setattr(task, field, value)
+                count += 1
+
+        if count:
+            repo.mark_dirty()
+
+    return count, ids.missing(present), ids.unmatched(present, found)
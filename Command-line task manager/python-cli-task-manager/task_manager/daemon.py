@@ -0,0 +1,262 @@
+"""
+Task Manager daemon
+
+task-daemon keeps the task store loaded in memory and serves task-cli
+commands over a Unix domain socket in the storage directory. The client
+side, used by task-cli, lives in daemon_client.py so that it can be
+imported without the server's dependencies.
+
+Write commands are group-committed: a committer thread saves the store
+once for all writes that arrived during a short window, and each client
+gets its reply only after the save that covers its change.
+"""
+
+import os
+import sys
+import socket
+import logging
+import threading
+import time
+from task_manager.daemon_client import (
+    DAEMON_COMMANDS, get_socket_path, send_frame, recv_frame, send_control
+)
+
+logger = logging.getLogger(__name__)
+
+# Seconds the committer waits to gather concurrent writes into one save
+GROUP_COMMIT_WINDOW = 0.005
+
+# Output is sent to the client in frames of about this many characters
+OUTPUT_FRAME_SIZE = 64 * 1024
+
+class _FrameWriter:
+    """File-like object that forwards written text to a client as frames"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = []
+        self.size = 0
+
+    def write(self, text):
+        self.buffer.append(text)
+        self.size += len(text)
+        if self.size >= OUTPUT_FRAME_SIZE:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self.buffer:
+            send_frame(self.sock, {"out": "".join(self.buffer)})
+            self.buffer = []
+            self.size = 0
+
+    def isatty(self):
+        return False
+
+class TaskDaemon:
+    """Serve task-cli commands from a warm in-memory repository"""
+
+    def __init__(self, socket_path=None):
+        from task_manager.main import build_parser
+        from task_manager.utils.repository import TaskRepository
+
+        self.socket_path = socket_path or get_socket_path()
+        self.parser = build_parser()
+        self.repo = TaskRepository()
+        self.command_lock = threading.Lock()
+        self.commit_cond = threading.Condition()
+        self.write_seq = 0
+        self.committed_seq = 0
+        self.running = False
+        self.server = None
+
+    def execute(self, argv, writer):
+        """Run one command with its output sent to writer, returning the exit status"""
+        from contextlib import redirect_stdout, redirect_stderr
+        from task_manager.main import run_command, print_banner
+
+        with self.command_lock, redirect_stdout(writer), redirect_stderr(writer):
+            try:
+                args = self.parser.parse_args(argv)
+            except SystemExit as e:
+                return e.code or 0
+
+            if args.command not in DAEMON_COMMANDS:
+                print(f"Error: '{args.command}' is not served by the daemon")
+                return 2
+
+            if getattr(args, "format", "table") == "table":
+                print_banner()
+
+            self.repo.refresh_if_changed()
+            generation = self.repo.generation
+            status = 0
+            try:
+                run_command(args, self.parser, repo=self.repo)
+            except SystemExit as e:
+                status = e.code or 0
+            except BrokenPipeError:
+                # The client went away mid-output; there is no one left to tell
+                status = 1
+            except Exception as e:
+                print(f"Error: {str(e)}")
+                status = 1
+
+            changed = self.repo.generation != generation
+
+        if changed:
+            self.wait_for_commit()
+        return status
+
+    def wait_for_commit(self):
+        """Register a write and block until a group commit has saved it"""
+        with self.commit_cond:
+            self.write_seq += 1
+            seq = self.write_seq
+            self.commit_cond.notify_all()
+            while self.committed_seq < seq and self.running:
+                self.commit_cond.wait()
+
+    def _committer_loop(self):
+        """Save the store once per group of writes"""
+        while True:
+            with self.commit_cond:
+                while self.running and self.write_seq == self.committed_seq:
+                    self.commit_cond.wait()
+                if not self.running and self.write_seq == self.committed_seq:
+                    return
+
+            # Let concurrent writers join this commit
+            time.sleep(GROUP_COMMIT_WINDOW)
+
+            with self.commit_cond:
+                target = self.write_seq
+            with self.command_lock:
+                try:
+                    self.repo.commit()
+                except Exception as e:
+                    logger.error(f"Error saving tasks: {e}")
+            with self.commit_cond:
+                self.committed_seq = target
+                self.commit_cond.notify_all()
+
+    def _make_handler(self):
+        import socketserver
+        daemon = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                try:
+                    message = recv_frame(self.request)
+                    if not message:
+                        return
+                    if message.get("control") == "shutdown":
+                        send_frame(self.request, {"exit": 0})
+                        threading.Thread(target=daemon.shutdown, daemon=True).start()
+                        return
+                    if message.get("control") == "ping":
+                        send_frame(self.request, {"exit": 0})
+                        return
+
+                    writer = _FrameWriter(self.request)
+                    status = daemon.execute(message.get("argv", []), writer)
+                    writer.flush()
+                    send_frame(self.request, {"exit": status})
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+
+        return Handler
+
+    def _remove_stale_socket(self):
+        """Remove a socket file left behind by a daemon that is no longer running"""
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+        else:
+            raise RuntimeError(f"A task daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def serve_forever(self):
+        """Bind the socket and serve until shutdown"""
+        import socketserver
+
+        os.makedirs(os.path.dirname(self.socket_path), exist_ok=True)
+        self._remove_stale_socket()
+
+        self.server = socketserver.ThreadingUnixStreamServer(self.socket_path, self._make_handler())
+        self.server.daemon_threads = True
+        os.chmod(self.socket_path, 0o600)
+
+        self.running = True
+        committer = threading.Thread(target=self._committer_loop, daemon=True)
+        committer.start()
+
+        logger.info(f"Task daemon listening on {self.socket_path}")
+        try:
+            self.server.serve_forever()
+        finally:
+            with self.commit_cond:
+                self.running = False
+                self.commit_cond.notify_all()
+            committer.join()
+            self.repo.flush()
+            self.server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            logger.info("Task daemon stopped")
+
+    def shutdown(self):
+        """Stop serving; pending writes are saved before the daemon exits"""
+        if self.server is not None:
+            self.server.shutdown()
+
+def main():
+    """Entry point for task-daemon"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="task-daemon",
+        description="Keep the task store warm and serve task-cli over a Unix socket"
+    )
+    parser.add_argument("action", nargs="?", choices=["start", "stop", "status"], default="start",
+                        help="start (default) runs the daemon in the foreground")
+    args = parser.parse_args()
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: the task daemon requires Unix domain sockets")
+        sys.exit(1)
+
+    if args.action == "stop":
+        print("Task daemon stopped" if send_control("shutdown") else "Task daemon is not running")
+        return
+
+    if args.action == "status":
+        running = send_control("ping")
+        print(f"Task daemon is {'running' if running else 'not running'} ({get_socket_path()})")
+        sys.exit(0 if running else 1)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    import signal
+    daemon = TaskDaemon()
+    # Let SIGTERM shut down cleanly so pending writes are flushed
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=daemon.shutdown).start())
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Client side of the Task Manager daemon
+
+task-cli uses this module to hand commands to a running task-daemon. It
+only imports what talking to the socket needs, so trying the daemon
+costs next to nothing when it isn't running.
+
+Protocol: every message is a frame made of a 4-byte big-endian length
+followed by that many bytes of UTF-8 JSON.
+
+    request:   {"argv": ["list", "-s", "active"]}
+    response:  zero or more {"out": "..."} frames, then {"exit": 0}
+"""
+
+import os
+import sys
+
+# json, socket and struct are imported inside the functions that use them,
+# so a task-cli run with no daemon socket present doesn't pay for them.
+
+# Commands the daemon can serve; everything else runs in direct mode
+DAEMON_COMMANDS = ("add", "list", "complete", "delete", "update")
+
+# Frame header: payload length as a 4-byte big-endian unsigned int
+_HEADER_FORMAT = ">I"
+_HEADER_SIZE = 4
+
+def get_socket_path():
+    """Get the path of the daemon's Unix socket"""
+    from task_manager.utils.storage import get_storage_directory
+    return os.path.join(get_storage_directory(), "daemon.sock")
+
+def send_frame(sock, message):
+    """Send one length-prefixed JSON frame"""
+    import json
+    import struct
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    sock.sendall(struct.pack(_HEADER_FORMAT, len(payload)) + payload)
+
+def _recv_exact(sock, size):
+    """Read exactly size bytes, returning None if the peer closed first"""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+def recv_frame(sock):
+    """Receive one frame, returning None at end of stream"""
+    import json
+    import struct
+    header = _recv_exact(sock, _HEADER_SIZE)
+    if header is None:
+        return None
+    payload = _recv_exact(sock, struct.unpack(_HEADER_FORMAT, header)[0])
+    if payload is None:
+        return None
+    return json.loads(payload.decode("utf-8"))
+
+def call(argv, stream=None):
+    """Run a task-cli command through the daemon
+
+    Returns the command's exit status, or None if no daemon is reachable
+    (in which case nothing has been executed and the caller should fall
+    back to direct mode).
+    """
+    if os.environ.get("TASK_CLI_NO_DAEMON"):
+        return None
+
+    socket_path = get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+
+    import socket
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    stream = stream or sys.stdout
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            return None
+
+        send_frame(sock, {"argv": list(argv)})
+        while True:
+            message = recv_frame(sock)
+            if message is None:
+                print("Error: task daemon closed the connection", file=sys.stderr)
+                return 1
+            if "out" in message:
+                stream.write(message["out"])
+                stream.flush()
+            elif "exit" in message:
+                return message["exit"]
+    finally:
+        sock.close()
+
+def send_control(command):
+    """Send a control message to a running daemon, returning False if none answered"""
+    import socket
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(get_socket_path())
+        send_frame(sock, {"control": command})
+        return recv_frame(sock) is not None
+    except OSError:
+        return False
+    finally:
+        sock.close()
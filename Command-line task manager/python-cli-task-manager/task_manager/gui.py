@@ -9,18 +9,23 @@ import time
 import threading  # Used elsewhere in the code
 import platform
 import os  # Used elsewhere in the code
+import copy
 from task_manager.utils.storage import load_tasks, save_tasks
-from task_manager.utils.notifications import show_notification, start_reminder_service  # Used elsewhere
+from task_manager.utils.repository import TaskRepository
+from task_manager.utils.notifications import show_notification, start_reminder_service, reminder_service  # Used elsewhere
 from task_manager.models.task import Task
 import tkinter.colorchooser as colorchooser
-from task_manager.utils.settings import load_settings, save_settings, DEFAULT_SETTINGS, get_color  # Used elsewhere
+from task_manager.utils.settings import (  # Used elsewhere
+    load_settings, save_settings, DEFAULT_SETTINGS, get_color, settings_service, subscribe_settings
+)
 from task_manager.utils.import_export import import_from_json, import_from_csv, export_to_json, export_to_csv  # Used elsewhere
 from task_manager.ai_interface import show_ai_assistant
 
 # Import the split gui methods
 from task_manager.gui_parts import (
-    create_task_list, on_task_select, select_all_tasks, deselect_all_tasks,
-    refresh_task_list, matches_filters, delete_task, get_selected_task,
+    create_filter_bar, create_task_list, on_task_select, select_all_tasks, deselect_all_tasks,
+    refresh_task_list, show_task_rows, filter_snapshot, matches_filters, schedule_filter,
+    run_filter_query, poll_filter_results, delete_task, get_selected_task,
     on_task_double_click, create_context_menu, show_context_menu, add_custom_category
 )
 
@@ -29,6 +34,9 @@ APP_NAME = "Task Manager"
 VERSION = "1.0.0"
 COPYRIGHT = "© 2023 Task Manager Team"
 
+# Milliseconds between checks for settings changed by another process
+SETTINGS_POLL_MS = 2000
+
 # Make these functions available for import at the module level
 def launch_simple_gui():
     """Launch the simple GUI version of the Task Manager."""
@@ -822,17 +830,22 @@ class SimpleTaskManagerGUI:
         self.create_layout()
 
         # Initialize task list by loading existing tasks
-        self.tasks = load_tasks()
+        self.repo = TaskRepository()
+        self.tasks = self.repo.tasks
         self.refresh_task_list()
 
-        # Start reminder service
+        # Start the reminder service on our in-memory tasks rather than the saved store
+        reminder_service.attach(self.repo)
         self.reminder_thread = start_reminder_service()
 
         # Make the layout responsive to window resizing
         self.configure_responsive_layout()
 
-        # Load settings
+        # Load settings and follow changes made elsewhere (CLI, another window)
         self.settings = load_settings()
+        self._pending_settings = None
+        self._unsubscribe_settings = subscribe_settings(self.on_settings_changed)
+        self.root.after(SETTINGS_POLL_MS, self.poll_settings)
 
         # Setup auto-save
         self.setup_autosave()
@@ -1173,7 +1186,8 @@ class SimpleTaskManagerGUI:
         settings_btn.pack(side=tk.RIGHT, padx=(0, 5))
         Tooltip(settings_btn, "Configure application settings")
 
-        # Create the task list view
+        # Create the filter inputs and the task list view
+        self.create_filter_bar()
         self.create_task_list()
 
         # Add status bar
@@ -1341,7 +1355,7 @@ Context menu is available via right-click on any task.
                 self.tasks.append(new_task)
 
                 # Save and refresh
-                save_tasks(self.tasks)
+                self.save_changes(new_task)
                 self.refresh_task_list()
 
                 # Show success message
@@ -1421,12 +1435,18 @@ Context menu is available via right-click on any task.
         self.launch_interactive_cli()
 
     # Add the imported methods to the class
+    create_filter_bar = create_filter_bar
     create_task_list = create_task_list
     on_task_select = on_task_select
     select_all_tasks = select_all_tasks
     deselect_all_tasks = deselect_all_tasks
     refresh_task_list = refresh_task_list
+    show_task_rows = show_task_rows
+    filter_snapshot = filter_snapshot
     matches_filters = matches_filters
+    schedule_filter = schedule_filter
+    run_filter_query = run_filter_query
+    poll_filter_results = poll_filter_results
     delete_task = delete_task
     get_selected_task = get_selected_task
     on_task_double_click = on_task_double_click
@@ -1451,7 +1471,7 @@ Context menu is available via right-click on any task.
                 setattr(task, key, value)
 
             # Save and refresh
-            save_tasks(self.tasks)
+            self.save_changes(task)
             self.refresh_task_list()
 
             # Show success message
@@ -1459,24 +1479,21 @@ Context menu is available via right-click on any task.
 
     def toggle_complete(self):
         """Toggle completion status of selected tasks"""
-        selected_items = self.task_tree.selection()
-        if not selected_items:
+        toggled = self.task_list.selected_tasks()
+        if not toggled:
             messagebox.showinfo("Info", "Please select a task to toggle completion")
             return
 
         # Toggle completion for all selected tasks
-        for item_id in selected_items:
-            task_id = int(self.task_tree.item(item_id, "values")[0])
-            task = next((t for t in self.tasks if t.id == task_id), None)
-
-            if task:
-                task.completed = not task.completed
-                # If completed, set progress to 100%
-                if task.completed:
-                    task.progress = 100
+        for task in toggled:
+            if task.completed:
+                task.completed = False
+            else:
+                # Sets progress to 100%, or moves a recurring task to its next occurrence
+                task.mark_complete()
 
         # Save and refresh
-        save_tasks(self.tasks)
+        self.save_changes(*toggled)
         self.refresh_task_list()
 
         # Show success message
@@ -1494,8 +1511,8 @@ Context menu is available via right-click on any task.
             # Set the reminder time
             task.set_reminder(date_dialog.result)
 
-            # Save and show success message
-            save_tasks(self.tasks)
+            # Save (which also reschedules it in the reminder service) and show success message
+            self.save_changes(task)
             messagebox.showinfo("Reminder Set",
                                f"Reminder set for {date_dialog.result.strftime('%Y-%m-%d %H:%M')}")
 
@@ -1525,7 +1542,7 @@ Context menu is available via right-click on any task.
             self.tasks.append(new_task)
 
             # Save and refresh
-            save_tasks(self.tasks)
+            self.save_changes(new_task)
             self.refresh_task_list()
 
             # Show success message
@@ -1539,7 +1556,7 @@ Context menu is available via right-click on any task.
             try:
                 imported_tasks = import_from_json(file_path)
                 self.tasks.extend(imported_tasks)
-                save_tasks(self.tasks)
+                self.save_changes(*imported_tasks)
                 self.refresh_task_list()
                 messagebox.showinfo("Success", f"Imported {len(imported_tasks)} tasks successfully.")
             except Exception as e:
@@ -1593,10 +1610,22 @@ For more information, visit our website or contact support.
         # Restart the timer
         self.start_autosave_timer()
 
+    def save_changes(self, *changed):
+        """Save the tasks, telling in-process observers which ones changed
+
+        With no tasks given (e.g. after deleting), observers such as the
+        reminder service resynchronize from a snapshot.
+        """
+        self.repo.mark_dirty(*changed)
+        self.repo.commit()
+
     def on_closing(self):
         """Handle window closing event"""
         if self.auto_save_timer:
             self.auto_save_timer.cancel()
+        self._unsubscribe_settings()
+        reminder_service.detach()
+        self.filter_worker.stop()
 
         # Save tasks before closing
         save_tasks(self.tasks)
@@ -1610,8 +1639,26 @@ For more information, visit our website or contact support.
         if dialog.result:
             self.settings.update(dialog.result)
             save_settings(self.settings)
+            # Already applied below; don't apply our own change again on the next poll
+            self._pending_settings = None
             self.apply_settings()
 
+    def on_settings_changed(self, settings):
+        """Settings subscriber; may run on any thread, so only record the change"""
+        self._pending_settings = settings
+
+    def poll_settings(self):
+        """Apply settings changed by another process (runs on the Tk thread)"""
+        try:
+            settings_service.refresh()
+            settings, self._pending_settings = self._pending_settings, None
+            if settings is not None:
+                self.settings = copy.deepcopy(settings)
+                self.apply_settings()
+        except Exception as e:
+            print(f"Error reloading settings: {e}")
+        self.root.after(SETTINGS_POLL_MS, self.poll_settings)
+
     def apply_settings(self):
         """Apply the updated settings to the application"""
         # Update auto-save interval if it was changed
@@ -1694,4 +1741,4 @@ For more information, visit our website or contact support.
 
 # Run the application if this is the main module
 if __name__ == "__main__":
-    launch_simple_gui())
\ No newline at end of file
+    launch_simple_gui()
\ No newline at end of file
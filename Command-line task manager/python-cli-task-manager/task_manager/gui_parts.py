@@ -5,8 +5,500 @@ This file contains methods that are imported by the main GUI module
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import bisect
 import datetime
-from task_manager.utils.storage import save_tasks
+import platform
+import queue
+import threading
+from task_manager.utils.recurrence import parse_date
+
+# Rows kept as Tk items above and below the ones in view, so short scrolls
+# and keyboard moves don't need the item window rebuilt
+OVERSCAN_ROWS = 20
+
+# Row height used if the Treeview style doesn't report one
+DEFAULT_ROW_HEIGHT = 20
+
+# Event state bits for Shift and for the "toggle selection" modifier
+SHIFT_MASK = 0x0001
+TOGGLE_MASK = 0x0008 if platform.system() == "Darwin" else 0x0004  # Command / Control
+
+# Keys the Treeview uses to move the selection
+NAVIGATION_KEYS = ("Up", "Down", "Home", "End", "Prior", "Next")
+
+PRIORITY_TAGS = {"High": "high", "Medium": "medium", "Low": "low"}
+
+# Choices offered by the filter bar
+STATUS_FILTERS = ("All", "Active", "Completed")
+PRIORITY_FILTERS = ("All", "High", "Medium", "Low")
+DUE_FILTERS = ("All", "Today", "This Week", "Overdue", "No Due Date")
+
+# Milliseconds to wait after the last change to a filter input before filtering
+FILTER_DELAY_MS = 250
+
+# Milliseconds between checks for results from the filter worker
+FILTER_POLL_MS = 20
+
+# Tasks the filter worker checks between looks for a newer query
+FILTER_CHECK_EVERY = 1000
+
+def task_row(task, index):
+    """Return the Treeview values and tags for a task shown at row index"""
+    priority = task.priority if hasattr(task, 'priority') else "Medium"
+    values = (
+        task.id,
+        task.description,
+        priority,
+        task.due_date if task.due_date else "",
+        "Completed" if task.completed else "Active",
+        f"{task.progress}%" if hasattr(task, 'progress') else "0%",
+        task.category if hasattr(task, 'category') and task.category else "",
+    )
+
+    # Alternate row colors, then add a tag for priority or status
+    tags = ['even_row' if index % 2 == 0 else 'odd_row']
+    if task.completed:
+        tags.append("completed")
+    elif priority in PRIORITY_TAGS:
+        tags.append(PRIORITY_TAGS[priority])
+    return values, tuple(tags)
+
+def _longest_increasing(sequence):
+    """Return the indices of a longest strictly increasing subsequence"""
+    tails = []          # Smallest last value of an increasing run of each length
+    tail_indices = []
+    previous = [None] * len(sequence)
+    for index, value in enumerate(sequence):
+        length = bisect.bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[length] = value
+            tail_indices[length] = index
+        previous[index] = tail_indices[length - 1] if length else None
+
+    result = set()
+    index = tail_indices[-1] if tail_indices else None
+    while index is not None:
+        result.add(index)
+        index = previous[index]
+    return result
+
+def update_tree_items(tree, old_rows, new_rows):
+    """Turn a Treeview's top-level items from old_rows into new_rows
+
+    Rows are (iid, values, tags) tuples in display order. Items that are no
+    longer shown are deleted and new ones inserted in place. Of the items
+    that stay, the longest run already in the right order is left alone
+    and only the others are moved, and item() is called only for rows whose
+    values or tags changed. Editing one task therefore costs one Tk call.
+    """
+    old_index = {row[0]: index for index, row in enumerate(old_rows)}
+    new_ids = {row[0] for row in new_rows}
+
+    deleted = [row[0] for row in old_rows if row[0] not in new_ids]
+    if deleted:
+        tree.delete(*deleted)
+
+    # Detach the kept items that are out of order; what's left is in new order
+    kept = [row[0] for row in new_rows if row[0] in old_index]
+    in_order = _longest_increasing([old_index[iid] for iid in kept])
+    displaced = [iid for index, iid in enumerate(kept) if index not in in_order]
+    if displaced:
+        tree.detach(*displaced)
+    displaced = set(displaced)
+
+    # Everything before position is in place, so inserting or reattaching
+    # there puts the item right after its new predecessor
+    for position, (iid, values, tags) in enumerate(new_rows):
+        if iid not in old_index:
+            tree.insert("", position, iid=iid, values=values, tags=tags)
+            continue
+        if iid in displaced:
+            tree.move(iid, "", position)
+        _, old_values, old_tags = old_rows[old_index[iid]]
+        if old_values != values or old_tags != tags:
+            tree.item(iid, values=values, tags=tags)
+
+def compile_filter(snapshot, today=None):
+    """Return a task -> bool predicate for a filter snapshot
+
+    The snapshot is a dict of the filter inputs (see filter_snapshot()).
+    Everything that doesn't depend on the task is worked out here, once
+    per query, so the predicate is safe to run on any thread.
+    """
+    status_filter = snapshot["status"]
+    priority_filter = snapshot["priority"]
+    due_filter = snapshot["due"]
+    search_text = snapshot["search"].lower()
+    if today is None:
+        today = datetime.date.today()
+    end_date = today + datetime.timedelta(days=7)
+
+    def matches(task):
+        # Status filter
+        if status_filter == "Active" and task.completed:
+            return False
+        elif status_filter == "Completed" and not task.completed:
+            return False
+
+        # Priority filter
+        if priority_filter != "All" and task.priority != priority_filter:
+            return False
+
+        # Due date filter
+        if due_filter != "All":
+            task_date = parse_date(task.due_date)
+
+            if due_filter == "Today" and (not task_date or task_date != today):
+                return False
+            elif due_filter == "This Week":
+                if not task_date or not (today <= task_date <= end_date):
+                    return False
+            elif due_filter == "Overdue":
+                if not task_date or task_date >= today:
+                    return False
+            elif due_filter == "No Due Date" and task.due_date:
+                return False
+
+        # Search text filter
+        if search_text:
+            if (search_text not in task.description.lower() and
+                (not hasattr(task, 'category') or not task.category or
+                 search_text not in task.category.lower()) and
+                (not hasattr(task, 'notes') or not task.notes or
+                 search_text not in task.notes.lower())):
+                return False
+
+        return True
+
+    return matches
+
+class FilterWorker:
+    """Runs filter queries on a background thread; the newest query wins
+
+    Every submit() or cancel() bumps the generation. The worker skips
+    queued queries that are no longer current and abandons a running one
+    as soon as the generation moves on. Results go on a queue that the Tk
+    thread drains from an after() callback, as Tk may only be used from
+    its own thread, as (generation, tasks, error) with tasks None if the
+    query failed.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.thread = None
+
+    def submit(self, tasks, snapshot):
+        """Queue a query over a task list; returns its generation"""
+        self.generation += 1
+        self.requests.put((self.generation, tasks, snapshot))
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+        return self.generation
+
+    def cancel(self):
+        """Make any query still queued or running out of date"""
+        self.generation += 1
+
+    def stop(self):
+        self.cancel()
+        if self.thread is not None:
+            self.requests.put(None)
+            self.thread = None
+
+    def _run(self):
+        while True:
+            request = self.requests.get()
+            if request is None:
+                return
+            generation, tasks, snapshot = request
+            if generation != self.generation:
+                continue
+
+            try:
+                matches = compile_filter(snapshot)
+                filtered_tasks = []
+                for index, task in enumerate(tasks):
+                    if index % FILTER_CHECK_EVERY == 0 and generation != self.generation:
+                        break
+                    if matches(task):
+                        filtered_tasks.append(task)
+                else:
+                    filtered_tasks.sort(key=lambda t: t.id)
+                    self.results.put((generation, filtered_tasks, None))
+            except Exception as e:
+                print(f"Error filtering tasks: {e}")
+                # Let the Tk thread stop waiting for this query
+                self.results.put((generation, None, e))
+
+class VirtualTaskList:
+    """Shows a long task list in a Treeview that holds only the rows in view
+
+    The filtered tasks are kept in self.rows. The Treeview only has items
+    (with iid=str(task.id)) for the rows around the scroll position, plus
+    OVERSCAN_ROWS on each side, and the scrollbar is driven from the
+    position in the whole list. Scrolling inside the held items (wheel,
+    keyboard) is left to the Treeview; the window of items moves once the
+    view gets near its edge.
+
+    The selection is kept as task IDs over the whole list, so selected rows
+    stay selected when scrolled out of the window and shift-click ranges
+    can span rows that were never held as items.
+
+    Moving the window and showing new results both go through
+    update_tree_items(), so only the rows that differ cost Tk calls.
+    """
+
+    def __init__(self, tree, scrollbar, on_select=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.on_select = on_select
+        self.rows = []
+        # Task ID -> index in rows
+        self.positions = {}
+        # Index of the first held row, the task IDs held as items, and the
+        # (iid, values, tags) each was last given
+        self.first = 0
+        self.held = []
+        self.held_rows = []
+        # Index of the first row in view, and the held row the Treeview has at its top
+        self.top = 0
+        self.tree_top = None
+        self.selected = set()
+        # Task ID that shift-click ranges start from
+        self.anchor = None
+        # (mode, row iid) of a click or key press the Treeview is handling
+        self._pending = None
+
+        tree.configure(yscrollcommand=self._tree_scrolled)
+        scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", lambda event: self.render(), add="+")
+        tree.bind("<ButtonPress-1>", self._pointer_pressed, add="+")
+        tree.bind("<KeyPress>", self._key_pressed, add="+")
+        tree.bind("<<TreeviewSelect>>", self._tree_selected, add="+")
+
+    def row_height(self):
+        height = ttk.Style(self.tree).lookup(self.tree.cget("style") or "Treeview", "rowheight")
+        try:
+            return max(int(height), 1)
+        except (TypeError, ValueError):
+            return DEFAULT_ROW_HEIGHT
+
+    def visible_rows(self):
+        """Number of rows that fit in the Treeview (an overestimate is harmless)"""
+        height = self.tree.winfo_height()
+        if height <= 1:
+            # Not laid out yet
+            return int(self.tree.cget("height"))
+        return max(height // self.row_height(), 1)
+
+    def set_rows(self, tasks):
+        """Show a new result list, keeping the scroll position and the selected tasks still in it"""
+        self.rows = tasks
+        self.positions = {task.id: index for index, task in enumerate(tasks)}
+        self.selected.intersection_update(self.positions)
+        if self.anchor not in self.positions:
+            self.anchor = None
+        self.render(rebuild=True)
+
+    def _window_ok(self, visible):
+        """Whether the held items still cover the view with some overscan to spare"""
+        if not self.held:
+            return not self.rows
+        margin = OVERSCAN_ROWS // 2
+        end = self.first + len(self.held)
+        above = self.first == 0 or self.top - self.first >= margin
+        below = end == len(self.rows) or end - (self.top + visible) >= margin
+        return above and below
+
+    def render(self, rebuild=False):
+        """Make the held items cover the view and scroll the Treeview to self.top"""
+        count = len(self.rows)
+        visible = self.visible_rows()
+        self.top = max(0, min(self.top, count - visible))
+
+        if rebuild or not self._window_ok(visible):
+            self.first = max(self.top - OVERSCAN_ROWS, 0)
+            end = min(self.top + visible + OVERSCAN_ROWS, count)
+            rows = []
+            for index in range(self.first, end):
+                task = self.rows[index]
+                values, tags = task_row(task, index)
+                rows.append((str(task.id), values, tags))
+            update_tree_items(self.tree, self.held_rows, rows)
+            self.held_rows = rows
+            self.held = [task.id for task in self.rows[self.first:end]]
+            if not self.held:
+                self.tree_top = None
+            self._sync_selection()
+
+        # The Treeview keeps its top index across item changes; only move it if that's not self.top
+        if self.held and self.top - self.first != self.tree_top:
+            self.tree_top = self.top - self.first
+            self.tree.yview_moveto(self.tree_top / len(self.held))
+        self._update_scrollbar(visible)
+
+    def _update_scrollbar(self, visible=None):
+        count = len(self.rows)
+        if not count:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        if visible is None:
+            visible = self.visible_rows()
+        self.scrollbar.set(self.top / count, min(self.top + visible, count) / count)
+
+    def _tree_scrolled(self, first, last):
+        """yscrollcommand of the Treeview: it scrolled within the held items"""
+        if self.held:
+            self.tree_top = int(round(float(first) * len(self.held)))
+            top = self.first + self.tree_top
+            if top != self.top:
+                self.top = top
+                if not self._window_ok(self.visible_rows()):
+                    self.render()
+                    return
+        self._update_scrollbar()
+
+    def yview(self, *args):
+        """Scrollbar command, in terms of the whole list"""
+        visible = self.visible_rows()
+        if args[0] == tk.MOVETO:
+            self.top = int(float(args[1]) * len(self.rows))
+        elif args[0] == tk.SCROLL:
+            step = visible if args[2] == tk.PAGES else 1
+            self.top += int(args[1]) * step
+        self.render()
+
+    def see(self, task_id):
+        """Scroll so that a task's row is in view"""
+        index = self.positions.get(task_id)
+        if index is None:
+            return
+        visible = self.visible_rows()
+        if index < self.top:
+            self.top = index
+        elif index >= self.top + visible:
+            self.top = index - visible + 1
+        else:
+            return
+        self.render()
+
+    def _pointer_pressed(self, event):
+        # Runs before the Treeview's class binding changes the selection
+        row = self.tree.identify_row(event.y)
+        if not row:
+            return
+        if event.state & SHIFT_MASK:
+            mode = "extend"
+        elif event.state & TOGGLE_MASK:
+            mode = "toggle"
+        else:
+            mode = "set"
+        self._expect(mode, row)
+
+    def _key_pressed(self, event):
+        if event.keysym in NAVIGATION_KEYS:
+            self._expect("set", None)
+
+    def _expect(self, mode, row):
+        self._pending = (mode, row)
+        # <<TreeviewSelect>> is queued ahead of idle callbacks, so this only
+        # forgets a press that didn't change the selection
+        self.tree.after_idle(self._forget_pending)
+
+    def _forget_pending(self):
+        self._pending = None
+
+    def _tree_selected(self, _=None):
+        """Fold a selection change in the held items into the full selection"""
+        tree_selected = {int(iid) for iid in self.tree.selection()}
+        pending, self._pending = self._pending, None
+        if pending is None:
+            if tree_selected == self.selected.intersection(self.held):
+                return  # Our own _sync_selection()
+            mode, row = "merge", None
+        else:
+            mode, row = pending
+        row_id = int(row) if row else None
+
+        if mode == "extend" and row_id in self.positions and self.anchor in self.positions:
+            start, end = sorted((self.positions[self.anchor], self.positions[row_id]))
+            self.selected = {task.id for task in self.rows[start:end + 1]}
+            self._sync_selection()
+        elif mode == "set":
+            self.selected = tree_selected
+        else:
+            self.selected = (self.selected - set(self.held)) | tree_selected
+
+        if mode in ("set", "toggle"):
+            focus = self.tree.focus()
+            self.anchor = row_id if row_id is not None else (int(focus) if focus else None)
+        if self.on_select:
+            self.on_select()
+
+    def _sync_selection(self):
+        """Select the held items that are in the full selection"""
+        wanted = [str(task_id) for task_id in self.held if task_id in self.selected]
+        if set(wanted) != set(self.tree.selection()):
+            self.tree.selection_set(wanted)
+
+    def select(self, task_ids):
+        """Replace the selection"""
+        self.selected = set(task_ids) & self.positions.keys()
+        if len(self.selected) == 1:
+            self.anchor = next(iter(self.selected))
+        self._sync_selection()
+        if self.on_select:
+            self.on_select()
+
+    def select_all(self):
+        self.select(self.positions)
+
+    def clear_selection(self):
+        self.select(())
+
+    def selected_tasks(self):
+        """Return the selected tasks in display order"""
+        return [self.rows[index] for index in sorted(self.positions[task_id] for task_id in self.selected)]
+
+def create_filter_bar(self):
+    """Create the filter and search inputs above the task list"""
+    filter_frame = ttk.Frame(self.main_frame)
+    filter_frame.pack(fill=tk.X, pady=(0, 10))
+
+    options_frame = ttk.LabelFrame(filter_frame, text="Filters", style="Bold.TLabelframe")
+    options_frame.pack(side=tk.LEFT, padx=(0, 10))
+
+    self.status_var = tk.StringVar(value="All")
+    self.priority_var = tk.StringVar(value="All")
+    self.due_var = tk.StringVar(value="All")
+    for label, variable, values in (("Status:", self.status_var, STATUS_FILTERS),
+                                    ("Priority:", self.priority_var, PRIORITY_FILTERS),
+                                    ("Due:", self.due_var, DUE_FILTERS)):
+        ttk.Label(options_frame, text=label).pack(side=tk.LEFT, padx=(5, 2), pady=5)
+        ttk.Combobox(options_frame, textvariable=variable, values=values,
+                     state="readonly", width=11).pack(side=tk.LEFT, padx=(0, 5), pady=5)
+
+    # search_focus() looks for the entry inside the frame in this LabelFrame
+    search_frame = ttk.LabelFrame(filter_frame, text="Search", style="Bold.TLabelframe")
+    search_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+    search_inner = ttk.Frame(search_frame)
+    search_inner.pack(fill=tk.X, padx=5, pady=5)
+    self.search_var = tk.StringVar()
+    ttk.Entry(search_inner, textvariable=self.search_var).pack(fill=tk.X, expand=True)
+
+    # Filtering runs on a worker once typing pauses
+    self.filter_worker = FilterWorker()
+    self._filter_after = None
+    self._filter_query = None
+    self._filter_polling = False
+    for variable in (self.status_var, self.priority_var, self.due_var, self.search_var):
+        variable.trace_add("write", self.schedule_filter)
 
 def create_task_list(self):
     """Create the task list treeview"""
@@ -25,9 +517,11 @@ def create_task_list(self):
     hsb = ttk.Scrollbar(task_frame, orient="horizontal", command=self.task_tree.xview)
     hsb.pack(side=tk.BOTTOM, fill=tk.X)
 
-    # Configure treeview to use scrollbars
-    self.task_tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+    # Configure treeview to use scrollbars; only the rows in view are held as
+    # items, so vertical scrolling goes through the virtual list
+    self.task_tree.configure(xscrollcommand=hsb.set)
     self.task_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+    self.task_list = VirtualTaskList(self.task_tree, vsb, on_select=self.on_task_select)
 
     # Define columns
     self.task_tree["columns"] = ("id", "description", "priority", "due_date", "status", "progress", "category")
@@ -52,8 +546,11 @@ def create_task_list(self):
     self.task_tree.tag_configure('odd_row', background='#f0f0f0')
     self.task_tree.tag_configure('even_row', background='#ffffff')
 
-    # Bind selection event
-    self.task_tree.bind("<<TreeviewSelect>>", self.on_task_select)
+    # Configure tag colors with improved visibility
+    self.task_tree.tag_configure("completed", foreground="#888888")
+    self.task_tree.tag_configure("high", foreground="#d9534f")  # Bootstrap danger red
+    self.task_tree.tag_configure("medium", foreground="#0275d8")  # Bootstrap primary blue
+    self.task_tree.tag_configure("low", foreground="#5cb85c")  # Bootstrap success green
 
     # Bind double-click event
     self.task_tree.bind("<Double-1>", self.on_task_double_click)
@@ -63,15 +560,14 @@ def create_task_list(self):
 
 def on_task_select(self, _=None):
     """Handle task selection event with improved multi-selection support"""
-    selected_items = self.task_tree.selection()
-    selected_count = len(selected_items)
+    selected_ids = self.task_list.selected
+    selected_count = len(selected_ids)
 
     # Update selection count label
     if selected_count == 0:
         self.selected_count.set("No tasks selected")
     elif selected_count == 1:
-        item_id = selected_items[0]
-        task_id = self.task_tree.item(item_id, "values")[0]
+        task_id = next(iter(selected_ids))
         self.selected_count.set(f"Task #{task_id} selected")
     else:
         self.selected_count.set(f"{selected_count} tasks selected")
@@ -89,19 +585,13 @@ def on_task_select(self, _=None):
 
 def select_all_tasks(self, event=None):
     """Select all tasks with visual feedback"""
-    # First deselect all (to ensure clean state)
-    self.task_tree.selection_remove(self.task_tree.selection())
-
-    # Then select all items
-    for item in self.task_tree.get_children():
-        self.task_tree.selection_add(item)
+    # Select every task in the list, including rows not held as items
+    # (this also updates the selection status)
+    self.task_list.select_all()
 
     # Ensure at least one item is visible
-    if self.task_tree.get_children():
-        self.task_tree.see(self.task_tree.get_children()[0])
-
-    # Update selection status
-    self.on_task_select()
+    if self.task_list.rows:
+        self.task_list.see(self.task_list.rows[0].id)
 
     # Show brief confirmation in status bar
     old_text = self.status_bar.cget("text")
@@ -114,10 +604,8 @@ def select_all_tasks(self, event=None):
 
 def deselect_all_tasks(self):
     """Deselect all tasks with visual feedback"""
-    self.task_tree.selection_remove(self.task_tree.selection())
-
-    # Update selection status
-    self.on_task_select()
+    # Also updates the selection status
+    self.task_list.clear_selection()
 
     # Show brief confirmation
     old_text = self.status_bar.cget("text")
@@ -127,45 +615,27 @@ def deselect_all_tasks(self):
     self.root.after(1500, lambda: self.status_bar.config(text=old_text))
 
 def refresh_task_list(self):
-    # Clear current items
-    for item in self.task_tree.get_children():
-        self.task_tree.delete(item)
+    """Re-filter and show the tasks now, e.g. after an edit
+
+    Filter input changes go through schedule_filter() instead, which does
+    the filtering off the Tk thread.
+    """
+    # A query still pending or running would now show stale results
+    if self._filter_after is not None:
+        self.root.after_cancel(self._filter_after)
+        self._filter_after = None
+    self.filter_worker.cancel()
 
     # Sort by ID
-    filtered_tasks = [t for t in self.tasks if self.matches_filters(t)]
+    matches = compile_filter(self.filter_snapshot())
+    filtered_tasks = [t for t in self.tasks if matches(t)]
     filtered_tasks.sort(key=lambda t: t.id)
+    self.show_task_rows(filtered_tasks)
 
-    # Add tasks to the tree with alternating row colors
-    for i, task in enumerate(filtered_tasks):
-        status = "Completed" if task.completed else "Active"
-        due_date = task.due_date if task.due_date else ""
-        priority = task.priority if hasattr(task, 'priority') else "Medium"
-        progress = f"{task.progress}%" if hasattr(task, 'progress') else "0%"
-        category = task.category if hasattr(task, 'category') and task.category else ""
-
-        # Insert the item
-        item_id = self.task_tree.insert(
-            "",
-            tk.END,
-            values=(task.id, task.description, priority, due_date, status, progress, category),
-            tags=('even_row' if i % 2 == 0 else 'odd_row',)  # Alternate row colors
-        )
-
-        # Add additional tags for priority and status
-        if task.completed:
-            self.task_tree.item(item_id, tags=self.task_tree.item(item_id, "tags") + ("completed",))
-        elif priority == "High":
-            self.task_tree.item(item_id, tags=self.task_tree.item(item_id, "tags") + ("high",))
-        elif priority == "Medium":
-            self.task_tree.item(item_id, tags=self.task_tree.item(item_id, "tags") + ("medium",))
-        elif priority == "Low":
-            self.task_tree.item(item_id, tags=self.task_tree.item(item_id, "tags") + ("low",))
-
-    # Configure tag colors with improved visibility
-    self.task_tree.tag_configure("completed", foreground="#888888")
-    self.task_tree.tag_configure("high", foreground="#d9534f")  # Bootstrap danger red
-    self.task_tree.tag_configure("medium", foreground="#0275d8")  # Bootstrap primary blue
-    self.task_tree.tag_configure("low", foreground="#5cb85c")  # Bootstrap success green
+def show_task_rows(self, filtered_tasks):
+    """Show filtered, sorted tasks and update the status bar"""
+    # Only the rows in view are tree items, and only those that changed are touched
+    self.task_list.set_rows(filtered_tasks)
 
     # Update status bar
     total = len(self.tasks)
@@ -177,81 +647,73 @@ def refresh_task_list(self):
         text=f"Total: {total} tasks | Active: {active} | Completed: {completed} | Showing: {filtered}"
     )
 
-    # Reset selection status
-    self.selected_count.set("No tasks selected")
+    # Selected tasks that are still listed stay selected
+    self.on_task_select()
 
-    # Disable action buttons initially
-    self.complete_btn.config(state=tk.DISABLED)
-    self.edit_btn.config(state=tk.DISABLED)
-    self.delete_btn.config(state=tk.DISABLED)
+def filter_snapshot(self):
+    """Read the filter inputs once, for one query"""
+    return {
+        "status": self.status_var.get(),
+        "priority": self.priority_var.get(),
+        "due": self.due_var.get(),
+        "search": self.search_var.get(),
+    }
 
 def matches_filters(self, task):
-    # Status filter
-    status_filter = self.status_var.get()
-    if status_filter == "Active" and task.completed:
-        return False
-    elif status_filter == "Completed" and not task.completed:
-        return False
-
-    # Priority filter
-    priority_filter = self.priority_var.get()
-    if priority_filter != "All" and task.priority != priority_filter:
-        return False
-
-    # Due date filter
-    due_filter = self.due_var.get()
-    if due_filter != "All":
-        today = datetime.date.today()
-
-        # Helper function to safely parse date strings
-        def safe_parse_date(date_string):
-            try:
-                return datetime.datetime.strptime(date_string, "%Y-%m-%d").date()
-            except (ValueError, TypeError):
-                return None
-
-        task_date = safe_parse_date(task.due_date)
-
-        if due_filter == "Today" and (not task_date or task_date != today):
-            return False
-        elif due_filter == "This Week":
-            end_date = today + datetime.timedelta(days=7)
-            if not task_date or not (today <= task_date <= end_date):
-                return False
-        elif due_filter == "Overdue":
-            if not task_date or task_date >= today:
-                return False
-        elif due_filter == "No Due Date" and task.due_date:
-            return False
-
-    # Search text filter
-    search_text = self.search_var.get().lower()
-    if search_text:
-        if (search_text not in task.description.lower() and
-            (not hasattr(task, 'category') or not task.category or
-             search_text not in task.category.lower()) and
-            (not hasattr(task, 'notes') or not task.notes or
-             search_text not in task.notes.lower())):
-            return False
-
-    return True
+    """Check one task against the current filters (use compile_filter() for lists)"""
+    return compile_filter(self.filter_snapshot())(task)
+
+def schedule_filter(self, *_):
+    """Trace callback for the filter inputs: filter once they stop changing"""
+    if self._filter_after is not None:
+        self.root.after_cancel(self._filter_after)
+    self._filter_after = self.root.after(FILTER_DELAY_MS, self.run_filter_query)
+
+def run_filter_query(self):
+    """Filter a snapshot of the tasks on the worker thread"""
+    self._filter_after = None
+    self._filter_query = self.filter_worker.submit(self.repo.snapshot(), self.filter_snapshot())
+    if not self._filter_polling:
+        self._filter_polling = True
+        self.root.after(FILTER_POLL_MS, self.poll_filter_results)
+
+def poll_filter_results(self):
+    """Show the worker's results for the latest query (runs on the Tk thread)"""
+    received = False
+    filtered_tasks = error = None
+    while True:
+        try:
+            generation, tasks, failure = self.filter_worker.results.get_nowait()
+        except queue.Empty:
+            break
+        if generation == self._filter_query:
+            received, filtered_tasks, error = True, tasks, failure
+
+    # A refresh_task_list() since the query makes its results stale
+    current = self._filter_query == self.filter_worker.generation
+    if received and current:
+        self._filter_polling = False
+        if error is not None:
+            self.status_bar.config(text=f"Filtering failed: {error}")
+            return
+        # New filters: start from the top of the results
+        self.task_list.top = 0
+        self.show_task_rows(filtered_tasks)
+    elif current:
+        self.root.after(FILTER_POLL_MS, self.poll_filter_results)
+    else:
+        self._filter_polling = False
 
 def delete_task(self):
-    selected_items = self.task_tree.selection()
-    if not selected_items:
+    tasks_to_delete = self.task_list.selected_tasks()
+    if not tasks_to_delete:
         messagebox.showinfo("Info", "Please select a task to delete")
         return
 
     # Confirm deletion
-    task_count = len(selected_items)
+    task_count = len(tasks_to_delete)
     if task_count == 1:
-        item_id = selected_items[0]
-        task_id = int(self.task_tree.item(item_id, "values")[0])
-        task = next((t for t in self.tasks if t.id == task_id), None)
-
-        if not task:
-            return
-
+        task = tasks_to_delete[0]
         confirm = messagebox.askyesno(
             "Confirm Delete",
             f"Are you sure you want to delete task #{task.id}?\n\n{task.description}"
@@ -263,20 +725,12 @@ def delete_task(self):
         )
 
     if confirm:
-        # Collect tasks to delete
-        tasks_to_delete = []
-        for item_id in selected_items:
-            task_id = int(self.task_tree.item(item_id, "values")[0])
-            task = next((t for t in self.tasks if t.id == task_id), None)
-            if task:
-                tasks_to_delete.append(task)
-
-        # Delete the tasks
-        for task in tasks_to_delete:
-            self.tasks.remove(task)
+        # Delete the tasks in one pass, keeping the repository's list object
+        deleted_ids = {task.id for task in tasks_to_delete}
+        self.tasks[:] = [t for t in self.tasks if t.id not in deleted_ids]
 
         # Save and refresh
-        save_tasks(self.tasks)
+        self.save_changes()
         self.refresh_task_list()
 
         # Show success message
@@ -285,20 +739,11 @@ def delete_task(self):
 
 def get_selected_task(self):
     """Get the currently selected task"""
-    selected_item = self.task_tree.selection()
-    if not selected_item:
+    selected_tasks = self.task_list.selected_tasks()
+    if not selected_tasks:
         return None
 
-    # Get task ID from the selected item
-    item_id = selected_item[0]
-    task_id = int(self.task_tree.item(item_id, "values")[0])
-
-    # Find task with that ID
-    for task in self.tasks:
-        if task.id == task_id:
-            return task
-
-    return None  # Return None if task not found
+    return selected_tasks[0]
 
 def on_task_double_click(self, _):
     """Handle double-clicking on a task"""
@@ -323,7 +768,7 @@ def show_context_menu(self, event):
     # Select the item under cursor
     item = self.task_tree.identify_row(event.y)
     if item:
-        self.task_tree.selection_set(item)
+        self.task_list.select([int(item)])
         self.context_menu.post(event.x_root, event.y_root)
 
 # Rest of the methods from gui 2...
@@ -335,6 +780,6 @@ def add_custom_category(self):
         task = self.get_selected_task()
         if task:
             task.category = new_category
-            save_tasks(self.tasks)
+            self.save_changes(task)
             self.refresh_task_list()
             self.status_bar.config(text=f"Added category '{new_category}' to task")
@@ -1,21 +1,59 @@
-def main():
-    import sys
-    import argparse
-    from task_manager.commands.add import add_task
-    from task_manager.commands.list import list_tasks
-    from task_manager.commands.complete import complete_task
-    from task_manager.commands.delete import delete_task
-    from task_manager.utils.settings import load_settings, toggle_interactive_mode
-
-    # Show a welcome banner when starting the CLI
+def print_banner():
+    """Show a welcome banner when starting the CLI"""
     print("\033[1;36m")
     print("=======================================")
     print("   Task Manager CLI - Version 1.0.0   ")
     print("=======================================")
     print("\033[0m")
 
+def add_format_argument(parser):
+    """Add the --format option shared by query commands"""
+    parser.add_argument("-f", "--format", choices=["table", "jsonl", "csv", "tsv"],
+                        default="table",
+                        help="Output format; jsonl/csv/tsv stream one record per line")
+
+def add_where_argument(parser):
+    """Add the --where option shared by bulk mutation commands"""
+    parser.add_argument("-w", "--where",
+                        help="Select tasks by filter, e.g. \"status:completed cat:old\" "
+                             "(keys: status, priority, cat, due, id, text)")
+
+def non_negative_int(value):
+    """argparse type for counts such as --limit and --offset"""
+    import argparse
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, not {number}")
+    return number
+
+def positive_int(value):
+    """argparse type for 1-based numbers such as --page"""
+    import argparse
+    number = non_negative_int(value)
+    if number == 0:
+        raise argparse.ArgumentTypeError("must be 1 or more, not 0")
+    return number
+
+def report_bulk(action, count, missing, unmatched, started):
+    """Print the outcome of a bulk mutation"""
+    import time
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    print(f"{action} {count} task(s) in {elapsed_ms:.1f} ms")
+    if missing:
+        print(f"Not found: {', '.join(missing)}")
+    if unmatched:
+        print(f"Did not match --where: {', '.join(str(task_id) for task_id in unmatched)}")
+
+def build_parser():
+    """Build the task-cli argument parser"""
+    import argparse
+
     # Create argument parser with better help texts
     parser = argparse.ArgumentParser(
+        prog="task-cli",
         description="Task Manager CLI - Manage your tasks from the command line",
         epilog="Run without arguments to enter interactive mode (if enabled)"
     )
@@ -25,11 +63,17 @@ def main():
 
     # Add task command
     add_parser = subparsers.add_parser("add", help="Add a new task")
-    add_parser.add_argument("description", help="Task description", nargs="+")
+    add_parser.add_argument("description", help="Task description", nargs="*")
     add_parser.add_argument("-p", "--priority", choices=["High", "Medium", "Low"],
-                           default="Medium", help="Task priority (default: Medium)")
+                           help="Task priority (default: Medium)")
     add_parser.add_argument("-d", "--due", help="Due date in YYYY-MM-DD format")
     add_parser.add_argument("-c", "--category", help="Task category")
+    add_parser.add_argument("-r", "--repeat", metavar="RULE",
+                           help="Make the task recurring: daily, weekly, monthly or an RRULE "
+                                "such as FREQ=WEEKLY;BYDAY=MO,TH")
+    add_parser.add_argument("-t", "--template", help="Start from this task template")
+    add_parser.add_argument("--var", dest="template_vars", action="append", default=[],
+                           metavar="NAME=VALUE", help="Value for a template placeholder (repeatable)")
 
     # List tasks command
     list_parser = subparsers.add_parser("list", help="List all tasks")
@@ -37,27 +81,203 @@ def main():
                             default="all", help="Filter by status")
     list_parser.add_argument("-p", "--priority", choices=["all", "High", "Medium", "Low"],
                             default="all", help="Filter by priority")
+    list_parser.add_argument("-d", "--due", choices=["today", "week", "overdue"],
+                            help="Only tasks due today, in the next 7 days or overdue "
+                                 "(recurring tasks match on any occurrence)")
+    list_parser.add_argument("-n", "--limit", type=non_negative_int, help="Show at most this many tasks")
+    list_parser.add_argument("--offset", type=non_negative_int, default=0,
+                            help="Skip this many matching tasks")
+    list_parser.add_argument("--page", type=positive_int,
+                            help="Show this page of results (page size is --limit, default 50)")
+    add_format_argument(list_parser)
+    list_parser.add_argument("--watch", action="store_true",
+                            help="Keep the list on screen and update it when tasks change")
 
     # Complete task command
-    complete_parser = subparsers.add_parser("complete", help="Mark a task as complete")
-    complete_parser.add_argument("task_id", type=int, help="ID of the task to complete")
+    complete_parser = subparsers.add_parser("complete", help="Mark tasks as complete")
+    complete_parser.add_argument("task_ids", nargs="*",
+                                 help="IDs of the tasks to complete (e.g. 1 2 5-40)")
+    add_where_argument(complete_parser)
 
     # Delete task command
-    delete_parser = subparsers.add_parser("delete", help="Delete a task")
-    delete_parser.add_argument("task_id", type=int, help="ID of the task to delete")
+    delete_parser = subparsers.add_parser("delete", help="Delete tasks")
+    delete_parser.add_argument("task_ids", nargs="*",
+                               help="IDs of the tasks to delete (e.g. 1 2 5-40)")
+    add_where_argument(delete_parser)
+
+    # Update task command
+    update_parser = subparsers.add_parser("update", help="Change fields on tasks")
+    update_parser.add_argument("task_ids", nargs="*",
+                               help="IDs of the tasks to update (e.g. 1 2 5-40)")
+    add_where_argument(update_parser)
+    update_parser.add_argument("--set", dest="assignments", action="append", default=[],
+                               metavar="FIELD=VALUE",
+                               help="Field to change: priority, category, due, progress, "
+                                    "description, notes, status or repeat (repeatable)")
+
+    # Batch command
+    batch_parser = subparsers.add_parser("batch", help="Run commands from a file or stdin")
+    batch_parser.add_argument("file", nargs="?", default="-",
+                              help="File with one command per line (default: stdin)")
+    batch_parser.add_argument("--commit-every", type=non_negative_int, default=0, metavar="N",
+                              help="Save after every N commands (default: once at the end)")
+    batch_parser.add_argument("--keep-going", action="store_true",
+                              help="Continue after a failing command instead of stopping")
+
+    # Count command (handled by a fast path in main(); listed here for --help)
+    count_parser = subparsers.add_parser("count", help="Print task counts for prompts and status bars")
+    count_parser.add_argument("-b", "--bucket", help="Print only this count (e.g. overdue, active)")
+
+    # Completion script command
+    completion_parser = subparsers.add_parser("completion", help="Print a shell completion script")
+    completion_parser.add_argument("shell", choices=["bash", "zsh"], help="Shell to generate the script for")
 
     # Interactive mode command
-    subparsers.add_parser("interactive", help="Start interactive mode")
+    interactive_parser = subparsers.add_parser("interactive", help="Start interactive mode")
+    interactive_parser.add_argument("--classic", action="store_true",
+                                    help="Use the numbered menus instead of the full-screen interface")
 
     # Toggle interactive mode command
     subparsers.add_parser("toggle-interactive", help="Toggle the default interactive mode setting")
 
+    return parser
+
+def run_command(args, parser=None, repo=None):
+    """Execute a parsed command
+
+    Errors are raised to the caller. When repo is given, task commands run
+    against that in-memory repository and leave saving to its owner.
+    """
+    import sys
+    import time
+
+    if args.command == "add":
+        from task_manager.commands.add import add_task
+        description = " ".join(args.description)
+        if not description and not args.template:
+            raise ValueError("A task description or --template is required")
+        template_values = dict(var.partition("=")[::2] for var in args.template_vars)
+        task = add_task(description, priority=args.priority, due_date=args.due,
+                        category=args.category, repo=repo,
+                        template=args.template, template_values=template_values,
+                        recurrence=args.repeat)
+        print(f"Task added: {task.description}")
+
+    elif args.command == "list":
+        if args.watch:
+            if repo is not None:
+                raise ValueError("list --watch is not available here")
+            if args.format != "table":
+                raise ValueError(f"list --watch only draws a table; it can't be used with --format {args.format}")
+            from task_manager.commands.list import watch_tasks
+            watch_tasks(status=args.status, priority=args.priority, due=args.due,
+                        limit=args.limit, offset=args.offset, page=args.page)
+            return
+
+        from task_manager.commands.list import list_tasks
+        list_tasks(status=args.status, priority=args.priority, due=args.due,
+                   limit=args.limit, offset=args.offset, page=args.page,
+                   output_format=args.format, repo=repo)
+
+    elif args.command == "complete":
+        from task_manager.commands.complete import complete_tasks
+        started = time.perf_counter()
+        count, missing, unmatched = complete_tasks(args.task_ids, where=args.where, repo=repo)
+        report_bulk("Completed", count, missing, unmatched, started)
+
+    elif args.command == "delete":
+        from task_manager.commands.delete import delete_tasks
+        started = time.perf_counter()
+        count, missing, unmatched = delete_tasks(args.task_ids, where=args.where, repo=repo)
+        report_bulk("Deleted", count, missing, unmatched, started)
+
+    elif args.command == "update":
+        from task_manager.commands.update import update_tasks
+        started = time.perf_counter()
+        count, missing, unmatched = update_tasks(args.assignments, args.task_ids,
+                                                 where=args.where, repo=repo)
+        report_bulk("Updated", count, missing, unmatched, started)
+
+    elif args.command == "batch":
+        if repo is not None:
+            raise ValueError("batch cannot be nested")
+        from task_manager.commands.batch import run_batch
+        failures = run_batch(args.file, parser or build_parser(),
+                             commit_every=args.commit_every, keep_going=args.keep_going)
+        if failures:
+            sys.exit(1)
+
+    elif args.command == "count":
+        # An unknown bucket raises ValueError, so batch, the shell and the
+        # daemon count it as a failed command
+        from task_manager.commands.count import count_tasks, format_counts
+        print(format_counts(count_tasks(args.bucket), args.bucket))
+
+    elif args.command == "completion":
+        from task_manager.commands.completion import completion_script
+        sys.stdout.write(completion_script(args.shell))
+
+    elif args.command == "interactive":
+        if repo is not None:
+            raise ValueError("interactive mode is not available here")
+        # Explicit request for interactive mode
+        from task_manager.cli_interactive import run_interactive_cli
+        print("Starting Task Manager in interactive mode...")
+        run_interactive_cli(classic=args.classic)
+
+    elif args.command == "toggle-interactive":
+        from task_manager.utils.settings import toggle_interactive_mode
+        new_mode = toggle_interactive_mode()
+        print(f"Interactive mode {'enabled' if new_mode else 'disabled'}")
+        print(f"Default mode is now: {'Interactive' if new_mode else 'Command-line'}")
+
+    else:
+        # Fallback to help
+        (parser or build_parser()).print_help()
+
+def main():
+    import sys
+
+    # Prompt/status-bar fast path: answered from the summary file only
+    if len(sys.argv) > 1 and sys.argv[1] == "count":
+        from task_manager.commands.count import main as count_main
+        status = count_main(sys.argv[2:])
+        if status:
+            sys.exit(status)
+        return
+
+    # Shell completion fast path: answered from the completion cache
+    if len(sys.argv) > 1 and sys.argv[1] == "__complete":
+        from task_manager.commands.completion import complete_main
+        status = complete_main(sys.argv[2:])
+        if status:
+            sys.exit(status)
+        return
+
+    # Hand the command to a running task-daemon if there is one
+    if len(sys.argv) > 1:
+        from task_manager.daemon_client import DAEMON_COMMANDS, call
+        # A watching list stays resident and follows the store itself
+        if sys.argv[1] in DAEMON_COMMANDS and "--watch" not in sys.argv:
+            status = call(sys.argv[1:])
+            if status is not None:
+                if status:
+                    sys.exit(status)
+                return
+
+    parser = build_parser()
+
     # Parse arguments
     if len(sys.argv) > 1:
         args = parser.parse_args()
+        # Machine-readable and scripted output must not be prefixed by the banner
+        if getattr(args, "format", "table") == "table" and args.command not in ("batch", "completion"):
+            print_banner()
     else:
+        print_banner()
         # If no arguments, check settings for interactive mode preference
-        settings = load_settings()
+        from task_manager.utils.settings import get_settings
+        settings = get_settings()
         use_interactive = settings.get('cli', {}).get('interactive_mode', True)
 
         if use_interactive:
@@ -78,42 +298,18 @@ def main():
                 return
 
     # Process commands
-    if args.command == "add":
-        description = " ".join(args.description)
-        add_task(description, priority=args.priority, due_date=args.due, category=args.category)
-        print(f"Task added: {description}")
-
-    elif args.command == "list":
-        list_tasks(status=args.status, priority=args.priority)
-
-    elif args.command == "complete":
-        try:
-            complete_task(args.task_id)
-            print(f"Task #{args.task_id} marked as complete")
-        except Exception as e:
-            print(f"Error: {str(e)}")
-
-    elif args.command == "delete":
-        try:
-            delete_task(args.task_id)
-            print(f"Task #{args.task_id} deleted")
-        except Exception as e:
-            print(f"Error: {str(e)}")
-
-    elif args.command == "interactive":
-        # Explicit request for interactive mode
-        from task_manager.cli_interactive import run_interactive_cli
-        print("Starting Task Manager in interactive mode...")
-        run_interactive_cli()
-
-    elif args.command == "toggle-interactive":
-        new_mode = toggle_interactive_mode()
-        print(f"Interactive mode {'enabled' if new_mode else 'disabled'}")
-        print(f"Default mode is now: {'Interactive' if new_mode else 'Command-line'}")
-
-    else:
-        # Fallback to help
-        parser.print_help()
+    try:
+        run_command(args, parser)
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) closed the pipe early; point
+        # stdout at devnull so the interpreter's final flush doesn't fail
+        import os
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -15,10 +15,38 @@ class Task:
         self.progress = 0
         self.notes = ""
         self.reminder_time = None
+        # Recurrence rule (see utils/recurrence.py); due_date is the current occurrence
+        self.recurrence = None
 
     def mark_complete(self):
+        """Mark the task complete
+
+        A recurring task moves on to its next occurrence instead and stays
+        active. Returns the new due date in that case, otherwise None. A
+        rule that no longer parses is ignored and the task is just completed.
+        """
+        if getattr(self, 'recurrence', None):
+            from task_manager.utils.recurrence import advance_task
+            try:
+                next_due = advance_task(self)
+            except ValueError:
+                next_due = None
+            if next_due:
+                return next_due
         self.completed = True
         self.progress = 100
+        return None
+
+    def set_recurrence(self, rule):
+        """Make the task recurring (or not, with None); raises ValueError for a bad rule"""
+        if not rule:
+            self.recurrence = None
+            return
+        from task_manager.utils.recurrence import normalize_rule
+        self.recurrence = normalize_rule(rule)
+        if not self.due_date:
+            # The series starts today when no due date anchors it
+            self.due_date = datetime.date.today().strftime("%Y-%m-%d")
 
     def set_reminder(self, reminder_datetime):
         """Set a reminder time for this task"""
@@ -26,6 +54,8 @@ class Task:
             self.reminder_time = reminder_datetime.timestamp()
         else:
             self.reminder_time = float(reminder_datetime)
+        # A new reminder time should fire even if an earlier one already did
+        self.reminder_notified = False
 
     def __repr__(self):
         return f"Task(id={self.id}, description='{self.description}', completed={self.completed})"
\ No newline at end of file
@@ -1,7 +1,131 @@
+#!/usr/bin/env python
+"""
+Task Manager Command Shell
+Provides a persistent command-line interface for Task Manager
+
+Commands use the same grammar as task-cli but are parsed and run in this
+process against a task repository that is loaded once and kept warm.
+Changes are saved write-behind, a short delay after the last edit, and
+flushed when the shell exits.
+"""
+
+import os
 import sys
+import shlex
 import logging
 import atexit
 
+# Seconds to wait after the last change before saving the store
+FLUSH_DELAY = 2.0
+
+def show_prompt():
+    """Show a colorful command prompt"""
+    return "\033[1;36mtask> \033[0m"
+
+def show_help():
+    """Print the shell's command summary"""
+    print("\nTask Manager Commands:")
+    print("  add \"Task description\" [--priority=High|Medium|Low] [--due=YYYY-MM-DD]")
+    print("  list [--status=all|active|completed] [--priority=all|High|Medium|Low]")
+    print("  complete <task_id>... [--where FILTER]   - Mark tasks as complete")
+    print("  delete <task_id>... [--where FILTER]     - Delete tasks")
+    print("  update <task_id>... --set FIELD=VALUE    - Change fields on tasks")
+    print("  batch <file>          - Run commands from a file")
+    print("  save                  - Save pending changes now")
+    print("  interactive           - Enter interactive mode")
+    print("  toggle-interactive    - Toggle interactive mode setting")
+    print("  exit, quit            - Exit the shell")
+    print("  help                  - Show this help")
+
+def process_command(command, repo, parser):
+    """Process a single command in-process against the shell's repository"""
+    command = command.strip()
+    if not command:
+        return True
+
+    # Handle built-in commands
+    if command in ("exit", "quit"):
+        print("Exiting Task Manager.")
+        return False
+    elif command == "help":
+        show_help()
+        return True
+    elif command in ("clear", "cls"):
+        os.system('cls' if os.name == 'nt' else 'clear')
+        return True
+    elif command == "save":
+        print("Tasks saved." if repo.flush() else "No unsaved changes.")
+        return True
+
+    try:
+        argv = shlex.split(command)
+        if argv[0] in ("task-cli", "task"):
+            argv = argv[1:]
+        args = parser.parse_args(argv)
+    except SystemExit:
+        # argparse has already printed the usage error (or --help)
+        return True
+    except ValueError as e:
+        print(f"Error: {e}")
+        return True
+
+    try:
+        if args.command == "interactive":
+            # The interactive CLI works on the saved store directly
+            from task_manager.cli_interactive import run_interactive_cli
+            repo.flush()
+            run_interactive_cli()
+            repo.reload()
+        elif args.command == "batch":
+            from task_manager.commands.batch import run_batch
+            # Hold the lock for the whole batch so the write-behind timer
+            # can't save a half-applied batch in the middle of it
+            with repo.lock:
+                run_batch(args.file, parser, commit_every=args.commit_every,
+                          keep_going=args.keep_going, repo=repo)
+        else:
+            from task_manager.main import run_command
+            repo.refresh_if_changed()
+            with repo.lock:
+                run_command(args, parser, repo=repo)
+    except Exception as e:
+        print(f"Error: {e}")
+
+    return True
+
+def run_shell():
+    """Run the command loop"""
+    from task_manager.main import build_parser
+    from task_manager.utils.repository import TaskRepository
+
+    parser = build_parser()
+    repo = TaskRepository(flush_delay=FLUSH_DELAY)
+
+    # Make sure pending changes are written however the shell exits
+    atexit.register(repo.flush)
+
+    os.system('cls' if os.name == 'nt' else 'clear')
+    print("\033[1;36m")
+    print("=======================================")
+    print("   Task Manager Command Shell v1.0.0   ")
+    print("=======================================")
+    print("\033[0m")
+    print("Type 'help' for available commands or 'exit' to quit.")
+
+    running = True
+    try:
+        while running:
+            try:
+                command = input(show_prompt())
+                running = process_command(command, repo, parser)
+            except KeyboardInterrupt:
+                print("\nUse 'exit' or 'quit' to exit.")
+            except EOFError:
+                print("\nExiting Task Manager.")
+                running = False
+    finally:
+        repo.flush()
+
 def main():
     """Main entry point for the task shell."""
     # Configure basic logging
@@ -31,5 +155,7 @@ def main():
             print("Falling back to command-line mode.")
 
     # Continue with command-line interface
-    # ...existing code...
+    run_shell()
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,471 @@
+"""
+Full-screen terminal interface for Task Manager
+
+A curses front end for the interactive mode: a scrollable task list with
+arrow-key navigation, search-as-you-type and single-key actions. Only the
+rows on screen are formatted, and rows whose text hasn't changed since the
+last frame are not redrawn, so it stays responsive with very large lists.
+
+Keys are listed in HELP_LINE; run_interactive_cli() falls back to the
+numbered menus when curses or a terminal is not available.
+"""
+
+import curses
+import datetime
+from task_manager.models.task import Task
+from task_manager.utils.recurrence import describe_rule
+
+HELP_LINE = ("↑/↓ move  PgUp/PgDn page  / search  Enter details  a add  "
+             "space toggle  d delete  f filter  s sort  q quit")
+
+STATUS_FILTERS = ("all", "active", "completed")
+SORT_ORDERS = ("id", "priority", "due")
+PRIORITIES = ("High", "Medium", "Low")
+
+# Lines used above and below the list: title, column header / status, help
+TOP_LINES = 2
+BOTTOM_LINES = 2
+
+# Milliseconds the list waits for a key before checking the store for changes
+SYNC_INTERVAL_MS = 1000
+
+KEY_ESCAPE = 27
+KEY_ENTER_CODES = (curses.KEY_ENTER, 10, 13)
+KEY_BACKSPACE_CODES = (curses.KEY_BACKSPACE, 127, 8)
+
+def _haystack(task):
+    """Lowercased text that search-as-you-type matches against"""
+    return " ".join(filter(None, [
+        task.description, getattr(task, 'notes', None), getattr(task, 'category', None)
+    ])).lower()
+
+def _sort_key(order):
+    if order == "priority":
+        rank = {"High": 0, "Medium": 1, "Low": 2}
+        return lambda entry: (rank.get(getattr(entry[0], 'priority', 'Medium'), 1), entry[0].id)
+    if order == "due":
+        return lambda entry: (getattr(entry[0], 'due_date', None) or "9999-99-99", entry[0].id)
+    return lambda entry: entry[0].id
+
+class TaskTUI:
+    """State and drawing for the curses task list"""
+
+    def __init__(self, stdscr, repo):
+        self.stdscr = stdscr
+        self.repo = repo
+        self.status_filter = "all"
+        self.sort_order = "id"
+        self.query = ""
+        self.cursor = 0
+        self.top = 0
+        self.message = ""
+        self.view = []
+        self._view_query = None
+        # row -> (text, attribute) last written, for incremental redraw
+        self.drawn = {}
+        self._init_colors()
+        self.load_entries()
+
+    def _init_colors(self):
+        self.attrs = {"High": curses.A_NORMAL, "Medium": curses.A_NORMAL,
+                      "Low": curses.A_NORMAL, "completed": curses.A_DIM}
+        if not curses.has_colors():
+            return
+        curses.start_color()
+        try:
+            curses.use_default_colors()
+            background = -1
+        except curses.error:
+            background = curses.COLOR_BLACK
+        for pair, (name, color) in enumerate([("High", curses.COLOR_RED),
+                                              ("Medium", curses.COLOR_BLUE),
+                                              ("Low", curses.COLOR_GREEN)], 1):
+            curses.init_pair(pair, color, background)
+            self.attrs[name] = curses.color_pair(pair)
+
+    # Data
+
+    def load_entries(self):
+        """Build (task, search text) entries once; searches then only scan strings"""
+        with self.repo.lock:
+            self.entries = [[task, _haystack(task)] for task in self.repo.tasks]
+            self.generation = self.repo.generation
+        self.entries.sort(key=_sort_key(self.sort_order))
+        self.refilter(full=True)
+
+    def _status_matches(self, task):
+        if self.status_filter == "active":
+            return not task.completed
+        if self.status_filter == "completed":
+            return task.completed
+        return True
+
+    def refilter(self, full=False):
+        """Recompute the visible entries for the status filter and search query
+
+        While the query only grows, each keystroke narrows the previous
+        result instead of rescanning every task.
+        """
+        needle = self.query.lower()
+        narrowing = (not full and self._view_query is not None
+                     and needle.startswith(self._view_query))
+        source = self.view if narrowing else self.entries
+
+        self.view = [entry for entry in source
+                     if needle in entry[1] and self._status_matches(entry[0])]
+        self._view_query = needle
+        self.cursor = min(self.cursor, max(len(self.view) - 1, 0))
+        self.top = min(self.top, self.cursor)
+
+    def current(self):
+        return self.view[self.cursor] if self.view else None
+
+    def changed(self, entry=None):
+        """Record an edit to a task; the repository saves it write-behind"""
+        if entry is not None:
+            entry[1] = _haystack(entry[0])
+        with self.repo.lock:
+            self.repo.mark_dirty()
+            self.generation = self.repo.generation
+
+    def sync(self):
+        """Rebuild the entries if another process's saved changes were merged in"""
+        self.repo.refresh_if_changed()
+        if self.repo.generation != self.generation:
+            self.load_entries()
+
+    # Drawing
+
+    def list_height(self):
+        height, _ = self.stdscr.getmaxyx()
+        return max(height - TOP_LINES - BOTTOM_LINES, 1)
+
+    def format_row(self, task, width):
+        status = "[✓]" if task.completed else "[ ]"
+        priority = getattr(task, 'priority', 'Medium')
+        due = getattr(task, 'due_date', None) or ""
+        category = getattr(task, 'category', None) or ""
+        text = f"{status} {task.id:>6}  {priority:<6}  {due:<10}  {category[:12]:<12}  {task.description}"
+        return text[:width - 1]
+
+    def row_attribute(self, task, selected):
+        attr = self.attrs["completed"] if task.completed else self.attrs.get(
+            getattr(task, 'priority', 'Medium'), curses.A_NORMAL)
+        return attr | curses.A_REVERSE if selected else attr
+
+    def put_line(self, row, text, attr=curses.A_NORMAL):
+        """Write a screen line unless it already shows exactly this text"""
+        if self.drawn.get(row) == (text, attr):
+            return
+        try:
+            self.stdscr.move(row, 0)
+            self.stdscr.clrtoeol()
+            self.stdscr.addstr(row, 0, text, attr)
+        except curses.error:
+            pass
+        self.drawn[row] = (text, attr)
+
+    def draw(self):
+        height, width = self.stdscr.getmaxyx()
+        rows = self.list_height()
+
+        # Keep the cursor inside the scrolled window
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + rows:
+            self.top = self.cursor - rows + 1
+
+        title = (f" Task Manager - {len(self.view)} of {len(self.entries)} tasks"
+                 f" | filter: {self.status_filter} | sort: {self.sort_order}")
+        self.put_line(0, title[:width - 1], curses.A_BOLD)
+        header = f"{'':3} {'ID':>6}  {'Pri':<6}  {'Due':<10}  {'Category':<12}  Description"
+        self.put_line(1, header[:width - 1], curses.A_UNDERLINE)
+
+        # Only the rows on screen are formatted
+        for offset in range(rows):
+            index = self.top + offset
+            if index < len(self.view):
+                task = self.view[index][0]
+                self.put_line(TOP_LINES + offset, self.format_row(task, width),
+                              self.row_attribute(task, index == self.cursor))
+            else:
+                self.put_line(TOP_LINES + offset, "")
+
+        status = f"/{self.query}" if self.query else self.message
+        self.put_line(height - 2, status[:width - 1])
+        self.put_line(height - 1, HELP_LINE[:width - 1], curses.A_DIM)
+        self.stdscr.refresh()
+
+    def redraw_all(self):
+        """Forget what is on screen, e.g. after a resize or a full-screen dialog"""
+        self.drawn.clear()
+        self.stdscr.clear()
+
+    # Input helpers
+
+    def prompt(self, label, initial=""):
+        """Read a line of text on the status line; returns None if cancelled with Esc"""
+        height, width = self.stdscr.getmaxyx()
+        text = initial
+        try:
+            curses.curs_set(1)
+        except curses.error:
+            pass
+        try:
+            while True:
+                line = f"{label}{text}"[-(width - 1):]
+                self.put_line(height - 2, line, curses.A_BOLD)
+                self.stdscr.move(height - 2, min(len(line), width - 2))
+                self.stdscr.refresh()
+                key = self.stdscr.get_wch()
+                if key in ("\n", "\r") or key in KEY_ENTER_CODES:
+                    return text
+                if key == "\x1b" or key == KEY_ESCAPE:
+                    return None
+                if key in ("\x7f", "\b") or key in KEY_BACKSPACE_CODES:
+                    text = text[:-1]
+                elif isinstance(key, str) and key.isprintable():
+                    text += key
+        finally:
+            try:
+                curses.curs_set(0)
+            except curses.error:
+                pass
+
+    def pending_keys(self):
+        """Collect keys typed while the last one was being handled"""
+        keys = []
+        self.stdscr.nodelay(True)
+        try:
+            while True:
+                try:
+                    keys.append(self.stdscr.get_wch())
+                except curses.error:
+                    return keys
+        finally:
+            self.stdscr.nodelay(False)
+
+    # Actions
+
+    def search(self):
+        """Search-as-you-type: the list narrows on each keystroke"""
+        self.message = ""
+        while True:
+            self.draw()
+            keys = [self.stdscr.get_wch()] + self.pending_keys()
+            full = False
+            for key in keys:
+                if key in ("\n", "\r") or key in KEY_ENTER_CODES:
+                    return
+                if key == "\x1b" or key == KEY_ESCAPE:
+                    self.query = ""
+                    self.refilter(full=True)
+                    return
+                if key in ("\x7f", "\b") or key in KEY_BACKSPACE_CODES:
+                    self.query = self.query[:-1]
+                    full = True
+                elif key in (curses.KEY_UP, curses.KEY_DOWN):
+                    self.move(-1 if key == curses.KEY_UP else 1)
+                elif isinstance(key, str) and key.isprintable():
+                    self.query += key
+            # Apply a burst of typed characters with one filtering pass
+            self.refilter(full=full)
+
+    def move(self, delta):
+        if self.view:
+            self.cursor = max(0, min(self.cursor + delta, len(self.view) - 1))
+
+    def toggle(self, entry=None):
+        entry = entry or self.current()
+        if entry is None:
+            return
+        task = entry[0]
+        next_due = None
+        if task.completed:
+            task.completed = False
+        else:
+            next_due = task.mark_complete()
+        self.changed(entry)
+        if next_due:
+            self.message = f"Task #{task.id} done; next occurrence due {next_due}"
+        else:
+            self.message = f"Task #{task.id} marked {'completed' if task.completed else 'active'}"
+        if not self._status_matches(task):
+            self.refilter(full=True)
+
+    def delete(self, entry=None):
+        entry = entry or self.current()
+        if entry is None:
+            return
+        task = entry[0]
+        answer = self.prompt(f"Delete task #{task.id}? (y/n) ")
+        if not answer or answer.lower() != "y":
+            self.message = "Delete cancelled"
+            return
+        with self.repo.lock:
+            self.repo.tasks[:] = [t for t in self.repo.tasks if t is not task]
+            self.changed()
+        self.entries.remove(entry)
+        if entry in self.view:
+            self.view.remove(entry)
+        self.cursor = min(self.cursor, max(len(self.view) - 1, 0))
+        self.message = f"Task #{task.id} deleted"
+
+    def add(self):
+        description = self.prompt("New task: ")
+        if not description or not description.strip():
+            self.message = "Add cancelled"
+            return
+        task = Task(task_id=self.repo.next_id(), description=description.strip())
+        self.edit_fields(task, include_description=False)
+        with self.repo.lock:
+            self.repo.add(task)
+            self.generation = self.repo.generation
+        self.entries.append([task, _haystack(task)])
+        self.entries.sort(key=_sort_key(self.sort_order))
+        self.refilter(full=True)
+        self.message = f"Task #{task.id} added"
+
+    def edit_fields(self, task, include_description=True):
+        """Prompt for each editable field on the status line; Esc keeps the current value"""
+        if include_description:
+            value = self.prompt("Description: ", task.description)
+            if value and value.strip():
+                task.description = value.strip()
+
+        value = self.prompt("Priority (High/Medium/Low): ", getattr(task, 'priority', 'Medium'))
+        if value and value.capitalize() in PRIORITIES:
+            task.priority = value.capitalize()
+
+        value = self.prompt("Due date (YYYY-MM-DD, empty for none): ", getattr(task, 'due_date', None) or "")
+        if value is not None:
+            try:
+                if value.strip():
+                    datetime.datetime.strptime(value.strip(), "%Y-%m-%d")
+                task.due_date = value.strip() or None
+            except ValueError:
+                self.message = "Invalid date; due date unchanged"
+
+        value = self.prompt("Category: ", getattr(task, 'category', None) or "")
+        if value is not None:
+            task.category = value.strip() or None
+
+        value = self.prompt("Progress (0-100): ", str(getattr(task, 'progress', 0)))
+        if value is not None and value.strip().isdigit() and 0 <= int(value) <= 100:
+            task.progress = int(value)
+
+        value = self.prompt("Notes: ", getattr(task, 'notes', None) or "")
+        if value is not None:
+            task.notes = value
+
+    def details(self):
+        """Show every field of the selected task; e edits, space toggles, d deletes"""
+        entry = self.current()
+        if entry is None:
+            return
+        task = entry[0]
+
+        while True:
+            self.redraw_all()
+            lines = [
+                f"Task #{task.id}",
+                "",
+                f"Description: {task.description}",
+                f"Status:      {'Completed' if task.completed else 'Active'}",
+                f"Priority:    {getattr(task, 'priority', 'Medium')}",
+                f"Due Date:    {getattr(task, 'due_date', None) or '-'}",
+                f"Repeats:     {describe_rule(task.recurrence) if getattr(task, 'recurrence', None) else '-'}",
+                f"Category:    {getattr(task, 'category', None) or '-'}",
+                f"Progress:    {getattr(task, 'progress', 0)}%",
+                f"Created:     {getattr(task, 'created_at', '-')}",
+                "",
+                "Notes:",
+            ] + (getattr(task, 'notes', None) or "-").splitlines()
+            height, width = self.stdscr.getmaxyx()
+            for row, line in enumerate(lines[:height - BOTTOM_LINES]):
+                self.put_line(row, line[:width - 1], curses.A_BOLD if row == 0 else curses.A_NORMAL)
+            self.put_line(height - 1, "e edit  space toggle  d delete  Esc/q back"[:width - 1], curses.A_DIM)
+            self.stdscr.refresh()
+
+            key = self.stdscr.get_wch()
+            if key in ("q", "\x1b", KEY_ESCAPE, curses.KEY_LEFT):
+                break
+            if key == "e":
+                self.edit_fields(task)
+                self.changed(entry)
+            elif key == " ":
+                self.toggle(entry)
+            elif key == "d":
+                self.delete(entry)
+                if entry not in self.entries:
+                    break
+        self.redraw_all()
+
+    def run(self):
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+
+        while True:
+            self.sync()
+            self.draw()
+            # Wake up periodically so changes saved elsewhere show up while idle
+            self.stdscr.timeout(SYNC_INTERVAL_MS)
+            try:
+                key = self.stdscr.get_wch()
+            except curses.error:
+                continue
+            finally:
+                self.stdscr.timeout(-1)
+            self.message = ""
+
+            if key in ("q", "Q"):
+                return
+            if key == curses.KEY_RESIZE:
+                self.redraw_all()
+            elif key in (curses.KEY_UP, "k"):
+                self.move(-1)
+            elif key in (curses.KEY_DOWN, "j"):
+                self.move(1)
+            elif key == curses.KEY_PPAGE:
+                self.move(-self.list_height())
+            elif key == curses.KEY_NPAGE:
+                self.move(self.list_height())
+            elif key in (curses.KEY_HOME, "g"):
+                self.cursor = 0
+            elif key in (curses.KEY_END, "G"):
+                self.cursor = max(len(self.view) - 1, 0)
+            elif key == "/":
+                self.search()
+            elif key == "\x1b" or key == KEY_ESCAPE:
+                self.query = ""
+                self.refilter(full=True)
+            elif key in ("\n", "\r") or key in KEY_ENTER_CODES:
+                self.details()
+            elif key == " ":
+                self.toggle()
+            elif key == "d":
+                self.delete()
+            elif key == "a":
+                self.add()
+            elif key == "f":
+                self.status_filter = STATUS_FILTERS[(STATUS_FILTERS.index(self.status_filter) + 1) % len(STATUS_FILTERS)]
+                self.refilter(full=True)
+            elif key == "s":
+                self.sort_order = SORT_ORDERS[(SORT_ORDERS.index(self.sort_order) + 1) % len(SORT_ORDERS)]
+                self.entries.sort(key=_sort_key(self.sort_order))
+                self.refilter(full=True)
+
+def run_tui(repo=None):
+    """Run the full-screen interface until the user quits"""
+    import os
+    from task_manager.utils.repository import TaskRepository
+
+    repo = repo if repo is not None else TaskRepository(merge_external=True)
+    # Make Esc respond immediately instead of waiting for an escape sequence
+    os.environ.setdefault("ESCDELAY", "25")
+    try:
+        curses.wrapper(lambda stdscr: TaskTUI(stdscr, repo).run())
+    finally:
+        repo.flush()
@@ -0,0 +1,143 @@
+"""
+Shell completion cache for Task Manager
+
+The storage layer rewrites a compact completion.json next to the tasks
+file whenever the completion-relevant data (active IDs, their short
+descriptions, categories) or the store version changes. Like the other
+sidecars it records the store signature it was built from, so a cache
+left behind by a failed write or an older version is rebuilt instead of
+offering deleted or completed tasks. Template names are cached in the
+same file and re-listed only when the templates directory's mtime
+changes. Completion therefore never loads the store (unless the cache is
+stale) or parses templates.
+"""
+
+import os
+import json
+from task_manager.utils.paths import get_storage_directory, get_store_signature
+
+CACHE_FORMAT = 2
+
+# Descriptions are cut to this length for the completion menu
+DESCRIPTION_WIDTH = 40
+
+# Kinds of candidates that can be requested from the cache
+COMPLETION_KINDS = ("ids", "categories", "templates")
+
+def get_completion_file_path():
+    """Get path to the completion cache file"""
+    return os.path.join(get_storage_directory(), "completion.json")
+
+def _templates_directory():
+    return os.path.join(get_storage_directory(), "templates")
+
+def _templates_mtime():
+    try:
+        return os.stat(_templates_directory()).st_mtime_ns
+    except OSError:
+        return None
+
+def list_template_names():
+    """List template names from file names, without reading the templates"""
+    try:
+        filenames = os.listdir(_templates_directory())
+    except OSError:
+        return []
+    # Use the on-disk (underscore) form so names need no shell quoting
+    return sorted(os.path.splitext(f)[0] for f in filenames if f.endswith('.json'))
+
+def _truncate(text):
+    text = " ".join(str(text).split())
+    if len(text) > DESCRIPTION_WIDTH:
+        return text[:DESCRIPTION_WIDTH - 1] + "…"
+    return text
+
+def build_completion_data(tasks):
+    """Extract the completion candidates from a task list"""
+    ids = []
+    categories = set()
+    for task in tasks:
+        category = getattr(task, 'category', None)
+        if category:
+            categories.add(category)
+        if not task.completed:
+            ids.append([task.id, _truncate(task.description)])
+
+    return {"ids": ids, "categories": sorted(categories)}
+
+def _read_cache():
+    try:
+        with open(get_completion_file_path(), 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return cache if cache.get("format") == CACHE_FORMAT else None
+
+def _write_cache(cache):
+    path = get_completion_file_path()
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(cache, f, separators=(",", ":"), ensure_ascii=False)
+    os.replace(temp_path, path)
+
+def _is_current(cache):
+    """Whether the cached candidates were built from the saved store as it is now"""
+    return list(get_store_signature() or []) == (cache.get("store_version") or [])
+
+def update_completion_cache(tasks, store_version):
+    """Refresh the cache after a save, rewriting it only if it is out of date
+
+    The file isn't touched when both the candidates and the store version
+    it was built from are unchanged. Returns True if the cache was
+    rewritten.
+    """
+    data = build_completion_data(tasks)
+    data["store_version"] = list(store_version) if store_version else None
+    cache = _read_cache() or {"format": CACHE_FORMAT}
+
+    if all(cache.get(key) == value for key, value in data.items()):
+        return False
+
+    cache.update(data)
+    cache.setdefault("templates", {"mtime": _templates_mtime(), "names": list_template_names()})
+    _write_cache(cache)
+    return True
+
+def get_candidates(kind):
+    """Return completion candidates of the given kind
+
+    ids are returned as (id, description) pairs; the other kinds as
+    strings. Falls back to rebuilding the cache from the store when no
+    cache file exists yet or it doesn't match the saved store.
+    """
+    if kind not in COMPLETION_KINDS:
+        raise ValueError(f"Unknown completion kind '{kind}'")
+
+    cache = _read_cache()
+
+    if kind == "templates":
+        cache = cache or {"format": CACHE_FORMAT}
+        templates = cache.get("templates") or {}
+        mtime = _templates_mtime()
+        if templates.get("mtime") != mtime or "names" not in templates:
+            templates = {"mtime": mtime, "names": list_template_names()}
+            cache["templates"] = templates
+            try:
+                _write_cache(cache)
+            except OSError:
+                pass
+        return templates["names"]
+
+    if cache is None or "ids" not in cache or not _is_current(cache):
+        from task_manager.utils.storage import load_tasks
+        tasks = load_tasks()
+        try:
+            update_completion_cache(tasks, get_store_signature())
+            cache = _read_cache()
+        except OSError:
+            cache = None
+        cache = cache or build_completion_data(tasks)
+
+    if kind == "ids":
+        return [tuple(entry) for entry in cache.get("ids", [])]
+    return cache.get("categories", [])
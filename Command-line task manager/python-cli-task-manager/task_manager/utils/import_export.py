@@ -5,8 +5,19 @@ Import and export utilities for Task Manager
 import json
 import csv
 import os
+import sys
 from task_manager.models.task import Task
 
+# Fields written by the CSV export and the streaming record formats
+RECORD_FIELDS = ['id', 'description', 'completed', 'priority',
+                 'due_date', 'category', 'progress', 'created_at', 'recurrence']
+
+# Machine-readable formats supported by stream_records
+STREAM_FORMATS = ('jsonl', 'csv', 'tsv')
+
+# Flush the output after this many records so pipes see data early
+FLUSH_EVERY = 64
+
 def export_to_json(tasks, file_path):
     """Export tasks to a JSON file"""
     # Convert tasks to dictionaries
@@ -35,36 +46,81 @@ def import_from_json(file_path):
                    completed=completed, created_at=created_at)
 
         # Set all remaining attributes
+        recurrence = task_dict.pop('recurrence', None)
         for key, value in task_dict.items():
             setattr(task, key, value)
+        _import_recurrence(task, recurrence)
 
         tasks.append(task)
 
     return tasks
 
+def _import_recurrence(task, rule):
+    """Set an imported recurrence rule, skipping it with a warning if it is invalid"""
+    if not rule:
+        return
+    try:
+        task.set_recurrence(rule)
+    except (ValueError, TypeError) as e:
+        print(f"Warning: Ignoring invalid recurrence '{rule}' on task {task.id}: {e}")
+
+def task_to_record(task):
+    """Extract the exported fields of a task as a dictionary"""
+    return {
+        'id': task.id,
+        'description': task.description,
+        'completed': task.completed,
+        'priority': getattr(task, 'priority', 'Medium'),
+        'due_date': getattr(task, 'due_date', ''),
+        'category': getattr(task, 'category', ''),
+        'progress': getattr(task, 'progress', 0),
+        'created_at': getattr(task, 'created_at', ''),
+        'recurrence': getattr(task, 'recurrence', None) or ''
+    }
+
+def stream_records(tasks, fmt, stream=None):
+    """Write tasks one record per line in jsonl, csv or tsv format
+
+    Records are written as the iterator yields them and the stream is
+    flushed after the first record and every FLUSH_EVERY records after
+    that. Returns the number of records written.
+    """
+    if fmt not in STREAM_FORMATS:
+        raise ValueError(f"Unsupported format '{fmt}'")
+
+    stream = stream or sys.stdout
+
+    if fmt == 'jsonl':
+        def write(record):
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+    else:
+        writer = csv.DictWriter(stream, fieldnames=RECORD_FIELDS,
+                                delimiter='\t' if fmt == 'tsv' else ',',
+                                lineterminator='\n')
+        writer.writeheader()
+        write = writer.writerow
+
+    count = 0
+    for task in tasks:
+        write(task_to_record(task))
+        count += 1
+        if count == 1 or count % FLUSH_EVERY == 0:
+            stream.flush()
+
+    stream.flush()
+    return count
+
 def export_to_csv(tasks, file_path):
     """Export tasks to a CSV file"""
     # Define CSV headers
-    headers = ['id', 'description', 'completed', 'priority',
-              'due_date', 'category', 'progress', 'created_at']
+    headers = RECORD_FIELDS
 
     with open(file_path, 'w', newline='') as f:
         writer = csv.DictWriter(f, fieldnames=headers)
         writer.writeheader()
 
         for task in tasks:
-            # Extract needed attributes from the task
-            row = {
-                'id': task.id,
-                'description': task.description,
-                'completed': task.completed,
-                'priority': getattr(task, 'priority', 'Medium'),
-                'due_date': getattr(task, 'due_date', ''),
-                'category': getattr(task, 'category', ''),
-                'progress': getattr(task, 'progress', 0),
-                'created_at': getattr(task, 'created_at', '')
-            }
-            writer.writerow(row)
+            writer.writerow(task_to_record(task))
 
 def import_from_csv(file_path):
     """Import tasks from a CSV file"""
@@ -92,6 +148,9 @@ def import_from_csv(file_path):
             if 'category' in row and row['category']:
                 task.category = row['category']
 
+            if row.get('recurrence'):
+                _import_recurrence(task, row['recurrence'])
+
             if 'progress' in row and row['progress']:
                 try:
                     task.progress = int(row['progress'])
@@ -10,17 +10,66 @@ The module also includes a background service to check for task reminders.
 """
 
 import time
+import heapq
+import bisect
+import datetime
 import threading
 import platform
 import subprocess
 import logging
 from functools import lru_cache
-from task_manager.utils.storage import load_tasks, save_tasks
-from task_manager.utils.settings import load_settings
+from task_manager.utils.storage import load_tasks, save_tasks, get_store_signature
+from task_manager.utils.settings import get_settings, subscribe_settings, parse_clock_time
+from task_manager.utils.reminders import (
+    reminder_entry, due_entry, read_reminder_index, load_reminder_index,
+    record_notified, record_due_alert, load_notified_log, compact_notified, clear_notified
+)
+from task_manager.utils.recurrence import next_reminder_time, shift_date
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Longest the reminder service sleeps before checking whether the store
+# changed, when file change notifications are not available
+STORE_CHECK_INTERVAL = 30.0
+
+# Notification dispatch: queue bound, seconds submit() may block when it is
+# full, and seconds the worker waits for more notifications to coalesce
+DISPATCH_QUEUE_SIZE = 256
+SUBMIT_TIMEOUT = 5.0
+COALESCE_WINDOW = 0.25
+
+# Longest check_reminders() waits, without the service thread, for the
+# notifications it queued to be shown before returning
+IDLE_WAIT_TIMEOUT = 30.0
+
+# Defaults for the notifications.digest_threshold and sound_interval settings
+DEFAULT_DIGEST_THRESHOLD = 5
+DEFAULT_SOUND_INTERVAL = 10
+
+# Task lines listed in a digest notification, and latencies kept for stats()
+DIGEST_LINES = 5
+LATENCY_SAMPLES = 512
+
+# Seconds to wait for the reminder index when it lags behind a save
+INDEX_RETRY_DELAY = 0.2
+
+# Obsolete notified-log lines tolerated before the log is compacted
+NOTIFIED_LOG_SLACK = 1000
+
+# Seconds of "due soon" alerts queued at a time; the window moves forward as
+# time passes, so only tasks due in it are ever scheduled
+DUE_ALERT_WINDOW = 3600.0
+
+# Time of day a due date counts as due when the setting is invalid (09:00)
+DEFAULT_DUE_TIME = 9 * 3600
+
+# Linux notification backends, in the order they are probed
+LINUX_BACKENDS = ("dbus", "notify-send", "zenity")
+
+# Seconds before backends are probed again after all of them failed
+REPROBE_INTERVAL = 300
+
 # Global settings for notifications
 NOTIFICATION_SETTINGS = {
     'enabled': True,
@@ -41,6 +90,12 @@ class NotificationManager:
     def __init__(self):
         self.platform = get_platform()
         self._notification_libs = {}
+        # Name of the backend that last worked, used first for every notification
+        self.backend = None
+        self._probe_failed_at = None
+        # Session bus connection and Notifications proxy, reused across notifications
+        self._dbus_bus = None
+        self._dbus_interface = None
 
     def _import_platform_lib(self, lib_name):
         """Import a platform-specific notification library"""
@@ -69,7 +124,7 @@ class NotificationManager:
             logger.error(f"Error importing {lib_name}: {e}")
             self._notification_libs[lib_name] = None
             return None
-    def show_notification(self, title, message, timeout=5):
+    def show_notification(self, title, message, timeout=5, play_sound=True):
         """
         Show a notification using the best available method for the platform
 
@@ -77,18 +132,19 @@ class NotificationManager:
             title: Notification title
             message: Notification message
             timeout: Notification timeout in seconds
+            play_sound: Set False to skip the sound even if it is enabled
 
         Returns:
             bool: True if notification was shown, False otherwise
         """
-        # Check if notifications are enabled
-        settings = load_settings()
+        # Check if notifications are enabled (cached; no file I/O per notification)
+        settings = get_settings()
         if not settings.get('notifications', {}).get('enabled', True):
             logger.debug("Notifications are disabled in settings")
             return False
 
         # Make sound if enabled
-        if settings.get('notifications', {}).get('sound', True):
+        if play_sound and settings.get('notifications', {}).get('sound', True):
             self._play_notification_sound()
 
         # Try platform-specific notifications
@@ -183,22 +239,73 @@ class NotificationManager:
 
         return False
 
+    def _linux_senders(self):
+        """Linux notification backends in order of preference"""
+        return {
+            "dbus": self._send_dbus,
+            "notify-send": self._send_notify_send,
+            "zenity": self._send_zenity,
+        }
+
     def _show_linux_notification(self, title, message, timeout=5):
         """Show notification on Linux"""
-        # Try dbus
-        dbus_lib = self._import_platform_lib('dbus')
-        if dbus_lib:
+        return self._send_with_probe(LINUX_BACKENDS, self._linux_senders(), title, message, timeout)
+
+    def _send_with_probe(self, order, senders, title, message, timeout):
+        """Send through the cached working backend, probing for one only when needed
+
+        The first backend that works is remembered and used directly from
+        then on. If it fails, the backends are probed again in order; if
+        none works, probing is skipped for REPROBE_INTERVAL seconds.
+        """
+        if self.backend is not None:
             try:
-                session_bus = dbus_lib.SessionBus()
-                obj = session_bus.get_object(
-                    'org.freedesktop.Notifications',
-                    '/org/freedesktop/Notifications'
-                )
-                interface = dbus_lib.Interface(
-                    obj,
-                    'org.freedesktop.Notifications'
-                )
-                interface.Notify(
+                senders[self.backend](title, message, timeout)
+                return True
+            except Exception as e:
+                logger.warning(f"Notification backend {self.backend} failed, probing again: {e}")
+                self.backend = None
+
+        now = time.monotonic()
+        if self._probe_failed_at is not None and now - self._probe_failed_at < REPROBE_INTERVAL:
+            return False
+
+        for name in order:
+            try:
+                senders[name](title, message, timeout)
+            except Exception as e:
+                logger.debug(f"Notification backend {name} unavailable: {e}")
+                continue
+            logger.debug(f"Using notification backend {name}")
+            self.backend = name
+            self._probe_failed_at = None
+            return True
+
+        self._probe_failed_at = now
+        return False
+
+    def _dbus_proxy(self):
+        """Return the Notifications interface, connecting to the session bus once"""
+        if self._dbus_interface is None:
+            dbus_lib = self._import_platform_lib('dbus')
+            if not dbus_lib:
+                raise RuntimeError("dbus module not available")
+            self._dbus_bus = dbus_lib.SessionBus()
+            obj = self._dbus_bus.get_object(
+                'org.freedesktop.Notifications',
+                '/org/freedesktop/Notifications'
+            )
+            self._dbus_interface = dbus_lib.Interface(
+                obj,
+                'org.freedesktop.Notifications'
+            )
+        return self._dbus_interface
+
+    def _send_dbus(self, title, message, timeout=5):
+        """Send a notification over the persistent D-Bus connection"""
+        for attempt in range(2):
+            try:
+                self._dbus_proxy().Notify(
                     "Task Manager",     # app_name
                     0,                  # replaces_id
                     "",                 # app_icon
@@ -208,28 +315,22 @@ class NotificationManager:
                     {},                 # hints
                     timeout * 1000      # timeout in ms
                 )
-                return True
-            except Exception as e:
-                logger.error(f"Error using D-Bus notification: {e}")
-
-        # Try notify-send
-        try:
-            subprocess.run(['notify-send', title, message], check=True, capture_output=True)
-            return True
-        except Exception:
-            pass
-
-        # Try zenity
-        try:
-            subprocess.run(
-                ['zenity', '--notification', '--text', f"{title}: {message}"],
-                check=True, capture_output=True
-            )
-            return True
-        except Exception:
-            pass
-
-        return False
+                return
+            except Exception:
+                # Drop a connection that went stale (e.g. the daemon restarted)
+                # and retry once on a fresh one
+                self._dbus_bus = self._dbus_interface = None
+                if attempt or self._import_platform_lib('dbus') is None:
+                    raise
+
+    def _send_notify_send(self, title, message, timeout=5):
+        subprocess.run(['notify-send', title, message], check=True, capture_output=True)
+
+    def _send_zenity(self, title, message, timeout=5):
+        subprocess.run(
+            ['zenity', '--notification', '--text', f"{title}: {message}"],
+            check=True, capture_output=True
+        )
 
     def _show_console_notification(self, title, message):
         """Show a notification in the console as a fallback"""
@@ -258,6 +359,150 @@ def show_notification(title, message, timeout=5):
     """Show a notification using the appropriate method for the platform"""
     return notification_manager.show_notification(title, message, timeout)
 
+class NotificationDispatcher:
+    """Show notifications from a worker thread instead of the caller's
+
+    submit() only enqueues, so a burst of reminders (for example after the
+    machine wakes up) never blocks the reminder service on slow backends.
+    The worker gathers whatever arrives within COALESCE_WINDOW seconds;
+    bursts at or above the notifications.digest_threshold setting are
+    shown as a single digest notification. The sound is played at most
+    once per notifications.sound_interval seconds. The queue is bounded:
+    when it is full, submit() blocks (backpressure) and drops the
+    notification only if it times out. stats() reports queue depth,
+    counters and enqueue-to-display latency.
+    """
+
+    def __init__(self, manager=None, maxsize=DISPATCH_QUEUE_SIZE):
+        import collections
+        import queue
+
+        self.manager = manager or notification_manager
+        self.queue = queue.Queue(maxsize=maxsize)
+        self.thread = None
+        self.lock = threading.Lock()
+        self.last_sound = None
+        self.counters = {"submitted": 0, "delivered": 0, "failed": 0, "digests": 0, "dropped": 0}
+        # Recent enqueue-to-display latencies in seconds
+        self.latencies = collections.deque(maxlen=LATENCY_SAMPLES)
+
+    def start(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._worker_loop, daemon=True)
+                self.thread.start()
+
+    def submit(self, title, message, timeout=5, block_timeout=SUBMIT_TIMEOUT):
+        """Queue a notification; returns False if it was dropped because the queue stayed full"""
+        import queue
+
+        self.start()
+        try:
+            self.queue.put((time.monotonic(), title, message, timeout), timeout=block_timeout)
+        except queue.Full:
+            with self.lock:
+                self.counters["dropped"] += 1
+            logger.warning(f"Notification queue full, dropped: {title}")
+            return False
+        with self.lock:
+            self.counters["submitted"] += 1
+        return True
+
+    def _collect_batch(self):
+        """Wait for a notification, then gather any that follow within the coalescing window"""
+        import queue
+
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + COALESCE_WINDOW
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        # Anything already waiting joins this batch too
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def _sound_allowed(self, interval):
+        now = time.monotonic()
+        if self.last_sound is not None and now - self.last_sound < interval:
+            return False
+        self.last_sound = now
+        return True
+
+    def _show(self, title, message, timeout, interval):
+        try:
+            return self.manager.show_notification(title, message, timeout,
+                                                  play_sound=self._sound_allowed(interval))
+        except Exception as e:
+            logger.error(f"Error showing notification: {e}")
+            return False
+
+    def _worker_loop(self):
+        while True:
+            batch = self._collect_batch()
+
+            settings = get_settings().get('notifications', {})
+            threshold = settings.get('digest_threshold', DEFAULT_DIGEST_THRESHOLD)
+            interval = settings.get('sound_interval', DEFAULT_SOUND_INTERVAL)
+
+            if threshold and len(batch) >= threshold:
+                lines = [message for _, _, message, _ in batch[:DIGEST_LINES]]
+                if len(batch) > DIGEST_LINES:
+                    lines.append(f"...and {len(batch) - DIGEST_LINES} more")
+                shown = self._show(f"{len(batch)} Task Reminders", "\n".join(lines),
+                                   batch[0][3], interval)
+                results = [shown] * len(batch)
+                with self.lock:
+                    self.counters["digests"] += 1
+            else:
+                results = [self._show(title, message, timeout, interval)
+                           for _, title, message, timeout in batch]
+
+            finished = time.monotonic()
+            with self.lock:
+                for (queued, _, _, _), shown in zip(batch, results):
+                    self.latencies.append(finished - queued)
+                    self.counters["delivered" if shown else "failed"] += 1
+
+            for _ in batch:
+                self.queue.task_done()
+
+    def wait_idle(self, timeout=None):
+        """Block until every queued notification has been handled
+
+        Returns False if timeout seconds passed first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self.queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stats(self):
+        """Return queue depth, counters and latency figures for monitoring"""
+        with self.lock:
+            latencies = sorted(self.latencies)
+            stats = dict(self.counters)
+        stats["queue_depth"] = self.queue.qsize()
+        if latencies:
+            stats["latency_avg"] = sum(latencies) / len(latencies)
+            stats["latency_p95"] = latencies[min(int(len(latencies) * 0.95), len(latencies) - 1)]
+            stats["latency_max"] = latencies[-1]
+        return stats
+
+# Global notification dispatcher used by the reminder service
+notification_dispatcher = NotificationDispatcher()
+
 def test_notification():
     """Test the notification system"""
     return show_notification(
@@ -293,6 +538,7 @@ def set_task_reminder(task, reminder_datetime):
                 break
 
         save_tasks(tasks)
+        reminder_service.schedule(task)
 
         logger.info(f"Reminder set for task {task.id} at {reminder_datetime.strftime('%Y-%m-%d %H:%M')}")
         return True
@@ -301,12 +547,227 @@ def set_task_reminder(task, reminder_datetime):
         logger.error(f"Error setting reminder: {e}")
         return False
 
-class ReminderService:
-    """Background service to check for task reminders"""
+class SystemClock:
+    """Wall-clock time source for the reminder service
+
+    ReminderService takes the clock as a parameter so tests and benchmarks
+    can substitute a simulated one (see benchmarks/reminder_lateness.py).
+    """
+
+    def time(self):
+        return time.time()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def wait(self, cond, timeout):
+        """Wait on a held condition; returns False if the timeout expired"""
+        return cond.wait(timeout)
+
+class DueAlertSchedule:
+    """"Due soon" alerts derived from the sorted due-date index
+
+    An alert goes out advance_warning minutes before a task's due time
+    (its due date at the due_time setting) and at most once per task and
+    due date. Alerts for tasks already past due are not sent. Only the
+    alerts falling within DUE_ALERT_WINDOW seconds are queued; extend()
+    moves the window on, using bisection on the sorted entries, and the
+    next extension is timed for the next due date after the window, so
+    the work done is proportional to the tasks due in the window. Not
+    thread-safe: ReminderService calls it with its condition held.
+    """
 
     def __init__(self):
+        # [due_date, task id, description, priority], sorted by date
+        self.entries = []
+        self.by_id = {}
+        # (task ID, due date) pairs already alerted
+        self.sent = set()
+        # (alert time, task id, due date); stale ones are skipped when popped
+        self.heap = []
+        self.pending = {}
+        # Last due date queued so far, and when to queue more
+        self.scheduled_until = None
+        self.next_extend = None
+        # Seconds before the due time, or None when alerts are off
+        self.warning = None
+        self.due_time = DEFAULT_DUE_TIME
+
+    def configure(self, enabled, warning_minutes, due_time):
+        """Apply the settings; returns True if the schedule has to be rebuilt"""
+        warning = warning_minutes * 60 if enabled else None
+        if due_time is None:
+            due_time = DEFAULT_DUE_TIME
+        changed = (warning, due_time) != (self.warning, self.due_time)
+        self.warning, self.due_time = warning, due_time
+        return changed
+
+    def replace(self, entries, sent, now):
+        """Start over from a new sorted entry list"""
+        self.entries = entries
+        self.by_id = {entry[1]: entry for entry in entries}
+        self.sent = sent
+        self.reset(now)
+
+    def reset(self, now):
+        """Drop everything queued and queue the alerts in the window from now"""
+        self.heap = []
+        self.pending = {}
+        self.scheduled_until = None
+        self.next_extend = None
+        if self.warning is not None:
+            self.extend(now)
+
+    def _times(self, due_date):
+        """Return (alert time, due time) for a due date string, or None if it is invalid"""
+        try:
+            day = datetime.datetime.strptime(due_date, "%Y-%m-%d")
+        except ValueError:
+            return None
+        due = (day + datetime.timedelta(seconds=self.due_time)).timestamp()
+        return due - self.warning, due
+
+    def _queue(self, entry, now):
+        due_date, task_id = entry[0], entry[1]
+        if (task_id, due_date) in self.sent:
+            return
+        times = self._times(due_date)
+        if times is None or times[1] <= now:
+            return
+        self.pending[task_id] = (times[0], due_date)
+        heapq.heappush(self.heap, (times[0], task_id, due_date))
+
+    def extend(self, now):
+        """Queue the alerts that fall due before now + DUE_ALERT_WINDOW"""
+        horizon = now + DUE_ALERT_WINDOW
+        # Latest due date whose alert is before the horizon
+        last_day = datetime.datetime.fromtimestamp(horizon + self.warning - self.due_time)
+        last_date = last_day.strftime("%Y-%m-%d")
+
+        if self.scheduled_until is None:
+            first_day = datetime.datetime.fromtimestamp(now - self.due_time)
+            start = bisect.bisect_left(self.entries, [first_day.strftime("%Y-%m-%d")])
+        else:
+            start = bisect.bisect_right(self.entries, [self.scheduled_until, float("inf")])
+        end = bisect.bisect_right(self.entries, [last_date, float("inf")])
+
+        for entry in self.entries[start:end]:
+            self._queue(entry, now)
+        if self.scheduled_until is None or last_date > self.scheduled_until:
+            self.scheduled_until = last_date
+
+        # Nothing to do until the next due date beyond the window comes up
+        self.next_extend = None
+        for entry in self.entries[end:]:
+            times = self._times(entry[0])
+            if times is not None:
+                self.next_extend = max(times[0], horizon)
+                break
+
+    def remove(self, task_id):
+        """Forget a task's due date (it was deleted, completed or changed)"""
+        entry = self.by_id.pop(task_id, None)
+        self.pending.pop(task_id, None)
+        if entry is not None:
+            index = bisect.bisect_left(self.entries, entry)
+            if index < len(self.entries) and self.entries[index] is entry:
+                del self.entries[index]
+            else:
+                self.entries.remove(entry)
+
+    def update(self, task_id, entry, now):
+        """Replace one task's entry (None if it no longer has an active due date)"""
+        self.remove(task_id)
+        if entry is None:
+            return
+        bisect.insort(self.entries, entry)
+        self.by_id[task_id] = entry
+        if self.warning is None or self.scheduled_until is None:
+            return
+        if entry[0] <= self.scheduled_until:
+            self._queue(entry, now)
+            return
+        times = self._times(entry[0])
+        if times is not None and (self.next_extend is None or times[0] < self.next_extend):
+            self.next_extend = times[0]
+
+    def next_time(self):
+        """When the schedule next needs attention, or None"""
+        while self.heap and self.pending.get(self.heap[0][1]) != self.heap[0][0::2]:
+            heapq.heappop(self.heap)
+        times = [t for t in (self.heap[0][0] if self.heap else None, self.next_extend) if t is not None]
+        return min(times) if times else None
+
+    def pop_due(self, now):
+        """Extend the window if it is time, then remove and return the entries to alert for"""
+        if self.next_extend is not None and now >= self.next_extend:
+            self.extend(now)
+
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            alert_time, task_id, due_date = heapq.heappop(self.heap)
+            if self.pending.get(task_id) != (alert_time, due_date):
+                continue
+            del self.pending[task_id]
+            entry = self.by_id.get(task_id)
+            if entry is not None and entry[0] == due_date:
+                due.append(entry)
+        return due
+
+class ReminderService:
+    """Background service that fires task reminders when they come due
+
+    Pending reminders are kept in a min-heap keyed by reminder time, and
+    the service thread sleeps on a condition until the earliest one is due.
+    Scheduling, changing or cancelling a reminder wakes it immediately.
+    Reminders are read from the reminder index (utils/reminders.py), only
+    when the store has actually changed: a watcher thread reports saves
+    through inotify where available, and otherwise the store's signature
+    is checked every STORE_CHECK_INTERVAL seconds. Fired reminders are
+    appended to the notified log, so this thread never writes the store.
+
+    "Due soon" alerts for tasks with a due date are scheduled alongside,
+    by a DueAlertSchedule built from the same index.
+
+    A front end that keeps the tasks in memory (the GUI) can attach() its
+    TaskRepository instead. Reminders then come from the repository's
+    snapshots and change notifications, including edits not saved yet, and
+    the store is not read at all; disk is only the standalone fallback.
+
+    The clock (time, sleep and condition waits) and the notifier (anything
+    with submit(title, message)) can be replaced, which lets reminder
+    timing be tested without waiting in real time.
+    """
+
+    def __init__(self, clock=None, notifier=None):
+        self.clock = clock or SystemClock()
+        # None means the global notification_dispatcher
+        self.notifier = notifier
         self.running = False
         self.thread = None
+        self.watch_thread = None
+        self.cond = threading.Condition()
+        # (reminder time, task id) entries; stale ones are skipped when popped
+        self.heap = []
+        # Task ID -> reminder time currently scheduled
+        self.pending = {}
+        # Task ID -> reminder index entry, for building the notification
+        self.entries = {}
+        # (task ID, reminder time) pairs that have already fired
+        self.notified = set()
+        # Task ID -> latest reminder time fired, for recurring tasks
+        self.last_notified = {}
+        self.due = DueAlertSchedule()
+        # Incremented whenever a reminder or due alert fires, so a reload can
+        # tell that the notified log it read is already out of date
+        self.fired_count = 0
+        self.signature = None
+        self.reload_needed = True
+        self.store_watched = False
+        self._unsubscribe_settings = None
+        # In-process TaskRepository to follow instead of the store
+        self.source = None
+        self._unsubscribe_source = None
 
     def start(self):
         """Start the reminder service in a background thread"""
@@ -315,6 +776,11 @@ class ReminderService:
             return self.thread
 
         self.running = True
+        self.reload_needed = True
+        self.settings_changed(get_settings())
+        self._unsubscribe_settings = subscribe_settings(self.settings_changed)
+        if self.source is None:
+            self._start_watcher()
         self.thread = threading.Thread(target=self._service_loop, daemon=True)
         self.thread.start()
         logger.info("Reminder service started")
@@ -322,81 +788,361 @@ class ReminderService:
 
     def stop(self):
         """Stop the reminder service"""
-        self.running = False
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+        if self._unsubscribe_settings:
+            self._unsubscribe_settings()
+            self._unsubscribe_settings = None
         logger.info("Reminder service stopped")
 
-    def _service_loop(self):
-        """Main service loop that checks for reminders"""
-        while self.running:
+    def attach(self, repository):
+        """Follow an in-process TaskRepository instead of the saved store"""
+        self.detach()
+        self.source = repository
+        self._unsubscribe_source = repository.subscribe(self._source_changed)
+        self.store_changed()
+
+    def detach(self):
+        """Go back to reading reminders from the saved store"""
+        if self._unsubscribe_source:
+            self._unsubscribe_source()
+            self._unsubscribe_source = None
+        if self.source is not None:
+            self.source = None
+            with self.cond:
+                self.signature = None
+                self.reload_needed = True
+                self.cond.notify_all()
+            if self.running and not self.store_watched:
+                self._start_watcher()
+
+    def _source_changed(self, changed):
+        """Repository subscriber: runs on the thread that changed the tasks"""
+        if changed is None:
+            self.store_changed()
+        else:
+            for task in changed:
+                self.schedule(task)
+
+    def _start_watcher(self):
+        """Watch the store for saves by any process, if the platform allows it"""
+        from task_manager.utils.watch import StoreWatcher
+
+        watcher = StoreWatcher()
+        if watcher.mode != "inotify":
+            watcher.close()
+            self.store_watched = False
+            return
+
+        def watch_loop():
+            with watcher:
+                while self.running and self.source is None:
+                    # The timeout only bounds how long stop() takes to be noticed
+                    if watcher.wait(timeout=5.0):
+                        self.store_changed()
+
+        def watch_thread():
             try:
-                self.check_reminders()
-            except Exception as e:
-                logger.error(f"Error in reminder service: {e}")
+                watch_loop()
+            finally:
+                self.store_watched = False
 
-            # Sleep for a minute before checking again
-            time.sleep(60)
+        self.store_watched = True
+        self.watch_thread = threading.Thread(target=watch_thread, daemon=True)
+        self.watch_thread.start()
 
-    # Fix this method to handle task objects correctly
-    def check_reminders(self):
-        """Check tasks for due reminders"""
-        try:
-            tasks = load_tasks()
-            current_time = time.time()
-            updated = False
+    def _reminder_due_time(self, entry):
+        """Return when a reminder index entry should fire, or None if it shouldn't"""
+        if entry is None:
+            return None
+        # Skip completed tasks (unless notifications for completed tasks are enabled)
+        if entry["completed"] and not NOTIFICATION_SETTINGS.get('notify_completed', False):
+            return None
+        if entry.get("recurrence"):
+            # Occurrence reminders are worked out lazily, one at a time
+            after = self.last_notified.get(entry["id"])
+            if entry["notified"]:
+                after = max(after or entry["time"], entry["time"])
+            return next_reminder_time(entry["recurrence"], entry["due_date"], entry["time"],
+                                      after, self.clock.time())
+        if entry["notified"] or (entry["id"], entry["time"]) in self.notified:
+            return None
+        return entry["time"]
+
+    def schedule(self, task):
+        """Add, move or drop the reminder for a task and wake the service"""
+        entry = reminder_entry(task)
+        with self.cond:
+            due_time = self._reminder_due_time(entry)
+            if due_time is None:
+                self.pending.pop(task.id, None)
+            else:
+                self.entries[task.id] = entry
+                self.pending[task.id] = due_time
+                heapq.heappush(self.heap, (due_time, task.id))
+            self.due.update(task.id, due_entry(task), self.clock.time())
+            self.cond.notify_all()
+
+    def cancel(self, task_id):
+        """Drop any pending reminder for a task"""
+        with self.cond:
+            self.pending.pop(task_id, None)
+            self.due.remove(task_id)
+            self.cond.notify_all()
+
+    def store_changed(self):
+        """Ask the service to re-read the store if it was saved since the last load"""
+        with self.cond:
+            self.reload_needed = True
+            self.cond.notify_all()
+
+    def settings_changed(self, settings):
+        """Settings subscriber: apply notification settings, re-planning reminders if needed"""
+        values = settings.get('notifications', {})
+        current = NOTIFICATION_SETTINGS['notify_completed']
+        replan = values.get('notify_completed', current) != current
+        for key in NOTIFICATION_SETTINGS:
+            if key in values:
+                NOTIFICATION_SETTINGS[key] = values[key]
+
+        with self.cond:
+            # Due alerts are worked out from the settings, so a new warning
+            # window only re-plans them; nothing stored needs rewriting
+            if self.due.configure(values.get('due_alerts', True),
+                                  values.get('advance_warning', 15),
+                                  parse_clock_time(values.get('due_time', ''))):
+                self.due.reset(self.clock.time())
+                self.cond.notify_all()
+
+        if replan:
+            with self.cond:
+                # Completed tasks' reminders are now kept or dropped: rebuild even
+                # though the store itself is unchanged
+                self.signature = None
+                self.reload_needed = True
+                self.cond.notify_all()
+
+    def _reload(self):
+        """Re-read the reminders if their source changed (called without cond held)
+
+        The index and the notified log are read and parsed without holding
+        cond, so schedule() and the GUI are never kept waiting on disk;
+        cond is only taken to swap the rebuilt state in.
+        """
+        source = self.source
+        with self.cond:
+            signature = self.signature
+            fired = self.fired_count
+
+        generation = None
+        if source is None:
+            if get_store_signature() == signature:
+                return
+            index = self._read_index()
+        else:
+            # Snapshot without holding cond: repository callbacks take cond while
+            # holding the repository lock, so taking them the other way round could deadlock
+            generation = source.generation
+            tasks = source.snapshot()
+            entries = [entry for entry in map(reminder_entry, tasks) if entry is not None]
+            due = sorted(entry for entry in map(due_entry, tasks) if entry is not None)
+            index = {"store_version": None, "reminders": entries, "due": due}
+        notified, due_alerts = self._read_notified(index)
+
+        with self.cond:
+            if self.fired_count != fired:
+                # Something fired after the log was read; go again so it isn't repeated
+                self.reload_needed = True
+                return
+            self._rebuild(index, notified, due_alerts)
+            if generation is not None and source.generation != generation:
+                # Changed while the snapshot was taken; go again
+                self.reload_needed = True
+
+    def _read_index(self):
+        """Return the current reminder index (called without cond held)"""
+        index = read_reminder_index()
+        if index is None:
+            # The index is written just after the tasks file; give the saver a moment
+            self.clock.sleep(INDEX_RETRY_DELAY)
+            index = load_reminder_index()
+        return index
+
+    def _read_notified(self, index):
+        """Return (fired reminders, sent due alerts) from the notified log,
+        compacting it if it has grown well past the index (called without cond held)"""
+        notified, due_alerts = load_notified_log()
+        due = index.get("due", [])
+        if len(notified) + len(due_alerts) > \
+                2 * (len(index["reminders"]) + len(due)) + NOTIFIED_LOG_SLACK:
+            compact_notified(index, notified, due_alerts)
+        return notified, due_alerts
+
+    def _rebuild(self, index, notified, due_alerts):
+        """Replace the pending reminders with those in an index (called with cond held)"""
+        self.signature = tuple(index["store_version"]) if index.get("store_version") else None
+
+        self.notified = notified
+        self.last_notified = {}
+        for task_id, reminder_time in self.notified:
+            if reminder_time > self.last_notified.get(task_id, reminder_time - 1):
+                self.last_notified[task_id] = reminder_time
+        self.due.replace(index.get("due", []), due_alerts, self.clock.time())
+
+        self.entries = {entry["id"]: entry for entry in index["reminders"]}
+        self.pending = {}
+        for task_id, entry in self.entries.items():
+            due_time = self._reminder_due_time(entry)
+            if due_time is not None:
+                self.pending[task_id] = due_time
+        self.heap = [(due_time, task_id) for task_id, due_time in self.pending.items()]
+        heapq.heapify(self.heap)
+
+    def _pop_due(self, now):
+        """Remove and return the tasks whose reminders are due (called with cond held)"""
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            due_time, task_id = heapq.heappop(self.heap)
+            # Skip entries superseded by a later schedule() or cancel()
+            if self.pending.get(task_id) != due_time:
+                continue
+            del self.pending[task_id]
+            entry = self.entries[task_id]
+            if entry["time"] != due_time:
+                # A later occurrence of a recurring task: its own reminder time and due date
+                days = round((due_time - entry["time"]) / 86400)
+                entry = dict(entry, time=due_time, due_date=shift_date(entry["due_date"], days))
+            due.append(entry)
+        return due
+
+    def _next_timeout(self, now):
+        """Seconds to sleep before the next reminder or store check"""
+        # Drop stale entries so the head of the heap is a real reminder
+        while self.heap and self.pending.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+
+        timeout = max(self.heap[0][0] - now, 0) if self.heap else None
+        due_next = self.due.next_time()
+        if due_next is not None:
+            timeout = max(due_next - now, 0) if timeout is None else min(timeout, max(due_next - now, 0))
+        if not self.store_watched and self.source is None:
+            timeout = STORE_CHECK_INTERVAL if timeout is None else min(timeout, STORE_CHECK_INTERVAL)
+        return timeout
 
-            for task in tasks:
-                # Skip tasks that don't need reminders or aren't properly configured
-                if not hasattr(task, 'reminder_time') or task.reminder_time is None:
+    def _service_loop(self):
+        """Sleep until the earliest reminder is due, then fire it"""
+        while True:
+            with self.cond:
+                if not self.running:
+                    return
+                reload_needed, self.reload_needed = self.reload_needed, False
+
+            if reload_needed:
+                try:
+                    self._reload()
+                except Exception as e:
+                    logger.error(f"Error loading reminders: {e}")
+
+            with self.cond:
+                if not self.running:
+                    return
+                if self.reload_needed:
                     continue
 
-                # Skip completed tasks (unless notifications for completed tasks are enabled)
-                if task.completed and not NOTIFICATION_SETTINGS.get('notify_completed', False):
+                now = self.clock.time()
+                due = self._pop_due(now)
+                due_alerts = self.due.pop_due(now)
+                if not due and not due_alerts:
+                    timeout = self._next_timeout(now)
+                    if not self.clock.wait(self.cond, timeout) and not self.store_watched \
+                            and self.source is None:
+                        # Timed out without a watcher: look at the store signature
+                        self.reload_needed = True
                     continue
 
-                # Skip already notified reminders
-                if hasattr(task, 'reminder_notified') and task.reminder_notified:
-                    continue
+            try:
+                self._fire(due)
+                self._fire_due_alerts(due_alerts)
+            except Exception as e:
+                logger.error(f"Error in reminder service: {e}")
 
-                # Convert reminder_time to float if it's a string or handle invalid types
-                try:
-                    reminder_time = float(task.reminder_time)
-                except (ValueError, TypeError):
-                    logger.warning(f"Invalid reminder_time for task {task.id}")
-                    continue
+    def _fire(self, entries):
+        """Show notifications for due reminders and record them as notified"""
+        notifier = self.notifier or notification_dispatcher
+        for entry in entries:
+            # Format due date info if available
+            due_info = ""
+            if entry["due_date"]:
+                due_info = f" (Due: {entry['due_date']})"
+
+            # Format priority if available and not Medium
+            priority_str = ""
+            if entry["priority"] != "Medium":
+                priority_str = f"[{entry['priority']}] "
+
+            notification_title = f"Task Reminder {priority_str}"
+            notification_message = f"Task #{entry['id']}: {entry['description']}{due_info}"
+
+            # Hand the notification to the dispatcher; this may block briefly if its queue is full
+            if notifier.submit(notification_title, notification_message):
+                logger.info(f"Reminder notification queued for task #{entry['id']}")
+
+            # Mark as notified even if it can't be shown (to avoid repeated failed
+            # attempts); the store itself is left alone
+            record_notified(entry["id"], entry["time"])
+            with self.cond:
+                self.fired_count += 1
+                self.notified.add((entry["id"], entry["time"]))
+                if entry["time"] > self.last_notified.get(entry["id"], entry["time"] - 1):
+                    self.last_notified[entry["id"]] = entry["time"]
+                if entry.get("recurrence") and entry["id"] in self.entries:
+                    # Line up the next occurrence's reminder
+                    current = self.entries[entry["id"]]
+                    due_time = self._reminder_due_time(current)
+                    if due_time is not None and entry["id"] not in self.pending:
+                        self.pending[entry["id"]] = due_time
+                        heapq.heappush(self.heap, (due_time, entry["id"]))
+
+    def _fire_due_alerts(self, entries):
+        """Show "due soon" alerts and record them as sent"""
+        notifier = self.notifier or notification_dispatcher
+        for due_date, task_id, description, priority in entries:
+            priority_str = f"[{priority}] " if priority != "Medium" else ""
+            notification_title = f"Task Due Soon {priority_str}"
+            notification_message = f"Task #{task_id}: {description} (Due: {due_date})"
+            if notifier.submit(notification_title, notification_message):
+                logger.info(f"Due soon notification queued for task #{task_id}")
+
+            record_due_alert(task_id, due_date)
+            with self.cond:
+                self.fired_count += 1
+                self.due.sent.add((task_id, due_date))
 
-                # If reminder time has passed
-                if current_time >= reminder_time:
-                    # Format due date info if available
-                    due_info = ""
-                    if hasattr(task, 'due_date') and task.due_date:
-                        due_info = f" (Due: {task.due_date})"
-
-                    # Format priority if available and not Medium
-                    priority_str = ""
-                    if hasattr(task, 'priority') and task.priority != "Medium":
-                        priority_str = f"[{task.priority}] "
-
-                    notification_title = f"Task Reminder {priority_str}"
-                    notification_message = f"Task #{task.id}: {task.description}{due_info}"
-
-                    # Show the notification
-                    notification_success = show_notification(notification_title, notification_message)
-
-                    # Mark as notified if notification was shown or if we can't show notifications
-                    # (to avoid repeated failed attempts)
-                    task.reminder_notified = True
-                    updated = True
-
-                    if notification_success:
-                        logger.info(f"Reminder notification sent for task #{task.id}")
-                    else:
-                        logger.warning(f"Failed to send notification for task #{task.id}")
-
-            # Save tasks if any were updated
-            if updated:
-                save_tasks(tasks)
-                return True
+    def check_reminders(self):
+        """Fire any reminders and due alerts that are due now; returns True if any fired
 
+        Without the service thread, the caller may be a short-lived process
+        that exits as soon as this returns. Fired reminders are already
+        recorded as notified, so it waits (up to IDLE_WAIT_TIMEOUT) for the
+        dispatcher to show them first.
+        """
+        try:
+            if not self.running:
+                # The service thread isn't keeping the settings up to date
+                self.settings_changed(get_settings())
+            self._reload()
+            with self.cond:
+                now = self.clock.time()
+                due = self._pop_due(now)
+                due_alerts = self.due.pop_due(now)
+            if due or due_alerts:
+                self._fire(due)
+                self._fire_due_alerts(due_alerts)
+                if not self.running and self.notifier is None:
+                    if not notification_dispatcher.wait_idle(IDLE_WAIT_TIMEOUT):
+                        logger.warning("Timed out waiting for reminder notifications to be shown")
+                return True
         except Exception as e:
             logger.error(f"Error checking reminders: {e}")
 
@@ -419,6 +1165,9 @@ def check_reminders():
 
 def reset_notifications():
     """Reset notification flags for all tasks (for debugging)"""
+    clear_notified()
+    reminder_service.store_changed()
+
     tasks = load_tasks()
     updated = False
 
@@ -0,0 +1,38 @@
+"""
+Storage locations for Task Manager
+
+Only depends on os and sys so that fast paths (task-cli count, shell
+completion) can find the data files without importing the storage layer.
+"""
+
+import os
+import sys
+
+def get_storage_directory():
+    """Get platform-specific storage directory for task manager data"""
+    # sys.platform avoids importing the platform module on every CLI start
+    home_dir = os.path.expanduser("~")
+
+    if sys.platform == "win32":
+        return os.path.join(os.getenv("APPDATA"), "TaskManager")
+    elif sys.platform == "darwin":  # macOS
+        return os.path.join(home_dir, "Library", "Application Support", "TaskManager")
+    else:  # Linux and others
+        return os.path.join(home_dir, ".taskmanager")
+
+def get_tasks_file_path():
+    """Get path to the tasks data file"""
+    storage_dir = get_storage_directory()
+    return os.path.join(storage_dir, "tasks.pickle")
+
+def get_store_signature():
+    """Return an (mtime_ns, size) pair identifying the saved store version
+
+    Returns None if the tasks file doesn't exist. Cheap enough to call
+    before every command to detect changes made by other processes.
+    """
+    try:
+        stat = os.stat(get_tasks_file_path())
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,252 @@
+"""
+Task selection helpers for bulk commands
+
+Supports ID lists with ranges ("1 2 5-40" or "1,2,5-40"), a small
+``--where`` filter language made of space-separated ``key:value`` terms
+that must all match, and ``field=value`` assignments for ``--set``.
+"""
+
+import bisect
+import datetime
+from task_manager.utils.recurrence import occurs_between, parse_date
+
+PRIORITIES = ("High", "Medium", "Low")
+
+# Aliases accepted for --where keys and --set fields
+WHERE_KEYS = {
+    "status": "status",
+    "priority": "priority", "pri": "priority",
+    "category": "category", "cat": "category",
+    "due": "due",
+    "id": "id",
+    "text": "text", "search": "text",
+}
+
+SET_FIELDS = {
+    "priority": "priority", "pri": "priority",
+    "category": "category", "cat": "category",
+    "due": "due_date", "due_date": "due_date",
+    "progress": "progress",
+    "description": "description", "desc": "description",
+    "notes": "notes",
+    "status": "completed", "completed": "completed",
+    "repeat": "recurrence", "recurrence": "recurrence",
+}
+
+class IdSpec:
+    """Task IDs given on the command line: single IDs and inclusive ranges
+
+    Ranges are kept as merged (start, end) pairs instead of being expanded,
+    so "1-30000000" costs no more than "1-3". Supports ``in`` and truth
+    testing like a set.
+    """
+
+    def __init__(self, singles=(), ranges=()):
+        self.ranges = []
+        for start, end in sorted(ranges):
+            if self.ranges and start <= self.ranges[-1][1] + 1:
+                self.ranges[-1] = (self.ranges[-1][0], max(self.ranges[-1][1], end))
+            else:
+                self.ranges.append((start, end))
+        self._starts = [start for start, _ in self.ranges]
+        # IDs listed on their own; those inside a range count as part of it
+        self.singles = {task_id for task_id in singles if not self._in_ranges(task_id)}
+
+    def _in_ranges(self, task_id):
+        index = bisect.bisect_right(self._starts, task_id) - 1
+        return index >= 0 and task_id <= self.ranges[index][1]
+
+    def __contains__(self, task_id):
+        return task_id in self.singles or self._in_ranges(task_id)
+
+    def __bool__(self):
+        return bool(self.singles or self.ranges)
+
+    def missing(self, present):
+        """Describe the requested IDs that have no task
+
+        present is the set of requested IDs that do. Single IDs are listed;
+        for a range only the number of absent IDs is given ("5 of 1-40").
+        """
+        result = [str(task_id) for task_id in sorted(self.singles - present)]
+        for start, end in self.ranges:
+            found = sum(1 for task_id in present if start <= task_id <= end)
+            absent = end - start + 1 - found
+            if absent:
+                result.append(f"{absent} of {start}-{end}")
+        return result
+
+    def unmatched(self, present, selected):
+        """Return the single IDs whose task exists but was not selected (failed --where)"""
+        return sorted((self.singles & present) - selected)
+
+def parse_id_spec(tokens):
+    """Parse ID tokens such as ["1", "2", "5-40"] into an IdSpec"""
+    singles = set()
+    ranges = []
+    for token in tokens:
+        for part in str(token).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                start, _, end = part.partition("-")
+                try:
+                    start, end = int(start), int(end)
+                except ValueError:
+                    raise ValueError(f"Invalid ID range '{part}'")
+                if start > end:
+                    raise ValueError(f"Invalid ID range '{part}'")
+                ranges.append((start, end))
+            else:
+                try:
+                    singles.add(int(part))
+                except ValueError:
+                    raise ValueError(f"Invalid task ID '{part}'")
+    return IdSpec(singles, ranges)
+
+def _due_between(task, start, end):
+    """Check whether a task falls due between start and end (inclusive)
+
+    A recurring task matches if any of its occurrences does.
+    """
+    due_date = parse_date(getattr(task, 'due_date', None))
+    if due_date is None or due_date > end:
+        return False
+    if due_date >= start:
+        return True
+    rule = getattr(task, 'recurrence', None)
+    return bool(rule) and occurs_between(rule, due_date, start, end)
+
+def _term_predicate(key, value):
+    """Build the predicate for a single key:value term"""
+    if key == "status":
+        if value == "all":
+            return lambda t: True
+        if value in ("active", "open"):
+            return lambda t: not t.completed
+        if value in ("completed", "done"):
+            return lambda t: t.completed
+        raise ValueError(f"Unknown status '{value}'")
+
+    if key == "priority":
+        priority = value.capitalize()
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority '{value}'")
+        return lambda t: getattr(t, 'priority', 'Medium') == priority
+
+    if key == "category":
+        category = value.lower()
+        return lambda t: (getattr(t, 'category', None) or "").lower() == category
+
+    if key == "id":
+        ids = parse_id_spec([value])
+        return lambda t: t.id in ids
+
+    if key == "text":
+        needle = value.lower()
+        return lambda t: (needle in t.description.lower() or
+                          needle in (getattr(t, 'notes', None) or "").lower())
+
+    if key == "due":
+        today = datetime.date.today()
+        if value == "none":
+            return lambda t: not getattr(t, 'due_date', None)
+        if value == "today":
+            return lambda t: _due_between(t, today, today)
+        if value == "week":
+            end_date = today + datetime.timedelta(days=7)
+            return lambda t: _due_between(t, today, end_date)
+        if value == "overdue":
+            def overdue(t):
+                due_date = parse_date(getattr(t, 'due_date', None))
+                return due_date is not None and due_date < today and not t.completed
+            return overdue
+        due_date = parse_date(value)
+        if due_date is None:
+            raise ValueError(f"Unknown due filter '{value}'")
+        return lambda t: _due_between(t, due_date, due_date)
+
+    raise ValueError(f"Unknown filter key '{key}'")
+
+def parse_where(expression):
+    """Compile a --where expression into a predicate over tasks
+
+    Example: "status:completed cat:old" matches completed tasks in the
+    "old" category. An empty expression matches every task.
+    """
+    predicates = []
+    for term in expression.split():
+        key, sep, value = term.partition(":")
+        if not sep or not value:
+            raise ValueError(f"Invalid filter term '{term}' (expected key:value)")
+        name = WHERE_KEYS.get(key.lower())
+        if name is None:
+            raise ValueError(f"Unknown filter key '{key}'")
+        predicates.append(_term_predicate(name, value if name == "text" else value.lower()))
+
+    return lambda task: all(predicate(task) for predicate in predicates)
+
+def parse_assignments(assignments):
+    """Parse --set field=value pairs into a dict of task attribute changes"""
+    changes = {}
+    for assignment in assignments:
+        key, sep, value = assignment.partition("=")
+        field = SET_FIELDS.get(key.strip().lower())
+        if not sep or field is None:
+            raise ValueError(f"Invalid assignment '{assignment}'")
+        value = value.strip()
+
+        if field == "priority":
+            value = value.capitalize()
+            if value not in PRIORITIES:
+                raise ValueError(f"Unknown priority '{value}'")
+        elif field == "due_date":
+            if value.lower() in ("", "none"):
+                value = None
+            elif parse_date(value) is None:
+                raise ValueError(f"Invalid due date '{value}' (expected YYYY-MM-DD)")
+        elif field == "progress":
+            try:
+                value = int(value.rstrip("%"))
+            except ValueError:
+                raise ValueError(f"Invalid progress '{value}'")
+            if not 0 <= value <= 100:
+                raise ValueError("Progress must be between 0 and 100")
+        elif field == "completed":
+            lowered = value.lower()
+            if lowered in ("completed", "done", "true", "yes", "1"):
+                value = True
+            elif lowered in ("active", "open", "false", "no", "0"):
+                value = False
+            else:
+                raise ValueError(f"Unknown status '{value}'")
+        elif field == "recurrence":
+            if value.lower() in ("", "none"):
+                value = None
+            else:
+                from task_manager.utils.recurrence import normalize_rule
+                value = normalize_rule(value)
+        elif field in ("category", "notes") and value.lower() == "none":
+            value = None
+
+        changes[field] = value
+    return changes
+
+def build_selector(task_ids=None, where=None):
+    """Combine explicit IDs and a --where expression into one predicate
+
+    Returns (predicate, ids) where ids is the IdSpec of explicitly
+    requested IDs (empty when selecting by --where only).
+    """
+    ids = parse_id_spec(task_ids or [])
+    condition = parse_where(where) if where else None
+
+    if not ids and condition is None:
+        raise ValueError("No tasks selected (give task IDs or --where)")
+
+    if ids and condition is not None:
+        return (lambda t: t.id in ids and condition(t)), ids
+    if ids:
+        return (lambda t: t.id in ids), ids
+    return condition, ids
@@ -0,0 +1,352 @@
+"""
+Recurring tasks for Task Manager
+
+A recurring task keeps a rule in a small subset of iCalendar RRULE
+syntax. Its due date is the current occurrence and the anchor of the
+series:
+
+    FREQ=DAILY|WEEKLY|MONTHLY   required
+    INTERVAL=n                  every n days, weeks or months (default 1)
+    BYDAY=MO,WE,FR              weekly rules only (default: the due date's weekday)
+    BYMONTHDAY=n                monthly rules only, -1 for the last day
+                                (default: the due date's day)
+    COUNT=n                     occurrences left, counting the current one
+    UNTIL=YYYYMMDD              last possible date
+
+"daily", "weekly" and "monthly" are accepted as shorthands. Occurrences
+are never stored. They are generated lazily for the date window a caller
+asks about, skipping ahead instead of walking from the anchor. Completing
+a recurring task moves it on to its next occurrence, so the store holds
+one task per rule, however long the series runs.
+"""
+
+import calendar
+import datetime
+from functools import lru_cache
+
+FREQUENCIES = ("DAILY", "WEEKLY", "MONTHLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+SHORTHANDS = {"daily": "FREQ=DAILY", "weekly": "FREQ=WEEKLY", "monthly": "FREQ=MONTHLY"}
+
+# Months in a row without a valid date before a monthly rule is treated as
+# ending (e.g. BYMONTHDAY=31 every 12 months starting in April)
+MAX_EMPTY_MONTHS = 48
+
+def _positive_int(key, value):
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"{key} must be a positive whole number")
+    return number
+
+@lru_cache(maxsize=256)
+def parse_rule(text):
+    """Parse a rule string into a dict; raises ValueError if it is invalid
+
+    The result is cached and shared, so callers must not modify it.
+    """
+    if not isinstance(text, str) or not text.strip():
+        raise ValueError("Empty recurrence rule")
+    text = SHORTHANDS.get(text.strip().lower(), text.strip())
+    if text.upper().startswith("RRULE:"):
+        text = text[len("RRULE:"):]
+
+    rule = {"freq": None, "interval": 1, "byday": None, "bymonthday": None,
+            "count": None, "until": None}
+    for part in text.split(";"):
+        if not part.strip():
+            continue
+        key, sep, value = part.partition("=")
+        key, value = key.strip().upper(), value.strip().upper()
+        if not sep or not value:
+            raise ValueError(f"Invalid recurrence rule part '{part}'")
+
+        if key == "FREQ":
+            if value not in FREQUENCIES:
+                raise ValueError(f"Unsupported frequency '{value}' (use DAILY, WEEKLY or MONTHLY)")
+            rule["freq"] = value
+        elif key in ("INTERVAL", "COUNT"):
+            rule[key.lower()] = _positive_int(key, value)
+        elif key == "BYDAY":
+            days = set()
+            for day in value.split(","):
+                if day.strip() not in WEEKDAYS:
+                    raise ValueError(f"Invalid day '{day}' in BYDAY (use MO, TU, WE, TH, FR, SA, SU)")
+                days.add(WEEKDAYS.index(day.strip()))
+            rule["byday"] = tuple(sorted(days))
+        elif key == "BYMONTHDAY":
+            try:
+                day = int(value)
+            except ValueError:
+                day = 0
+            if not (1 <= day <= 31 or day == -1):
+                raise ValueError("BYMONTHDAY must be between 1 and 31, or -1")
+            rule["bymonthday"] = day
+        elif key == "UNTIL":
+            try:
+                rule["until"] = datetime.datetime.strptime(value[:8], "%Y%m%d").date()
+            except ValueError:
+                raise ValueError(f"Invalid UNTIL date '{value}' (expected YYYYMMDD)")
+        else:
+            raise ValueError(f"Unsupported recurrence rule part '{key}'")
+
+    if rule["freq"] is None:
+        raise ValueError("Recurrence rule needs FREQ (DAILY, WEEKLY or MONTHLY)")
+    if rule["byday"] and rule["freq"] != "WEEKLY":
+        raise ValueError("BYDAY is only supported with FREQ=WEEKLY")
+    if rule["bymonthday"] and rule["freq"] != "MONTHLY":
+        raise ValueError("BYMONTHDAY is only supported with FREQ=MONTHLY")
+    return rule
+
+def format_rule(rule):
+    """Turn a parsed rule back into its canonical string"""
+    parts = [f"FREQ={rule['freq']}"]
+    if rule["interval"] != 1:
+        parts.append(f"INTERVAL={rule['interval']}")
+    if rule["byday"]:
+        parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in rule["byday"]))
+    if rule["bymonthday"]:
+        parts.append(f"BYMONTHDAY={rule['bymonthday']}")
+    if rule["count"] is not None:
+        parts.append(f"COUNT={rule['count']}")
+    if rule["until"] is not None:
+        parts.append(f"UNTIL={rule['until'].strftime('%Y%m%d')}")
+    return ";".join(parts)
+
+def normalize_rule(text):
+    """Validate a rule string and return its canonical form"""
+    return format_rule(parse_rule(text))
+
+def describe_rule(text):
+    """Describe a rule in words, e.g. "every 2 weeks on Mon, Fri" """
+    try:
+        rule = parse_rule(text)
+    except ValueError:
+        return "invalid rule"
+
+    unit = {"DAILY": "day", "WEEKLY": "week", "MONTHLY": "month"}[rule["freq"]]
+    if rule["interval"] == 1:
+        words = rule["freq"].lower()
+    else:
+        words = f"every {rule['interval']} {unit}s"
+    if rule["byday"]:
+        words += " on " + ", ".join(DAY_NAMES[day] for day in rule["byday"])
+    if rule["bymonthday"] == -1:
+        words += " on the last day"
+    elif rule["bymonthday"]:
+        words += f" on day {rule['bymonthday']}"
+    if rule["count"] is not None:
+        words += f", {rule['count']} more" if rule["count"] != 1 else ", last one"
+    if rule["until"] is not None:
+        words += f", until {rule['until'].isoformat()}"
+    return words
+
+def period_days(rule):
+    """Upper bound on the days between two occurrences of a rule"""
+    return {"DAILY": 1, "WEEKLY": 7, "MONTHLY": 31}[rule["freq"]] * rule["interval"]
+
+def _candidates(rule, anchor, since):
+    """Yield the anchor and then each later date the rule produces, skipping to since"""
+    interval = rule["interval"]
+    skip = since is not None and since > anchor
+
+    if rule["freq"] == "DAILY":
+        step = 0
+        if skip:
+            # Jump straight to the first step on or after since
+            step = -(-(since - anchor).days // interval)
+        while True:
+            yield anchor + datetime.timedelta(days=step * interval)
+            step += 1
+
+    elif rule["freq"] == "WEEKLY":
+        weekdays = rule["byday"] or (anchor.weekday(),)
+        first_week = anchor - datetime.timedelta(days=anchor.weekday())
+        period = ((since - first_week).days // 7) // interval if skip else 0
+        if period == 0:
+            yield anchor
+        while True:
+            week = first_week + datetime.timedelta(weeks=period * interval)
+            for weekday in weekdays:
+                day = week + datetime.timedelta(days=weekday)
+                if day > anchor:
+                    yield day
+            period += 1
+
+    else:  # MONTHLY
+        month_day = rule["bymonthday"] or anchor.day
+        first_month = anchor.year * 12 + anchor.month - 1
+        period = 0
+        if skip:
+            period = ((since.year * 12 + since.month - 1) - first_month) // interval
+        if period == 0:
+            yield anchor
+        empty = 0
+        while empty < MAX_EMPTY_MONTHS:
+            year, month = divmod(first_month + period * interval, 12)
+            last_day = calendar.monthrange(year, month + 1)[1]
+            day = last_day if month_day == -1 else month_day
+            # Months without that day are skipped, as in iCalendar
+            if day <= last_day:
+                empty = 0
+                date = datetime.date(year, month + 1, day)
+                if date > anchor:
+                    yield date
+            else:
+                empty += 1
+            period += 1
+
+def iter_occurrences(rule, anchor, since=None):
+    """Lazily yield a rule's occurrence dates in order, starting with the anchor
+
+    With since, only occurrences on or after that date are yielded, and
+    earlier ones are skipped arithmetically rather than generated (except
+    under COUNT, which has to be counted from the anchor; it bounds the
+    series anyway).
+    """
+    if isinstance(rule, str):
+        rule = parse_rule(rule)
+    remaining = rule["count"]
+    until = rule["until"]
+
+    candidates = _candidates(rule, anchor, None if remaining is not None else since)
+    try:
+        for day in candidates:
+            if until is not None and day > until:
+                return
+            if remaining is not None:
+                if remaining == 0:
+                    return
+                remaining -= 1
+            if since is None or day >= since:
+                yield day
+    except (OverflowError, ValueError):
+        # Ran past datetime.date.max
+        return
+
+def next_occurrence(rule, anchor, after):
+    """Return the first occurrence later than after, or None if the series ends first"""
+    for day in iter_occurrences(rule, anchor, since=after + datetime.timedelta(days=1)):
+        return day
+    return None
+
+def occurs_between(rule, anchor, start, end):
+    """Check whether any occurrence falls between start and end (inclusive)
+
+    Invalid rules never match, so a bad rule in the store can't break listing.
+    """
+    try:
+        for day in iter_occurrences(rule, anchor, since=start):
+            return day <= end
+    except ValueError:
+        pass
+    return False
+
+@lru_cache(maxsize=4096)
+def parse_date(date_string):
+    """Parse a YYYY-MM-DD string, returning None if it is missing or invalid
+
+    Cached, as tasks share few distinct due dates and list, filter and
+    query code parse them for every task.
+    """
+    try:
+        return datetime.datetime.strptime(date_string, "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return None
+
+def shift_date(date_string, days):
+    """Move a YYYY-MM-DD date string by whole days (invalid dates are returned as is)"""
+    date = parse_date(date_string)
+    if date is None:
+        return date_string
+    return (date + datetime.timedelta(days=days)).strftime("%Y-%m-%d")
+
+def shift_timestamp(timestamp, days):
+    """Move a timestamp by whole days, keeping its local wall-clock time"""
+    moved = datetime.datetime.fromtimestamp(float(timestamp)) + datetime.timedelta(days=days)
+    return moved.timestamp()
+
+def advance_task(task, today=None):
+    """Move a recurring task on to its next occurrence, in place
+
+    Occurrences already missed are skipped: the task moves to the first
+    occurrence after today (or after its current one, if that is later).
+    The due date, any reminder and the remaining COUNT move with it.
+    Returns the new due date string, or None if the series has ended (the
+    task is left unchanged).
+    """
+    rule = parse_rule(task.recurrence)
+    today = today or datetime.date.today()
+    anchor = parse_date(getattr(task, 'due_date', None)) or today
+    after = max(anchor, today - datetime.timedelta(days=1))
+
+    if rule["count"] is None:
+        next_day = next_occurrence(rule, anchor, after)
+        remaining = None
+    else:
+        # Count the occurrences used up on the way (bounded by COUNT)
+        next_day, remaining = None, rule["count"]
+        for day in iter_occurrences(rule, anchor):
+            if day > after:
+                next_day = day
+                break
+            remaining -= 1
+
+    if next_day is None:
+        return None
+
+    if remaining is not None:
+        rule = dict(rule, count=remaining)
+    task.recurrence = format_rule(rule)
+
+    shift = (next_day - anchor).days
+    task.due_date = next_day.strftime("%Y-%m-%d")
+    task.completed = False
+    task.progress = 0
+    if getattr(task, 'reminder_time', None) is not None:
+        task.set_reminder(shift_timestamp(task.reminder_time, shift))
+    return task.due_date
+
+def next_reminder_time(rule, due_date, reminder_time, after, now):
+    """Reminder time to schedule next for a recurring task's reminder
+
+    Each occurrence's reminder keeps the offset the task's reminder has
+    from its due date. The first occurrence reminder later than after (the
+    last one fired, or None) is chosen; if several have been missed, only
+    the latest fires. Returns None when the series has no more reminders.
+    """
+    try:
+        rule = parse_rule(rule)
+    except ValueError:
+        return None
+    anchor = parse_date(due_date)
+    if anchor is None:
+        return None
+
+    base = datetime.datetime.fromtimestamp(float(reminder_time))
+    offset = base - datetime.datetime.combine(anchor, datetime.time())
+
+    def reminder_at(day):
+        return (datetime.datetime.combine(day, datetime.time()) + offset).timestamp()
+
+    # Skip ahead to shortly before the last fired reminder, or one period
+    # before now, so a just-missed occurrence can still fire
+    floor = now - period_days(rule) * 86400
+    if after is not None:
+        floor = max(floor, after)
+    since = (datetime.datetime.fromtimestamp(floor) - offset).date() - datetime.timedelta(days=1)
+
+    missed = None
+    for day in iter_occurrences(rule, anchor, since=max(since, anchor)):
+        at = reminder_at(day)
+        if after is not None and at <= after:
+            continue
+        if at <= now:
+            missed = at
+            continue
+        return missed if missed is not None else at
+    return missed
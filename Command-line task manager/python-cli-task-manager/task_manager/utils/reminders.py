@@ -0,0 +1,207 @@
+"""
+Reminder index for Task Manager
+
+Two small files next to the tasks file let the reminder service work
+without reading or writing the store:
+
+- reminders.json, rewritten by the storage layer on every save, lists
+  each task that has a reminder with just the fields a notification needs.
+- reminders.notified is an append-only log of fired reminders, one
+  "task_id reminder_time" line each. Only the reminder service writes it,
+  so firing a reminder never rewrites the store (or overwrites unsaved
+  edits another front end is about to save).
+
+A fired reminder is identified by task ID and reminder time, so setting
+a new reminder time on a task arms it again without clearing the log.
+A recurring task has one entry; the reminder service works out each
+occurrence's reminder time from it, and logs each one as it fires.
+
+The index also lists every active task with a due date, sorted by date.
+"Due soon" alerts are derived from it and the notifications settings when
+they are scheduled, so nothing is stored per task and changing the
+warning window never rewrites the store. Sent alerts are logged as
+"due task_id due_date" lines in the same log.
+"""
+
+import os
+import json
+from task_manager.utils.paths import get_storage_directory, get_store_signature
+
+INDEX_FORMAT = 3
+
+def get_reminder_index_path():
+    """Get path to the reminder index file"""
+    return os.path.join(get_storage_directory(), "reminders.json")
+
+def get_notified_log_path():
+    """Get path to the append-only log of fired reminders"""
+    return os.path.join(get_storage_directory(), "reminders.notified")
+
+def reminder_entry(task):
+    """Return the index entry for a task, or None if it has no valid reminder"""
+    reminder_time = getattr(task, 'reminder_time', None)
+    if reminder_time is None:
+        return None
+    try:
+        reminder_time = float(reminder_time)
+    except (ValueError, TypeError):
+        return None
+
+    return {
+        "id": task.id,
+        "time": reminder_time,
+        "description": task.description,
+        "priority": getattr(task, 'priority', 'Medium'),
+        "due_date": getattr(task, 'due_date', None),
+        "completed": bool(task.completed),
+        "recurrence": getattr(task, 'recurrence', None),
+        # Set by versions that recorded firing in the store itself
+        "notified": bool(getattr(task, 'reminder_notified', False)),
+    }
+
+def due_entry(task):
+    """Return [due_date, id, description, priority] for an active task with a due date, or None"""
+    due_date = getattr(task, 'due_date', None)
+    # A cheap shape check; dates that still fail to parse are skipped when scheduled
+    if task.completed or not isinstance(due_date, str) or len(due_date) != 10:
+        return None
+    return [due_date, task.id, task.description, getattr(task, 'priority', 'Medium')]
+
+def build_reminder_index(tasks, store_version):
+    """Collect the reminder and due-date entries for a task list"""
+    entries = []
+    due = []
+    for task in tasks:
+        entry = reminder_entry(task)
+        if entry is not None:
+            entries.append(entry)
+        entry = due_entry(task)
+        if entry is not None:
+            due.append(entry)
+    due.sort(key=lambda entry: (entry[0], entry[1]))
+
+    return {
+        "format": INDEX_FORMAT,
+        "store_version": list(store_version) if store_version else None,
+        "reminders": entries,
+        "due": due,
+    }
+
+def write_reminder_index(tasks, store_version):
+    """Write the reminder index atomically and return it"""
+    index = build_reminder_index(tasks, store_version)
+    path = get_reminder_index_path()
+    temp_path = path + ".tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(index, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+    return index
+
+def read_reminder_index():
+    """Read the index if it matches the saved store, otherwise return None"""
+    try:
+        with open(get_reminder_index_path(), 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if index.get("format") != INDEX_FORMAT:
+        return None
+
+    if list(get_store_signature() or []) != (index.get("store_version") or []):
+        return None
+
+    return index
+
+def load_reminder_index():
+    """Return a current index, rebuilding it from the store if needed"""
+    index = read_reminder_index()
+    if index is None:
+        from task_manager.utils.storage import load_tasks
+        tasks = load_tasks()
+        try:
+            index = write_reminder_index(tasks, get_store_signature())
+        except OSError:
+            index = build_reminder_index(tasks, get_store_signature())
+    return index
+
+def record_notified(task_id, reminder_time):
+    """Append a fired reminder to the notified log"""
+    os.makedirs(get_storage_directory(), exist_ok=True)
+    # A single short write to an O_APPEND file is not interleaved with other writers
+    with open(get_notified_log_path(), 'a') as f:
+        f.write(f"{task_id} {reminder_time!r}\n")
+
+def record_due_alert(task_id, due_date):
+    """Append a sent "due soon" alert to the notified log"""
+    os.makedirs(get_storage_directory(), exist_ok=True)
+    with open(get_notified_log_path(), 'a') as f:
+        f.write(f"due {task_id} {due_date}\n")
+
+def load_notified_log():
+    """Return (fired reminders, sent due alerts) from the notified log
+
+    Fired reminders are (task_id, reminder_time) pairs and due alerts are
+    (task_id, due_date) pairs.
+    """
+    notified = set()
+    due_alerts = set()
+    try:
+        with open(get_notified_log_path(), 'r') as f:
+            for line in f:
+                task_id, _, reminder_time = line.strip().partition(" ")
+                try:
+                    if task_id == "due":
+                        task_id, _, due_date = reminder_time.partition(" ")
+                        due_alerts.add((int(task_id), due_date))
+                    else:
+                        notified.add((int(task_id), float(reminder_time)))
+                except ValueError:
+                    continue  # A torn last line from a crash
+    except OSError:
+        pass
+    return notified, due_alerts
+
+def load_notified():
+    """Return the set of (task_id, reminder_time) pairs that have fired"""
+    return load_notified_log()[0]
+
+def compact_notified(index, notified, due_alerts=()):
+    """Rewrite the log keeping only entries for reminders still in the index
+
+    For a recurring task the latest fired occurrence is kept too, as the
+    service schedules the next one from it.
+
+    Returns the number of entries dropped.
+    """
+    current = {(entry["id"], entry["time"]) for entry in index.get("reminders", [])}
+    recurring = {entry["id"] for entry in index.get("reminders", []) if entry.get("recurrence")}
+    latest = {}
+    for task_id, reminder_time in notified:
+        if task_id in recurring and reminder_time > latest.get(task_id, reminder_time - 1):
+            latest[task_id] = reminder_time
+    current.update(latest.items())
+    kept = notified & current
+    # Due alerts matter only while the task is still due on that date
+    due_kept = set(due_alerts) & {(entry[1], entry[0]) for entry in index.get("due", [])}
+    if len(kept) == len(notified) and len(due_kept) == len(due_alerts):
+        return 0
+
+    path = get_notified_log_path()
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w') as f:
+        for task_id, reminder_time in sorted(kept):
+            f.write(f"{task_id} {reminder_time!r}\n")
+        for task_id, due_date in sorted(due_kept):
+            f.write(f"due {task_id} {due_date}\n")
+    os.replace(temp_path, path)
+    return len(notified) - len(kept) + len(due_alerts) - len(due_kept)
+
+def clear_notified():
+    """Forget every fired reminder so they can fire again"""
+    try:
+        os.remove(get_notified_log_path())
+    except FileNotFoundError:
+        pass
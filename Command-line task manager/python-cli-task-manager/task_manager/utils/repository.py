@@ -0,0 +1,295 @@
+"""
+In-memory task repository for Task Manager
+
+A TaskRepository holds the task list loaded once from storage so that
+several commands can run against it before it is written back with a
+single save. Commands accept an optional repository; when none is given
+they load and save the store themselves, exactly as before.
+
+Long-running front ends (the task shell) can enable write-behind saving:
+changes are flushed by a timer a short delay after the last edit (each
+edit restarts it), and flush() writes anything still pending on exit.
+
+Interactive sessions can also enable merging. The repository then keeps a
+fingerprint of every task as last loaded or saved, and when another
+process has saved the store in the meantime (its file version differs),
+the two sets of changes are merged per task instead of one overwriting
+the other.
+
+Other threads in the same process (the reminder service next to the GUI)
+can follow the tasks without going through the store: snapshot() returns
+a consistent copy of the list, and subscribe() registers a callback that
+is told about every change.
+"""
+
+import threading
+from contextlib import contextmanager
+from task_manager.utils.storage import load_tasks, save_tasks, get_store_signature
+
+def _fingerprint(task):
+    """Hash of a task's fields, used to tell whether it changed since a base version"""
+    try:
+        return hash(tuple(task.__dict__.items()))
+    except TypeError:
+        # Unhashable field values (e.g. a list added by a plugin)
+        return hash(repr(sorted(task.__dict__.items())))
+
+class TaskRepository:
+    """Task list kept in memory and saved on commit"""
+
+    def __init__(self, tasks=None, flush_delay=None, merge_external=False):
+        self.lock = threading.RLock()
+        self.flush_delay = flush_delay
+        self.merge_external = merge_external
+        # Task ID -> fingerprint as of the last load or save (merge mode only)
+        self._base = {}
+        self._timer = None
+        self.dirty = False
+        self._last_id = None
+        self._cache = {}
+        self.signature = None
+        # Incremented on every change so observers can tell if anything happened
+        self.generation = 0
+        self._subscribers = []
+
+        if tasks is None:
+            self.reload()
+        else:
+            self.tasks = tasks
+
+    def reload(self):
+        """Replace the in-memory tasks with the saved store
+
+        Tasks still in the store are updated in place (matched by ID), and
+        the list object is kept, so task and list references held by the
+        UI stay valid and edits made through them are not lost.
+        """
+        with self.lock:
+            self.signature = get_store_signature()
+            disk_tasks = load_tasks()
+            if getattr(self, 'tasks', None) is None:
+                self.tasks = disk_tasks
+            else:
+                local = {task.id: task for task in self.tasks}
+                for index, disk_task in enumerate(disk_tasks):
+                    local_task = local.get(disk_task.id)
+                    if local_task is not None:
+                        local_task.__dict__.clear()
+                        local_task.__dict__.update(disk_task.__dict__)
+                        disk_tasks[index] = local_task
+                self.tasks[:] = disk_tasks
+            self.dirty = False
+            self._last_id = None
+            self._cache.clear()
+            self.generation += 1
+            self._remember_base(self.tasks)
+            self._notify(None)
+
+    def _remember_base(self, tasks):
+        if self.merge_external:
+            self._base = {task.id: _fingerprint(task) for task in tasks}
+
+    def refresh_if_changed(self):
+        """Pick up changes another process saved to the store
+
+        Reloads when nothing is pending here; with merging enabled, pending
+        changes are merged with the saved ones instead. Returns True if the
+        in-memory tasks were updated.
+        """
+        with self.lock:
+            if get_store_signature() == self.signature:
+                return False
+            if not self.dirty:
+                self.reload()
+                return True
+            if self.merge_external:
+                self.merge_from_disk()
+                return True
+            return False
+
+    def merge_from_disk(self):
+        """Merge the saved store into the in-memory tasks, per task
+
+        A task changed only on disk takes the saved version (updated in
+        place, so references held by the UI stay valid); a task changed
+        here keeps the local version. Tasks added on either side are kept,
+        with local additions renumbered if another process used their ID.
+        A deletion on one side wins unless the other side edited the task.
+        Returns the number of tasks taken from disk.
+        """
+        with self.lock:
+            signature = get_store_signature()
+            disk_tasks = load_tasks()
+            base = self._base
+            local = {task.id: task for task in self.tasks}
+            disk_ids = set()
+            merged = []
+            clashes = []
+            taken = 0
+
+            for disk_task in disk_tasks:
+                disk_ids.add(disk_task.id)
+                local_task = local.get(disk_task.id)
+                base_print = base.get(disk_task.id)
+
+                if base_print is None:
+                    # Added by the other process
+                    merged.append(disk_task)
+                    taken += 1
+                    if local_task is not None:
+                        clashes.append(local_task)
+                elif local_task is None:
+                    # Deleted here; keep it only if it was edited on disk
+                    if _fingerprint(disk_task) != base_print:
+                        merged.append(disk_task)
+                        taken += 1
+                elif _fingerprint(local_task) == base_print:
+                    if _fingerprint(disk_task) != base_print:
+                        local_task.__dict__.clear()
+                        local_task.__dict__.update(disk_task.__dict__)
+                        taken += 1
+                    merged.append(local_task)
+                else:
+                    merged.append(local_task)
+
+            for task in self.tasks:
+                if task.id in disk_ids:
+                    continue
+                if task.id not in base or _fingerprint(task) != base[task.id]:
+                    # Added here, or edited here after being deleted on disk
+                    merged.append(task)
+
+            next_id = max((task.id for task in merged), default=0)
+            for task in clashes:
+                next_id += 1
+                task.id = next_id
+                merged.append(task)
+
+            merged.sort(key=lambda task: task.id)
+            self.tasks[:] = merged
+            self.signature = signature
+            self._base = {task.id: _fingerprint(task) for task in disk_tasks}
+            self._last_id = None
+            self._cache.clear()
+            self.generation += 1
+            self._notify(None)
+            return taken
+
+    def snapshot(self):
+        """Return a copy of the task list that other threads can iterate safely"""
+        with self.lock:
+            return list(self.tasks)
+
+    def subscribe(self, callback):
+        """Call callback(changed) after every change; returns a function that unsubscribes
+
+        changed is the list of tasks that were added or edited, or None when
+        any task may have changed or been removed. Callbacks run on the
+        thread that made the change, with the repository lock held, so they
+        must be quick and must not wait on a thread that uses the repository.
+        """
+        with self.lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self.lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def _notify(self, changed):
+        for callback in list(self._subscribers):
+            try:
+                callback(changed)
+            except Exception as e:
+                print(f"Error in repository subscriber: {e}")
+
+    def cached(self, key, compute):
+        """Return a value derived from the tasks, recomputed only after changes
+
+        Used by read commands for things like summary counts so repeated
+        reads against a warm repository don't rescan every task.
+        """
+        with self.lock:
+            if key not in self._cache:
+                self._cache[key] = compute()
+            return self._cache[key]
+
+    def next_id(self):
+        """Return the ID for a new task (max ID + 1 or 1 if no tasks)"""
+        if self._last_id is None:
+            self._last_id = max((task.id for task in self.tasks), default=0)
+            if self._base:
+                # Never reuse the ID of a task deleted here since the last save,
+                # or merging would mistake the new task for an edit of the old one
+                self._last_id = max(self._last_id, max(self._base))
+        return self._last_id + 1
+
+    def add(self, task):
+        """Append a new task and mark the repository dirty"""
+        with self.lock:
+            self.tasks.append(task)
+            if task.id >= self.next_id():
+                self._last_id = task.id
+            self.mark_dirty(task)
+        return task
+
+    def mark_dirty(self, *changed):
+        """Record that the in-memory tasks differ from the saved store
+
+        Pass the tasks that were added or edited, if known, so subscribers
+        can update just those; with none, subscribers resynchronize fully.
+        """
+        with self.lock:
+            self.dirty = True
+            self._cache.clear()
+            self.generation += 1
+            self._notify(list(changed) if changed else None)
+            if self.flush_delay is not None:
+                # Restart the delay so the save happens once edits pause
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._timer = threading.Timer(self.flush_delay, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _flush_from_timer(self):
+        """Write-behind callback run on the timer thread"""
+        with self.lock:
+            if self._timer is not threading.current_thread():
+                # Cancelled and replaced while waiting for the lock
+                return
+            self._timer = None
+            self.commit()
+
+    def commit(self):
+        """Save the tasks if anything changed, returning True if a save happened"""
+        with self.lock:
+            if not self.dirty:
+                return False
+            if self.merge_external and get_store_signature() != self.signature:
+                self.merge_from_disk()
+            save_tasks(self.tasks)
+            self.signature = get_store_signature()
+            self.dirty = False
+            self._remember_base(self.tasks)
+            return True
+
+    def flush(self):
+        """Cancel any pending write-behind timer and save pending changes now"""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            return self.commit()
+
+@contextmanager
+def using_repository(repo=None):
+    """Yield the given repository, or a freshly loaded one committed on exit"""
+    if repo is not None:
+        yield repo
+        return
+
+    repo = TaskRepository()
+    yield repo
+    repo.commit()
@@ -1,9 +1,19 @@
 """
 Settings module for Task Manager
+
+Settings are served from memory by a SettingsService. settings.json is
+parsed once, validated against SETTINGS_SCHEMA and merged over a deep
+copy of the defaults. The file's mtime is checked at most once every
+CHECK_INTERVAL seconds, so hot paths (notifications, colours) read
+settings without file I/O. Edits made by another process are picked up
+at the next check, and subscribers are told about every change.
 """
 
+import copy
 import json
 import os
+import threading
+import time
 from task_manager.utils.storage import get_storage_directory
 
 # Default settings
@@ -23,7 +33,11 @@ DEFAULT_SETTINGS = {
     'notifications': {
         'enabled': True,
         'sound': True,
-        'advance_warning': 15  # minutes
+        'advance_warning': 15,  # Minutes before a task's due time to send a "due soon" alert
+        'due_alerts': True,     # Send "due soon" alerts for tasks with a due date
+        'due_time': '09:00',    # Time of day (HH:MM) a due date counts as due
+        'digest_threshold': 5,  # Reminders at once shown as one digest (0 = never)
+        'sound_interval': 10    # Minimum seconds between notification sounds
     },
     'ui': {
         'theme': 'system',  # system, light, dark
@@ -35,54 +49,249 @@ DEFAULT_SETTINGS = {
     'cli': {
         'interactive_mode': True,  # Default to interactive mode
         'show_colors': True,       # Use color output when available
-        'compact_view': False      # Use detailed output by default
+        'compact_view': False,     # Use detailed output by default
+        'write_behind_delay': 2.0  # Seconds after the last edit before saving
     }
 }
 
+NUMBER = (int, float)
+
+def parse_clock_time(value):
+    """Parse "HH:MM" into seconds after midnight, or None if it isn't a valid time"""
+    hours, sep, minutes = str(value).partition(":")
+    try:
+        hours, minutes = int(hours), int(minutes)
+    except ValueError:
+        return None
+    if not sep or not (0 <= hours < 24 and 0 <= minutes < 60):
+        return None
+    return hours * 3600 + minutes * 60
+
+# Expected type per nested setting, with a tuple of allowed values, a
+# minimum or a check function. Keys not listed here (e.g. the GUI's own top-level keys)
+# are kept as they are.
+SETTINGS_SCHEMA = {
+    'colors': {key: (str, None) for key in DEFAULT_SETTINGS['colors']},
+    'autosave': {
+        'enabled': (bool, None),
+        'interval': (int, 10),
+        'on_exit': (bool, None),
+    },
+    'notifications': {
+        'enabled': (bool, None),
+        'sound': (bool, None),
+        'advance_warning': (int, 0),
+        'due_alerts': (bool, None),
+        'due_time': (str, lambda value: parse_clock_time(value) is not None),
+        'digest_threshold': (int, 0),
+        'sound_interval': (NUMBER, 0),
+    },
+    'ui': {
+        'theme': (str, ('system', 'light', 'dark')),
+        'font_family': (str, None),
+        'font_size': (int, 6),
+        'compact_view': (bool, None),
+        'show_status_bar': (bool, None),
+    },
+    'cli': {
+        'interactive_mode': (bool, None),
+        'show_colors': (bool, None),
+        'compact_view': (bool, None),
+        'write_behind_delay': (NUMBER, 0),
+    },
+}
+
+# Seconds between checks of settings.json's mtime
+CHECK_INTERVAL = 1.0
+
 def get_settings_file_path():
     """Get the path to the settings file"""
     storage_dir = get_storage_directory()
     return os.path.join(storage_dir, "settings.json")
 
-def load_settings():
-    """Load settings from file, using defaults for missing values"""
-    try:
-        settings_path = get_settings_file_path()
-
-        if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                saved_settings = json.load(f)
+def _valid(value, expected_type, constraint):
+    # bool is a subclass of int, so numbers must not accept True/False
+    if isinstance(value, bool) != (expected_type is bool):
+        return False
+    if not isinstance(value, expected_type):
+        return False
+    if isinstance(constraint, tuple):
+        return value in constraint
+    if callable(constraint):
+        return constraint(value)
+    if constraint is not None:
+        return value >= constraint
+    return True
 
-            # Merge with defaults, keeping saved values
-            settings = DEFAULT_SETTINGS.copy()
+def validate_settings(settings):
+    """Replace invalid nested values with their defaults, in place
 
-            # Deep merge - handle nested dictionaries
-            for key, value in saved_settings.items():
-                if key in settings and isinstance(settings[key], dict) and isinstance(value, dict):
-                    settings[key].update(value)
-                else:
-                    settings[key] = value
+    Returns a list of problems found, one message per replaced value.
+    """
+    problems = []
+    for section, fields in SETTINGS_SCHEMA.items():
+        values = settings.get(section)
+        if not isinstance(values, dict):
+            if values is not None:
+                problems.append(f"'{section}' should be a section; using defaults")
+            settings[section] = copy.deepcopy(DEFAULT_SETTINGS[section])
+            continue
+        for key, (expected_type, constraint) in fields.items():
+            if key in values and not _valid(values[key], expected_type, constraint):
+                problems.append(f"Invalid value for {section}.{key}: {values[key]!r}; using default")
+                values[key] = DEFAULT_SETTINGS[section][key]
+    return problems
 
-            return settings
+def merge_with_defaults(saved_settings):
+    """Deep-merge saved settings over a fresh copy of the defaults"""
+    settings = copy.deepcopy(DEFAULT_SETTINGS)
+    for key, value in saved_settings.items():
+        if key in settings and isinstance(settings[key], dict) and isinstance(value, dict):
+            settings[key].update(value)
         else:
-            # Create the default settings file if it doesn't exist
-            save_settings(DEFAULT_SETTINGS)
-            return DEFAULT_SETTINGS.copy()
+            settings[key] = value
+    return settings
 
-    except Exception as e:
-        print(f"Error loading settings: {e}")
-        return DEFAULT_SETTINGS.copy()
+class SettingsService:
+    """Settings kept in memory and reloaded only when settings.json changes"""
 
-def save_settings(settings):
-    """Save settings to file"""
-    try:
-        settings_path = get_settings_file_path()
+    def __init__(self, path=None, check_interval=CHECK_INTERVAL):
+        self._path = path
+        self.check_interval = check_interval
+        self.lock = threading.RLock()
+        self._settings = None
+        self._version = None
+        self._checked_at = 0.0
+        self._subscribers = []
+
+    @property
+    def path(self):
+        return self._path or get_settings_file_path()
+
+    def _file_version(self):
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(settings_path), exist_ok=True)
+    def get(self):
+        """Return the current settings (shared; callers must not modify them)"""
+        changed = False
+        with self.lock:
+            if self._settings is None:
+                self._load()
+            elif time.monotonic() - self._checked_at >= self.check_interval:
+                changed = self._reload_if_changed()
+            settings = self._settings
+        if changed:
+            self._notify(settings)
+        return settings
+
+    def refresh(self):
+        """Check settings.json now; returns True (after notifying subscribers) if it changed"""
+        with self.lock:
+            if self._settings is None:
+                self._load()
+                return False
+            changed = self._reload_if_changed()
+            settings = self._settings
+        if changed:
+            self._notify(settings)
+        return changed
+
+    def _reload_if_changed(self):
+        self._checked_at = time.monotonic()
+        if self._file_version() == self._version:
+            return False
+        self._load()
+        return True
 
-        with open(settings_path, 'w') as f:
+    def _load(self):
+        """Read, merge and validate settings.json (called with the lock held)"""
+        self._checked_at = time.monotonic()
+        path = self.path
+        try:
+            if os.path.exists(path):
+                with open(path, 'r') as f:
+                    saved_settings = json.load(f)
+                settings = merge_with_defaults(saved_settings)
+                for problem in validate_settings(settings):
+                    print(f"Warning: {problem}")
+            else:
+                # Create the default settings file if it doesn't exist
+                settings = copy.deepcopy(DEFAULT_SETTINGS)
+                self._write(settings)
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            settings = copy.deepcopy(DEFAULT_SETTINGS)
+
+        self._settings = settings
+        self._version = self._file_version()
+
+    def _write(self, settings):
+        path = self.path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, 'w') as f:
             json.dump(settings, f, indent=2)
+        os.replace(temp_path, path)
+
+    def save(self, settings):
+        """Validate and save settings, then notify subscribers"""
+        settings = merge_with_defaults(copy.deepcopy(settings))
+        for problem in validate_settings(settings):
+            print(f"Warning: {problem}")
+        with self.lock:
+            self._write(settings)
+            self._settings = settings
+            self._version = self._file_version()
+            self._checked_at = time.monotonic()
+        self._notify(settings)
+
+    def subscribe(self, callback):
+        """Call callback(settings) after every change; returns a function that unsubscribes"""
+        with self.lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self.lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
+
+    def _notify(self, settings):
+        with self.lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(settings)
+            except Exception as e:
+                print(f"Error in settings subscriber: {e}")
+
+# Shared settings service for the process
+settings_service = SettingsService()
+
+def get_settings():
+    """Return the cached settings for reading; do not modify the result"""
+    return settings_service.get()
+
+def subscribe_settings(callback):
+    """Register callback(settings) for settings changes; returns an unsubscribe function"""
+    return settings_service.subscribe(callback)
+
+def load_settings():
+    """Load settings, using defaults for missing values
+
+    Returns a private copy that the caller may modify and pass to
+    save_settings(); read-only hot paths should use get_settings().
+    """
+    return copy.deepcopy(settings_service.get())
+
+def save_settings(settings):
+    """Save settings to file"""
+    try:
+        settings_service.save(settings)
         return True
     except Exception as e:
         print(f"Error saving settings: {e}")
@@ -91,7 +300,7 @@ def save_settings(settings):
 def get_color(priority, settings=None):
     """Get color for a priority level"""
     if settings is None:
-        settings = load_settings()
+        settings = get_settings()
 
     color_key = f'{priority.lower()}_priority'
     return settings['colors'].get(color_key, DEFAULT_SETTINGS['colors'].get(color_key, '#000000'))
@@ -112,4 +321,4 @@ def toggle_interactive_mode():
     save_settings(settings)
 
     # Return the new mode
-    return settings['cli']['interactive_mode']
\ No newline at end of file
+    return settings['cli']['interactive_mode']
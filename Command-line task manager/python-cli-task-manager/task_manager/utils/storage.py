@@ -3,28 +3,34 @@ Storage utilities for Task Manager
 """
 
 import os
-import json
 import pickle
-import shutil
-from datetime import datetime
-import platform
-
-def get_storage_directory():
-    """Get platform-specific storage directory for task manager data"""
-    system = platform.system()
-    home_dir = os.path.expanduser("~")
-
-    if system == "Windows":
-        return os.path.join(os.getenv("APPDATA"), "TaskManager")
-    elif system == "Darwin":  # macOS
-        return os.path.join(home_dir, "Library", "Application Support", "TaskManager")
-    else:  # Linux and others
-        return os.path.join(home_dir, ".taskmanager")
-
-def get_tasks_file_path():
-    """Get path to the tasks data file"""
-    storage_dir = get_storage_directory()
-    return os.path.join(storage_dir, "tasks.pickle")
+from task_manager.utils.paths import (
+    get_storage_directory, get_tasks_file_path, get_store_signature
+)
+
+def _update_sidecars(tasks):
+    """Refresh the small derived files kept next to the tasks file
+
+    These let fast paths such as 'task-cli count', shell completion and
+    the reminder service answer without loading the store. A failure here must never fail the save itself.
+    """
+    try:
+        from task_manager.utils.summary import write_summary
+        write_summary(tasks, get_store_signature())
+    except Exception as e:
+        print(f"Warning: Failed to update task summary: {e}")
+
+    try:
+        from task_manager.utils.reminders import write_reminder_index
+        write_reminder_index(tasks, get_store_signature())
+    except Exception as e:
+        print(f"Warning: Failed to update reminder index: {e}")
+
+    try:
+        from task_manager.utils.completion import update_completion_cache
+        update_completion_cache(tasks, get_store_signature())
+    except Exception as e:
+        print(f"Warning: Failed to update completion cache: {e}")
 
 def save_tasks(tasks):
     """Save tasks to pickle file"""
@@ -36,10 +42,13 @@ def save_tasks(tasks):
     with open(tasks_path, 'wb') as f:
         pickle.dump(tasks, f)
 
+    _update_sidecars(tasks)
     return True
 
 def save_with_recovery(tasks):
     """Save tasks with backup recovery"""
+    import shutil
+
     tasks_path = get_tasks_file_path()
     backup_path = tasks_path + ".bak"
 
@@ -57,6 +66,7 @@ def save_with_recovery(tasks):
     try:
         with open(tasks_path, 'wb') as f:
             pickle.dump(tasks, f)
+        _update_sidecars(tasks)
         return True
     except Exception as e:
         print(f"Error saving tasks: {e}")
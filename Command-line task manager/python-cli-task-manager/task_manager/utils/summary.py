@@ -0,0 +1,132 @@
+"""
+Task summary sidecar for Task Manager
+
+A small JSON file written next to the tasks file on every save. It holds
+counts per status and priority plus a histogram of active tasks by due
+date, so 'task-cli count' can answer prompt and status-bar queries
+without unpickling the store. Due buckets (overdue, today, week) are
+derived from the histogram when read, so they stay correct as days pass.
+"""
+
+import os
+import json
+import datetime
+from task_manager.utils.paths import get_storage_directory, get_store_signature
+
+SUMMARY_FORMAT = 1
+
+# Buckets understood by bucket_counts() and 'task-cli count --bucket'
+BUCKETS = ("total", "active", "completed", "overdue", "today", "week",
+           "no_due", "high", "medium", "low")
+
+def get_summary_file_path():
+    """Get path to the task summary sidecar file"""
+    return os.path.join(get_storage_directory(), "tasks.summary.json")
+
+def build_summary(tasks, store_version):
+    """Compute the summary for a task list in one pass"""
+    completed = 0
+    priority = {"High": 0, "Medium": 0, "Low": 0}
+    due = {}
+    no_due = 0
+
+    for task in tasks:
+        if task.completed:
+            completed += 1
+            continue
+
+        task_priority = getattr(task, 'priority', 'Medium')
+        priority[task_priority] = priority.get(task_priority, 0) + 1
+
+        due_date = getattr(task, 'due_date', None)
+        if due_date:
+            due[due_date] = due.get(due_date, 0) + 1
+        else:
+            no_due += 1
+
+    return {
+        "format": SUMMARY_FORMAT,
+        "store_version": list(store_version) if store_version else None,
+        "total": len(tasks),
+        "completed": completed,
+        "active": len(tasks) - completed,
+        # Priority counts and the due histogram cover active tasks only
+        "priority": priority,
+        "due": due,
+        "no_due": no_due,
+    }
+
+def write_summary(tasks, store_version):
+    """Write the summary sidecar atomically"""
+    summary = build_summary(tasks, store_version)
+    path = get_summary_file_path()
+    temp_path = path + ".tmp"
+
+    with open(temp_path, 'w') as f:
+        json.dump(summary, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+    return summary
+
+def read_summary():
+    """Read the summary sidecar if it matches the saved store
+
+    Returns None if the sidecar is missing, unreadable or older than the
+    tasks file (for example after a save by an older version).
+    """
+    try:
+        with open(get_summary_file_path(), 'r') as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if summary.get("format") != SUMMARY_FORMAT:
+        return None
+
+    store_version = get_store_signature()
+    if list(store_version or []) != (summary.get("store_version") or []):
+        return None
+
+    return summary
+
+def load_summary():
+    """Return a current summary, rebuilding it from the store if needed"""
+    summary = read_summary()
+    if summary is None:
+        from task_manager.utils.storage import load_tasks
+        tasks = load_tasks()
+        try:
+            summary = write_summary(tasks, get_store_signature())
+        except OSError:
+            summary = build_summary(tasks, get_store_signature())
+    return summary
+
+def bucket_counts(summary, today=None):
+    """Expand a summary into counts for every bucket in BUCKETS"""
+    today = today or datetime.date.today()
+    today_str = today.isoformat()
+    week_end_str = (today + datetime.timedelta(days=7)).isoformat()
+
+    overdue = due_today = due_week = 0
+    # Dates are stored as YYYY-MM-DD strings, which compare chronologically
+    for date_string, count in summary.get("due", {}).items():
+        if date_string < today_str:
+            overdue += count
+        elif date_string == today_str:
+            due_today += count
+        if today_str <= date_string <= week_end_str:
+            due_week += count
+
+    priority = summary.get("priority", {})
+    return {
+        "total": summary.get("total", 0),
+        "active": summary.get("active", 0),
+        "completed": summary.get("completed", 0),
+        "overdue": overdue,
+        "today": due_today,
+        "week": due_week,
+        "no_due": summary.get("no_due", 0),
+        "high": priority.get("High", 0),
+        "medium": priority.get("Medium", 0),
+        "low": priority.get("Low", 0),
+    }
@@ -0,0 +1,142 @@
+"""
+Store change notifications for Task Manager
+
+StoreWatcher blocks until the tasks file changes. On Linux it uses
+inotify through ctypes, watching the storage directory so that the file
+being created, rewritten or replaced is all noticed without polling.
+Elsewhere, or if inotify is unavailable, it falls back to polling the
+store signature (mtime and size).
+"""
+
+import os
+import sys
+import time
+import select
+import struct
+from task_manager.utils.paths import get_storage_directory, get_tasks_file_path, get_store_signature
+
+# Seconds between signature checks when polling
+POLL_INTERVAL = 1.0
+
+# Seconds to wait after an event for related writes to finish
+SETTLE_DELAY = 0.05
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+def _load_inotify():
+    """Return libc with the inotify functions, or None if they are unavailable"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+class StoreWatcher:
+    """Wait for changes to the saved task store"""
+
+    def __init__(self, poll_interval=POLL_INTERVAL, use_inotify=True):
+        self.poll_interval = poll_interval
+        self.path = get_tasks_file_path()
+        self.filename = os.fsencode(os.path.basename(self.path))
+        self.signature = get_store_signature()
+        self.fd = None
+
+        if use_inotify:
+            self._start_inotify()
+
+    @property
+    def mode(self):
+        return "inotify" if self.fd is not None else "poll"
+
+    def _start_inotify(self):
+        libc = _load_inotify()
+        if libc is None:
+            return
+
+        directory = get_storage_directory()
+        os.makedirs(directory, exist_ok=True)
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            os.close(fd)
+            return
+        self.fd = fd
+
+    def _drain_events(self):
+        """Read pending inotify events, returning True if any concern the tasks file"""
+        relevant = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return relevant
+            if not data:
+                return relevant
+
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, _, _, name_length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_length].rstrip(b"\0")
+                offset += name_length
+                if name == self.filename:
+                    relevant = True
+
+    def _changed(self):
+        """Check the signature so events that leave the store as it was are ignored"""
+        signature = get_store_signature()
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        return True
+
+    def wait(self, timeout=None):
+        """Block until the store changes; returns False if the timeout expires first"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+
+            if self.fd is not None:
+                readable, _, _ = select.select([self.fd], [], [], remaining)
+                if readable and self._drain_events():
+                    # Let the writer finish any follow-up writes before reading
+                    time.sleep(SETTLE_DELAY)
+                    self._drain_events()
+                    if self._changed():
+                        return True
+            else:
+                time.sleep(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+                if self._changed():
+                    return True
+
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()